@@ -0,0 +1,142 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import numpy as np
+import highspy as hp
+
+from helperFunctions import read_data
+from modelisations import build_model_1, build_model_2, build_model_3
+from wagnerWhitin import wagner_whitin, plan_from_successors
+from instanceGenerator import generate_instance
+
+# ======= BENCHMARK =======
+# Times every phase (parse, build, LP relaxation, MIP, extraction) of each
+# formulation over a range of horizons, repeats the measures and stores their
+# median and 95th percentile in a JSON file. Two such files can be compared to
+# catch regressions (e.g. in the quadratic build of Model 2).
+
+BUILDERS = {'1': build_model_1, '2': build_model_2, '3': build_model_3}
+
+# largest horizon run by default for each formulation (Model 2/3 have O(n^2) columns)
+MAX_PERIODS = {'1': 5000, '2': 1000, '3': 2000, 'dp': None}
+
+
+def _time(function):
+    start_time = time.perf_counter()
+    value = function()
+    return time.perf_counter() - start_time, value
+
+
+def run_once(formulation, datafileName, vectorized, options):
+    """Times one run of every phase; returns {phase: seconds}."""
+    timings = {}
+    timings['parse'], data = _time(lambda: read_data(datafileName))
+    nbPeriodes, demandes = data[0], data[1]
+
+    if formulation == 'dp':
+        timings['mip'], (_, succ) = _time(lambda: wagner_whitin(*data))
+        timings['extract'], _ = _time(lambda: plan_from_successors(nbPeriodes, demandes, succ))
+        return timings
+
+    build = BUILDERS[formulation]
+
+    # LP relaxation on its own model, so that the MIP below starts cold
+    model = build(*data, type_vars=hp.HighsVarType.kContinuous, vectorized=vectorized, options=options)
+    timings['lp'], _ = _time(model.run)
+
+    timings['build'], model = _time(lambda: build(*data, vectorized=vectorized, options=options))
+    timings['mip'], _ = _time(model.run)
+    timings['extract'], _ = _time(lambda: np.array(model.getSolution().col_value))
+    return timings
+
+
+def run_benchmark(sizes, formulations, repeats=3, vectorized=True, time_limit=60, seed=0):
+    """Runs the benchmark and returns its records (one per formulation, size and phase)."""
+    options = {'output_flag': False, 'time_limit': time_limit}
+    records = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for n in sizes:
+            datafileName = os.path.join(tmpdir, f"Instance{n}.txt")
+            generate_instance(datafileName, n, seed=seed)
+
+            for formulation in formulations:
+                limit = MAX_PERIODS.get(formulation)
+                if limit is not None and n > limit:
+                    print(f"Modèle {formulation}, n = {n} : ignoré (au-delà de {limit} périodes)")
+                    continue
+
+                runs = [run_once(formulation, datafileName, vectorized, options) for _ in range(repeats)]
+                for phase in runs[0]:
+                    values = [run[phase] for run in runs]
+                    records.append({
+                        'formulation': formulation,
+                        'n': n,
+                        'phase': phase,
+                        'median': float(np.median(values)),
+                        'p95': float(np.percentile(values, 95)),
+                        'runs': values
+                    })
+                    print(f"Modèle {formulation}, n = {n}, {phase:<8}: "
+                          f"médiane {records[-1]['median']:.4f} s, p95 {records[-1]['p95']:.4f} s")
+    return records
+
+
+def compare(records, baseline_records, threshold=1.25, min_seconds=1e-3):
+    """Returns the (formulation, n, phase, old, new) whose median grew by more than threshold."""
+    baseline = {(r['formulation'], r['n'], r['phase']): r['median'] for r in baseline_records}
+    regressions = []
+    for r in records:
+        old = baseline.get((r['formulation'], r['n'], r['phase']))
+        if old is None or max(old, r['median']) < min_seconds:
+            continue
+        if r['median'] > threshold * old:
+            regressions.append((r['formulation'], r['n'], r['phase'], old, r['median']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark des formulations ULS")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[20, 60, 120, 250, 500, 1000, 2000, 5000])
+    parser.add_argument('--formulations', nargs='+', default=['1', '2', '3', 'dp'])
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--expressions', action='store_true',
+                        help="construire les modèles avec les expressions highspy (par défaut : tableaux NumPy)")
+    parser.add_argument('--time-limit', type=float, default=60)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='./benchmark_results.json')
+    parser.add_argument('--compare', help="fichier de résultats de référence")
+    parser.add_argument('--threshold', type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    records = run_benchmark(args.sizes, args.formulations, args.repeats,
+                            not args.expressions, args.time_limit, args.seed)
+    with open(args.output, "w") as file:
+        json.dump({
+            'meta': {
+                'date': time.strftime("%Y-%m-%d %H:%M:%S"),
+                'python': platform.python_version(),
+                'highs': f"{hp.Highs().version()}",
+                'vectorized': not args.expressions,
+                'repeats': args.repeats,
+                'seed': args.seed
+            },
+            'results': records
+        }, file, indent=1)
+    print(f"\nRésultats du benchmark enregistrés dans : {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r") as file:
+            regressions = compare(records, json.load(file)['results'], args.threshold)
+        for formulation, n, phase, old, new in regressions:
+            print(f"RÉGRESSION modèle {formulation}, n = {n}, {phase} : {old:.4f} s -> {new:.4f} s")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
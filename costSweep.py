@@ -0,0 +1,144 @@
+import os
+import time
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import highspy as hp
+
+from incrementalPlanner import IncrementalPlanner
+
+# ======= PARAMETRIC COST SWEEP =======
+# Solves one instance over a grid of (cstock, cfixes scale, couts scale) values.
+# The grid is walked in snake order, so that two consecutive points differ in a single
+# parameter, and cut into one contiguous chunk per worker. A worker keeps a single
+# IncrementalPlanner (Model 2): from one point to the next only the objective
+# coefficients are changed and the relaxation is re-solved from the previous basis.
+# A breakpoint is a pair of neighbouring grid points (one parameter one step apart)
+# whose optimal setup schedules differ; points not solved to optimality (e.g. time limit
+# reached, marked in the table) are left out of the comparison.
+
+PARAMETERS = ('cstock', 'cfixes_scale', 'couts_scale')
+
+
+def _snake(cstock_values, cfixes_scales, couts_scales):
+    """Grid points (cstock, cfixes scale, couts scale), consecutive ones differing in one value."""
+    points = []
+    line = 0
+    for a, couts_scale in enumerate(couts_scales):
+        for cfixes_scale in (cfixes_scales if a % 2 == 0 else cfixes_scales[::-1]):
+            for cstock in (cstock_values if line % 2 == 0 else cstock_values[::-1]):
+                points.append((cstock, cfixes_scale, couts_scale))
+            line += 1
+    return points
+
+
+def _sweep_chunk(task):
+    """Entry point of the worker processes: solves consecutive grid points on one persistent model."""
+    instance, points, options = task
+    nbPeriodes, demandes, couts, cfixes, _ = instance
+    couts = np.asarray(couts, dtype=np.float64)
+    cfixes = np.asarray(cfixes, dtype=np.float64)
+    periods = range(nbPeriodes)
+
+    planner = None
+    previous = None
+    rows = []
+    with contextlib.redirect_stdout(None):
+        for point in points:
+            cstock, cfixes_scale, couts_scale = point
+            start_time = time.time()
+            if planner is None:
+                planner = IncrementalPlanner(nbPeriodes, demandes, couts * couts_scale,
+                                             cfixes * cfixes_scale, cstock, options=options)
+            else:
+                # only the parameter that moved is pushed into the model
+                planner.update_costs(
+                    couts=dict(zip(periods, couts * couts_scale)) if couts_scale != previous[2] else None,
+                    cfixes=dict(zip(periods, cfixes * cfixes_scale)) if cfixes_scale != previous[1] else None,
+                    cstock=cstock if cstock != previous[0] else None)
+            model_status = planner.solve()
+            rows.append({
+                'cstock': cstock,
+                'cfixes_scale': cfixes_scale,
+                'couts_scale': couts_scale,
+                'status': planner.model.modelStatusToString(model_status),
+                'optimal': model_status == hp.HighsModelStatus.kOptimal,
+                'time_limit': model_status == hp.HighsModelStatus.kTimeLimit,
+                'cost': planner.model.getObjectiveValue(),
+                'nb_setups': len(planner.setups()),
+                'setups': planner.setups().tolist(),
+                'warm': previous is not None,
+                'runtime': time.time() - start_time
+            })
+            previous = point
+    return rows
+
+
+def _breakpoints(rows, cstock_values, cfixes_scales, couts_scales):
+    """Neighbouring optimal grid points (one parameter one step apart) with different setup schedules."""
+    by_point = {(r['cstock'], r['cfixes_scale'], r['couts_scale']): r for r in rows}
+    axes = (list(cstock_values), list(cfixes_scales), list(couts_scales))
+    breakpoints = []
+    for point, row in by_point.items():
+        if not row['optimal']:
+            continue
+        for axis, values in enumerate(axes):
+            k = values.index(point[axis])
+            if k + 1 == len(values):
+                continue
+            neighbour = by_point[point[:axis] + (values[k + 1],) + point[axis + 1:]]
+            if neighbour['optimal'] and neighbour['setups'] != row['setups']:
+                before, after = set(row['setups']), set(neighbour['setups'])
+                breakpoints.append({
+                    'parameter': PARAMETERS[axis],
+                    'from': point,
+                    'to': point[:axis] + (values[k + 1],) + point[axis + 1:],
+                    'added': sorted(after - before),
+                    'removed': sorted(before - after)
+                })
+    breakpoints.sort(key=lambda b: (b['parameter'], b['from']))
+    return breakpoints
+
+
+def sweep_costs(nbPeriodes, demandes, couts, cfixes, cstock_values, cfixes_scales=(1.0,),
+                couts_scales=(1.0,), n_workers=1, options=None):
+    """
+    Optimal plans over the grid cstock_values x cfixes_scales x couts_scales (the costs
+    of the instance multiplied by the scales), with Model 2 (see IncrementalPlanner).
+    Returns a dict with the table (one row per grid point: cost, number and periods of the
+    setups, status, time; 'optimal' and 'time_limit' flag the points whose plan is proven
+    optimal or cut by the time limit), the breakpoints between optimal points and the wall time.
+    """
+    cstock_values, cfixes_scales, couts_scales = list(cstock_values), list(cfixes_scales), list(couts_scales)
+    instance = (nbPeriodes, list(demandes), list(couts), list(cfixes), None)
+    points = _snake(cstock_values, cfixes_scales, couts_scales)
+    n_workers = max(1, min(n_workers, len(points)))
+    threads = max(1, (os.cpu_count() or 1) // n_workers)
+    options = dict(options or {}, output_flag=False, threads=threads)
+    tasks = [(instance, [points[k] for k in chunk], options)
+             for chunk in np.array_split(np.arange(len(points)), n_workers)]
+
+    start_time = time.time()
+    if n_workers == 1:
+        rows = _sweep_chunk(tasks[0])
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            rows = [row for chunk in executor.map(_sweep_chunk, tasks) for row in chunk]
+    wall_time = time.time() - start_time
+
+    rows.sort(key=lambda r: (r['couts_scale'], r['cfixes_scale'], r['cstock']))
+    breakpoints = _breakpoints(rows, cstock_values, cfixes_scales, couts_scales)
+
+    print("\n----------------------------------")
+    print(f"| {'cstock':<8} | {'x cfixes':<8} | {'x couts':<8} | {'Coût':<12} | {'Setups':<6} | {'Temps (s)':<9} |")
+    print("\n".join(f"| {r['cstock']:<8} | {r['cfixes_scale']:<8} | {r['couts_scale']:<8} | {r['cost']:<12.1f} | "
+                    f"{r['nb_setups']:<6} | {r['runtime']:<9.4f} |" 
+                    + ("" if r['optimal'] else " (limite de temps)" if r['time_limit'] else f" ({r['status']})") 
+                    for r in rows))
+    print(f"\n{len(breakpoints)} points de rupture du plan de setups :")
+    for b in breakpoints:
+        print(f"  {b['parameter']} {b['from']} -> {b['to']} : + {b['added']} / - {b['removed']}")
+    print("Temps total (en secondes) = ", wall_time)
+    print("----------------------------------")
+
+    return {'table': rows, 'breakpoints': breakpoints, 'wall_time': wall_time}
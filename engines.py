@@ -0,0 +1,15 @@
+from functools import partial
+
+from modelisations import solve_model_1, solve_model_2, solve_model_3, solve_dp
+
+# ======= SOLVE ENGINES =======
+# Named solve functions shared by the solve service and the portfolio race:
+# name -> (column layout of the solution (see Solution.from_columns), solve_model).
+
+ENGINES = {
+    '1': (1, solve_model_1),
+    '2': (2, partial(solve_model_2, vectorized=True)),
+    '2-lean': (2, partial(solve_model_2, lean=True)),
+    '3': (3, partial(solve_model_3, vectorized=True)),
+    'dp': (1, solve_dp),
+}
@@ -1,37 +1,26 @@
 import os
 import csv
 import time
+import functools
+from concurrent.futures import ProcessPoolExecutor
 import highspy as hp
 
+from instanceStore import parse_instances
+from telemetry import SolverTelemetry
+from solution import Solution
+from timeBudget import solve_with_budget
+from resultsJournal import ResultsJournal
+from dualAscent import lp_bound_model_2
+from modelisations import solve_model_2
+
 # ======= READ DATA FILE =======
 def read_data(datafileName):
-    """Reads data from a single instance file."""
+    """Reads data from a single instance file (the first one if the file holds several)."""
     with open(datafileName, "r") as file:
-        line = file.readline()  
-        lineTab = line.split()    
-        nbPeriodes = int(lineTab[0])
-        
-        line = file.readline()  
-        lineTab = line.split()
-        demandes = []
-        for i in range(nbPeriodes):
-            demandes.append(int(lineTab[i]))
-            
-        line = file.readline()  
-        lineTab = line.split()
-        couts = []
-        for i in range(nbPeriodes):
-            couts.append(int(lineTab[i]))
-
-        line = file.readline()  
-        lineTab = line.split()
-        cfixes = []
-        for i in range(nbPeriodes):
-            cfixes.append(int(lineTab[i]))
-        
-        line = file.readline()  
-        lineTab = line.split()    
-        cstock = int(lineTab[0])
+        instances = parse_instances(file.read())
+    if not instances:
+        raise ValueError(f"Aucune instance dans le fichier {datafileName}")
+    nbPeriodes, demandes, couts, cfixes, cstock = instances[0]
     # ------ DONNÉES ------
     # print(f"Nombre de périodes (n) : {nbPeriodes}") 
     # print(f"Demande à satisfaire (d_i) : {demandes}")
@@ -39,120 +28,377 @@ def read_data(datafileName):
     # print(f"Coûts fixes (f_i) : {cfixes}")
     # print(f"Coût de stockage (h) : {cstock}")        
     
-    return nbPeriodes, demandes, couts, cfixes, cstock
+    return nbPeriodes, demandes.tolist(), couts.tolist(), cfixes.tolist(), cstock
 
 # ====== PRINT SOLUTION =======
+def _print_plan(model, formulation, nbPeriodes, model_status, demandes=None):
+    """Prints the per-period plan of a solved model (see Solution.plan_view) in one write."""
+    if model_status == hp.HighsModelStatus.kOptimal:
+        solution = Solution.from_model(model, formulation, nbPeriodes, demandes)
+        print("\n \t Solution trouvée:")
+        print(solution.plan_view())
+    elif model_status == hp.HighsModelStatus.kTimeLimit:
+        print("\n \t Limite de temps atteinte : solution non affichée.")
+    else:
+        print("\n \t Aucune solution réalisable trouvée.")
+
+
 def printSolution_model1(model, nbPeriodes, model_status, demandes=None):
     """
     Print the solution 
     """
-    if model_status == hp.HighsModelStatus.kOptimal:
-        solution = model.getSolution()
-        all_col_values = solution.col_value
+    _print_plan(model, 1, nbPeriodes, model_status, demandes)
 
-        # y variables are the first nbPeriodes
-        y_values = all_col_values[0 : nbPeriodes]
 
-        # x variables are the next nbPeriodes (from index nbPeriodes to 2*nbPeriodes - 1)
-        x_values = all_col_values[nbPeriodes : 2 * nbPeriodes]
+def printSolution_model2(model, nbPeriodes, model_status, demandes=None):
+    """
+    Print the solution 
+    Reads both layouts of Model 2 (full n x n or lean); production and stock need the demands.
+    """
+    _print_plan(model, 2, nbPeriodes, model_status, demandes)
 
-        # s variables are the last nbPeriodes (from index 2*nbPeriodes to 3*nbPeriodes - 1)
-        s_values = all_col_values[2 * nbPeriodes : 3 * nbPeriodes]
 
-        print("\n \t Solution trouvée:")
-        print(f"| {'Mois':<5} | {'y_i (Setup)':<12} | {'x_i (Prod.)':<12} | {'s_i (Stock)':<12} |")
-        print("-" * 51)
+def printSolution_model3(model, nbPeriodes, model_status, demandes=None):
+    """
+    Print the solution 
+    """
+    _print_plan(model, 3, nbPeriodes, model_status, demandes)
 
-        for i in range(nbPeriodes):
-            print(f"| {i+1:<5} | {y_values[i]:<12.0f} | {x_values[i]:<12.2f} | {s_values[i]:<12.2f} |")
-    elif model_status == hp.HighsModelStatus.kTimeLimit:
-        print("\n \t Limite de temps atteinte : solution non affichée.")
-    else:
-        print("\n \t Aucune solution réalisable trouvée.")
+# ======= SOLVE ONE INSTANCE =======
+def _cached_solve(datafileName, solve_model, var_type, options, cache, refresh_cache, solve):
+    """Returns the cached record of a solve if any, otherwise runs solve() and stores its record."""
+    if cache is None:
+        return solve()
 
+    key = cache.make_key(datafileName, solve_model, var_type, options)
+    if not refresh_cache:
+        record = cache.get(key)
+        if record is not None:
+            print(f"Résultat lu dans le cache ({var_type}) : {datafileName}")
+            return record
 
-def printSolution_model2(model, nbPeriodes, model_status, demandes=None):
+    record = solve()
+    cache.put(key, record)
+    return record
+
+
+def _open_trace(trace_dir, datafileName, var_type, sample_interval=1.0):
+    """SolverTelemetry of one solve, written to trace_dir/<instance>.<var_type>.jsonl (None without trace_dir)."""
+    if trace_dir is None:
+        return None
+    name = os.path.basename(datafileName).replace('.txt', '')
+    return SolverTelemetry(os.path.join(trace_dir, f"{name}.{var_type}.jsonl"), 
+                           instance=os.path.basename(datafileName), sample_interval=sample_interval)
+
+
+def _traced_solve(datafileName, solve_model, telemetry, **kwargs):
     """
-    Print the solution 
+    Reads and solves one instance; returns (model, model_status, runtime, col_value).
+    With a telemetry, the parse / build / solve / extract timings go to its trace.
     """
-    if model_status == hp.HighsModelStatus.kOptimal:
-        solution = model.getSolution()
-        all_col_values = solution.col_value
-        
-        # y variables are the first nbPeriodes
-        y_values = all_col_values[0 : nbPeriodes]
-        
-        # x variables are the next nbPeriodes * nbPeriodes
-        x_values = all_col_values[nbPeriodes : nbPeriodes + nbPeriodes * nbPeriodes]
-        
-        print("\n \t Solution trouvée:")
-        print(f"| {'Mois':<5} | {'y_i (Setup)':<12} | ", end="")
-        for j in range(nbPeriodes):
-            print(f"j={j+1}".ljust(2), end=" | ")
-        print()
-        print("-" * (17 + (nbPeriodes * 7)))
-        
-        for i in range(nbPeriodes):
-            print(f"| {i+1:<5} | {y_values[i]:<12.0f} | ", end="")
-            for j in range(nbPeriodes):
-                x_ij_value = x_values[i * nbPeriodes + j]
-                print(f"{abs(x_ij_value)}", end=" | ")
-            print()
-    elif model_status == hp.HighsModelStatus.kTimeLimit:
-        print("\n \t Limite de temps atteinte : solution non affichée.")
+    start_time = time.time()
+    nbPeriodes, demandes, couts, cfixes, cstock = read_data(datafileName)
+    parse_time = time.time() - start_time
+
+    if telemetry is not None:
+        kwargs['telemetry'] = telemetry
+    start_time = time.time()
+    model, model_status = solve_model(nbPeriodes, demandes, couts, cfixes, cstock, **kwargs)
+    end_time = time.time()
+    runtime = end_time - start_time
+
+    start_time = time.time()
+    col_value = list(model.getSolution().col_value)
+    extract_time = time.time() - start_time
+
+    if telemetry is not None:
+        telemetry.phase('parse', parse_time)
+        telemetry.phase('build', getattr(model, 'build_time', 0.0))
+        telemetry.phase('solve', getattr(model, 'solve_time', runtime))
+        telemetry.phase('extract', extract_time)
+        info = model.getInfo()
+        telemetry.close(status=model.modelStatusToString(model_status),
+                        obj_val=model.getObjectiveValue(),
+                        dual_bound=info.mip_dual_bound,
+                        gap=info.mip_gap,
+                        nodes=info.mip_node_count,
+                        runtime=runtime)
+    return model, model_status, runtime, col_value
+
+
+def _solve_pass(datafileName, solve_model, relaxation=False, options=None, 
+                cache=None, refresh_cache=False, trace_dir=None, sample_interval=1.0):
+    """Solves one instance once (PLNE, or RL if relaxation) and returns the raw metrics."""
+    type_vars = hp.HighsVarType.kContinuous if relaxation else hp.HighsVarType.kInteger
+
+    def solve():
+        telemetry = _open_trace(trace_dir, datafileName, type_vars.name, sample_interval)
+        model, model_status, runtime, col_value = _traced_solve(
+            datafileName, solve_model, telemetry, type_vars=type_vars, options=options)
+
+        info = model.getInfo()
+        record = {
+            'status': model.modelStatusToString(model_status),
+            'obj_val': model.getObjectiveValue(),
+            # 'best_dual_bound': info.mip_dual_bound,
+            'node_count': info.mip_node_count,
+            'runtime': runtime,
+            'col_value': col_value
+        }
+        if relaxation and hasattr(model, 'ls_stats'):
+            # the LP was solved with its root cuts: RL is the relaxation before them
+            record['rl_cut_obj_val'] = record['obj_val']
+            record['obj_val'] = model.ls_stats['bound_before']
+        _add_heuristic_metrics(record, model)
+        return record
+
+    return _cached_solve(datafileName, solve_model, type_vars.name, options, 
+                         cache, refresh_cache, solve)
+
+
+def _check_fast_rl(solve_model):
+    """fast_rl gives the relaxation of Model 2: refuse it for the other formulations."""
+    func = solve_model
+    while isinstance(func, functools.partial):
+        func = func.func
+    if func is not solve_model_2:
+        raise ValueError("fast_rl donne la relaxation du Modèle 2 : "
+                         f"il n'est possible qu'avec solve_model_2, pas {getattr(func, '__name__', func)}")
+
+
+def _fast_rl_pass(datafileName):
+    """RL of Model 2 by dual ascent (see dualAscent.py), without building any LP."""
+    nbPeriodes, demandes, couts, cfixes, cstock = read_data(datafileName)
+    bound, _, _ = lp_bound_model_2(nbPeriodes, demandes, couts, cfixes, cstock)
+    return {'obj_val': bound}
+
+
+def _add_heuristic_metrics(record, model):
+    """Copies the cost and time of the heuristic MIP start (warm_start=True), if any."""
+    if hasattr(model, 'heuristic'):
+        record['heur_cost'] = model.heuristic['cost']
+        record['heur_time'] = model.heuristic['runtime']
+
+
+def _merge_passes(datafileName, mip, rl):
+    """Combines the PLNE and RL passes of an instance into one row of the report."""
+    obj_val = mip['obj_val']
+    rl_obj_val = rl['obj_val']
+    gap = ((obj_val - rl_obj_val) / obj_val) * 100
+
+    result = {
+        'filename': os.path.basename(datafileName),
+        'status': mip['status'],
+        'obj_val': obj_val,
+        'rl_obj_val': rl_obj_val,
+        # 'best_dual_bound': mip['best_dual_bound'],
+        'gap': gap,
+        'node_count': mip['node_count'],
+        'runtime': mip['runtime']
+    }
+    if 'rl_cut_obj_val' in rl:
+        result['rl_cut_obj_val'] = rl['rl_cut_obj_val']
+    for key in ('heur_cost', 'heur_time'):
+        if key in mip:
+            result[key] = mip[key]
+    return result
+
+
+def _solve_both(datafileName, solve_model, options=None, cache=None, refresh_cache=False, 
+                trace_dir=None, sample_interval=1.0):
+    """Solves RL and PLNE of one instance on a single model (with_relaxation=True)."""
+    def solve():
+        telemetry = _open_trace(trace_dir, datafileName, 'kInteger+kContinuous', sample_interval)
+        model, model_status, runtime, col_value = _traced_solve(
+            datafileName, solve_model, telemetry, options=options, with_relaxation=True)
+
+        info = model.getInfo()
+        record = {
+            'status': model.modelStatusToString(model_status),
+            'obj_val': model.getObjectiveValue(),
+            'rl_obj_val': model.rl_obj_val,
+            'node_count': info.mip_node_count,
+            'runtime': runtime,
+            'col_value': col_value
+        }
+        if hasattr(model, 'rl_cut_obj_val'):
+            record['rl_cut_obj_val'] = model.rl_cut_obj_val
+        _add_heuristic_metrics(record, model)
+        return record
+
+    mip = _cached_solve(datafileName, solve_model, 'kInteger+kContinuous', options, 
+                        cache, refresh_cache, solve)
+    rl = {'obj_val': mip['rl_obj_val']}
+    if 'rl_cut_obj_val' in mip:
+        rl['rl_cut_obj_val'] = mip['rl_cut_obj_val']
+    return _merge_passes(datafileName, mip, rl)
+
+
+def solve_instance(datafileName, solve_model, options=None, reuse_model=False, 
+                   cache=None, refresh_cache=False, trace_dir=None, fast_rl=False, 
+                   sample_interval=1.0):
+    """
+    Solves one instance (PLNE then RL) and returns the metrics of the report as a dict.
+    reuse_model: build the model once and solve RL then PLNE on it; the runtime then
+    covers both solves.
+    cache: optional ResultCache; on a hit the stored result (and runtime) is reused.
+    refresh_cache: ignore the cached results, solve again and overwrite them.
+    trace_dir: write a JSONL telemetry trace per solve in this directory (see telemetry.py),
+    with a sample of the MIP search every sample_interval seconds (None: incumbents only).
+    fast_rl: take RL from the dual ascent bound of Model 2 (dualAscent.py) instead of an
+    LP solve; only with solve_model_2 (ValueError otherwise). Overrides reuse_model.
+    """
+    if fast_rl:
+        _check_fast_rl(solve_model)
+    print(f"\nPROCESSING FILE {datafileName}")
+
+    if reuse_model and not fast_rl:
+        return _solve_both(datafileName, solve_model, options, cache, refresh_cache, trace_dir, 
+                           sample_interval)
+
+    # --- SOLVE (PLNE) ---
+    mip = _solve_pass(datafileName, solve_model, False, options, cache, refresh_cache, trace_dir, 
+                      sample_interval)
+
+    # --- SOLVE (RL) ---
+    if fast_rl:
+        rl = _fast_rl_pass(datafileName)
     else:
-        print("\n \t Aucune solution réalisable trouvée.")       
+        rl = _solve_pass(datafileName, solve_model, True, options, cache, refresh_cache, trace_dir, 
+                         sample_interval)
+
+    return _merge_passes(datafileName, mip, rl)
+
+
+def _solve_pass_task(task):
+    """Entry point of the worker processes (arguments packed for executor.map)."""
+    return _solve_pass(*task)
+
+
+def _solve_instance_task(task):
+    """Entry point of the worker processes when a task covers a whole instance."""
+    return solve_instance(*task)
 
 # ======= LOOP TO PROCESS ALL FILES =======
-def process_all_files_in_directory(directory_path, solve_model, tex_output_path, caption_text, label_tab):
-    """Processes all instance files in the specified directory and writes a LaTeX table report."""
-    results = []
-    
-    # Boucle sur les fichiers d'instances
-    for filename in sorted(os.listdir(directory_path)):
-        if filename.endswith(".txt"):
-            datafileName = os.path.join(directory_path, filename)
-            print(f"\nPROCESSING FILE {datafileName}")
-            nbPeriodes, demandes, couts, cfixes, cstock = read_data(datafileName)
-
-            # --- SOLVE (PLNE) ---
-            start_time = time.time()
-            model, model_status = solve_model(nbPeriodes, demandes, couts, cfixes, cstock)
-            end_time = time.time()
-            runtime = end_time - start_time
-
-            info = model.getInfo()
-            obj_val = model.getObjectiveValue()
-            # best_dual_bound = info.mip_dual_bound
-            # gap = info.mip_gap
-            node_count = info.mip_node_count
-            status_str = model.modelStatusToString(model_status)
-
-            # --- SOLVE (RL) ---
-            model_rl, model_status_rl = solve_model(nbPeriodes, demandes, couts, cfixes, cstock, 
-                                                     type_vars=hp.HighsVarType.kContinuous)
-            rl_obj_val = model_rl.getObjectiveValue()
-
-            gap = ((obj_val - rl_obj_val) / obj_val) * 100
-
-            results.append({
-                'filename': filename,
-                'status': status_str,
-                'obj_val': obj_val,
-                'rl_obj_val': rl_obj_val,
-                # 'best_dual_bound': best_dual_bound,
-                'gap': gap,
-                'node_count': node_count,
-                'runtime': runtime
-            })
+def process_all_files_in_directory(directory_path, solve_model, tex_output_path, caption_text, label_tab, 
+                                   n_workers=1, reuse_model=False, cache=None, refresh_cache=False, 
+                                   trace_dir=None, time_budget=None, journal=None, resume=False, 
+                                   csv_output_path=None, fast_rl=False, sample_interval=1.0):
+    """
+    Processes all instance files in the specified directory and writes a LaTeX table report.
+    n_workers > 1 spreads the instances over a process pool; the HiGHS threads are then
+    split between the workers so that the cores are not oversubscribed.
+    reuse_model: solve RL and PLNE on a single model per instance instead of building it twice.
+    cache / refresh_cache: skip the solves already stored in a ResultCache (see solve_instance).
+    trace_dir: directory of the JSONL telemetry traces (incumbent / bound timeline, phase timings);
+    sample_interval: seconds between two samples of the timeline (None: incumbents only).
+    time_budget: total wall-clock budget (s) of the sweep, shared by a quick first pass and
+    then by the largest gaps (see timeBudget.py); replaces the per-instance time limit and
+    runs serially, RL and PLNE on a single model. Instances left without time are skipped
+    (not in the tables). ValueError with n_workers > 1, cache, trace_dir or fast_rl.
+    journal: path of a ResultsJournal where each row is appended as soon as its instance is
+    solved (at the end of the sweep with time_budget); resume: skip the instances already
+    journaled for this solve_model.
+    csv_output_path: also write the report as CSV.
+    fast_rl: RL column from the dual ascent bound of Model 2 (milliseconds per instance)
+    instead of a second HiGHS solve (see solve_instance); only with solve_model_2.
+    """
+    if time_budget is not None:
+        unsupported = [name for name, value in (('n_workers', n_workers > 1), ('cache', cache is not None),
+                                                ('trace_dir', trace_dir is not None), ('fast_rl', fast_rl))
+                       if value]
+        if unsupported:
+            raise ValueError(f"time_budget n'est pas compatible avec : {', '.join(unsupported)}")
+    if fast_rl:
+        _check_fast_rl(solve_model)
+    datafileNames = [os.path.join(directory_path, filename) 
+                     for filename in sorted(os.listdir(directory_path)) 
+                     if filename.endswith(".txt")]
+
+    journal = ResultsJournal(journal) if isinstance(journal, str) else journal
+    journaled = journal.load(solve_model) if journal is not None and resume else {}
+    todo = [datafileName for datafileName in datafileNames 
+            if os.path.basename(datafileName) not in journaled]
+    if journaled:
+        print(f"\nReprise : {len(datafileNames) - len(todo)} instances déjà dans le journal")
+
+    def solved(results):
+        # journal every row as soon as it is available
+        for result in results:
+            if journal is not None:
+                journal.append(result, solve_model)
+            yield result
+
+    if time_budget is not None:
+        instances = [(datafileName, read_data(datafileName)) for datafileName in todo]
+        results, _ = solve_with_budget(instances, solve_model, time_budget)
+        results = list(solved(results))
+    elif n_workers <= 1:
+        # Boucle sur les fichiers d'instances
+        results = list(solved(solve_instance(datafileName, solve_model, None, reuse_model, cache, refresh_cache, 
+                                             trace_dir, fast_rl, sample_interval) 
+                              for datafileName in todo))
+    else:
+        threads = max(1, (os.cpu_count() or 1) // n_workers)
+        options = {'threads': threads}
+        if reuse_model and not fast_rl:
+            tasks = [(datafileName, solve_model, options, True, cache, refresh_cache, trace_dir, 
+                      False, sample_interval) 
+                     for datafileName in todo]
+            # executor.map keeps the results in the order of the tasks
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                results = list(solved(executor.map(_solve_instance_task, tasks)))
+        else:
+            # PLNE and RL of every instance are independent tasks of the pool
+            # (with fast_rl, only PLNE; the bounds are computed here)
+            relaxations = (False,) if fast_rl else (False, True)
+            tasks = [(datafileName, solve_model, relaxation, options, cache, refresh_cache, trace_dir, 
+                      sample_interval) 
+                     for datafileName in todo for relaxation in relaxations]
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                passes = executor.map(_solve_pass_task, tasks)
+                results = list(solved(_merge_passes(datafileName, next(passes), 
+                                                    _fast_rl_pass(datafileName) if fast_rl else next(passes)) 
+                                      for datafileName in todo))
+
+    # rows in file order, journaled ones included
+    solved_rows = {result['filename']: result for result in results}
+    results = [journaled.get(name) or solved_rows[name] 
+               for name in map(os.path.basename, datafileNames) 
+               if name in journaled or name in solved_rows]
+
+    write_latex_table(results, tex_output_path, caption_text, label_tab)
+    if csv_output_path is not None:
+        write_csv_table(results, csv_output_path)
+
+
+def regenerate_reports(journal_path, tex_output_path, caption_text, label_tab, 
+                       solve_model=None, csv_output_path=None):
+    """Writes the LaTeX (and CSV) reports of a journaled sweep without solving anything."""
+    rows = ResultsJournal(journal_path).load(solve_model)
+    results = [rows[name] for name in sorted(rows)]
+    write_latex_table(results, tex_output_path, caption_text, label_tab)
+    if csv_output_path is not None:
+        write_csv_table(results, csv_output_path)
+
+
+# ======= LATEX REPORT =======
+def write_latex_table(results, tex_output_path, caption_text, label_tab):
+    """
+    Writes the results of process_all_files_in_directory as a LaTeX table.
+    The heuristic cost and time columns are added when the solves used warm_start.
+    """
+    with_heur = any('heur_cost' in r for r in results)
+    heur_format = " S[table-format=6.2] S[table-format=1.4]" if with_heur else ""
+    heur_header = " & {Heur.} & {Temps heur. (s)}" if with_heur else ""
 
     # Write results to LaTeX file
     with open(tex_output_path, mode="w") as texfile:
         texfile.write("\\begin{table}[H] \n")
         texfile.write("\\centering \n")
-        texfile.write("\\begin{tabular}{l S[table-format=6.2] c S[table-format=6.2] S[table-format=1.2] r S[table-format=1.3]}\n")
+        texfile.write(f"\\begin{{tabular}}{{l S[table-format=6.2] c S[table-format=6.2] S[table-format=1.2] r S[table-format=1.3]{heur_format}}}\n")
         texfile.write("\\toprule \n")
-        texfile.write("{Instance} & {RL} & {Status} & {Best Sol} & {Gap \\%} & {Noeuds} & {Temps (s)} \\\ \n")
+        texfile.write(f"{{Instance}} & {{RL}} & {{Status}} & {{Best Sol}} & {{Gap \\%}} & {{Noeuds}} & {{Temps (s)}}{heur_header} \\\\ \n")
         texfile.write("\\midrule \n")
         
         # Data rows
@@ -178,8 +424,10 @@ def process_all_files_in_directory(directory_path, solve_model, tex_output_path,
             # Format status: abbreviate "Time limit reached" to "TLR"
             status_display = 'Rélisable (TLR)' if res['status'] == 'Time limit reached' else res['status']
 
+            heur_cells = (f" & {res.get('heur_cost', float('nan')):.1f} & {res.get('heur_time', float('nan')):.4f}" 
+                          if with_heur else "")
             texfile.write(f"{filename_escaped} & {res['rl_obj_val']:.1f} & {status_display} & {res['obj_val']:.1f} & "
-                         f"{res['gap']:.2f} & {int(res['node_count'])} & {res['runtime']:.3f} \\\ \n")
+                         f"{res['gap']:.2f} & {int(res['node_count'])} & {res['runtime']:.3f}{heur_cells} \\\ \n")
         
         # Calculate averages
         avg_obj = sum(r['obj_val'] for r in results) / len(results) if results else 0
@@ -188,9 +436,15 @@ def process_all_files_in_directory(directory_path, solve_model, tex_output_path,
         avg_gap = sum(r['gap'] for r in results) / len(results) if results else 0
         avg_nodes = sum(r['node_count'] for r in results) / len(results) if results else 0
         avg_runtime = sum(r['runtime'] for r in results) / len(results) if results else 0
+        avg_heur_cells = ""
+        if with_heur:
+            heur = [r for r in results if 'heur_cost' in r]
+            avg_heur_cost = sum(r['heur_cost'] for r in heur) / len(heur)
+            avg_heur_time = sum(r['heur_time'] for r in heur) / len(heur)
+            avg_heur_cells = f" & {avg_heur_cost:.2f} & {avg_heur_time:.4f}"
         
         texfile.write("\\midrule \n")
-        texfile.write(f"Average & {avg_rl:.2f} & {{}} & {avg_obj:.2f} & {avg_gap:.2f} & {avg_nodes:.2f} & {avg_runtime:.3f} \\\\ \n")
+        texfile.write(f"Average & {avg_rl:.2f} & {{}} & {avg_obj:.2f} & {avg_gap:.2f} & {avg_nodes:.2f} & {avg_runtime:.3f}{avg_heur_cells} \\\\ \n")
         texfile.write("\\bottomrule\n")
         texfile.write("\\end{tabular}\n")
         texfile.write(f"\\caption{{{caption_text}}}\n")
@@ -198,3 +452,21 @@ def process_all_files_in_directory(directory_path, solve_model, tex_output_path,
         texfile.write("\\end{table}\n\n")
 
     print(f"\nRésultats enregistrés dans le fichier LaTeX : {tex_output_path}")
+
+
+# ======= CSV REPORT =======
+CSV_COLUMNS = ('filename', 'status', 'rl_obj_val', 'obj_val', 'gap', 'node_count', 'runtime', 
+               'heur_cost', 'heur_time', 'rl_cut_obj_val')
+
+
+def write_csv_table(results, csv_output_path):
+    """
+    Writes the rows of the report as CSV (the heuristic columns stay empty without
+    warm_start, the relaxation with cuts without ls_cuts).
+    """
+    with open(csv_output_path, "w", newline="") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=CSV_COLUMNS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(results)
+
+    print(f"\nRésultats enregistrés dans le fichier CSV : {csv_output_path}")
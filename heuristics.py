@@ -0,0 +1,140 @@
+import time
+import numpy as np
+
+# ======= LOT-SIZING HEURISTICS =======
+# A plan is a list of lots (i, j), 0 <= i < j <= n, covering consecutive periods:
+# the production of period i satisfies the demands of i..j-1. Lots carrying no
+# demand (periods of zero demand) need no setup.
+# Each heuristic grows a lot from its first period with a greedy stopping rule on
+# setup + holding costs; all the candidate lot ends are scored at once with NumPy.
+
+def _cumulative(demandes):
+    """D[k] = sum_{t < k} d_t and W[k] = sum_{t < k} t d_t."""
+    d = np.asarray(demandes, dtype=np.float64)
+    D = np.concatenate([[0.0], np.cumsum(d)])
+    W = np.concatenate([[0.0], np.cumsum(np.arange(len(d)) * d)])
+    return D, W
+
+
+def _lot_ends(nbPeriodes, demandes, cfixes, cstock, choose_end):
+    """Builds a plan: from each lot start t, choose_end(t, ends, holding, D, setup) returns the lot end."""
+    D, W = _cumulative(demandes)
+    lots = []
+    t = 0
+    while t < nbPeriodes:
+        if demandes[t] == 0:
+            lots.append((t, t + 1))
+            t += 1
+            continue
+        # candidate lots t..k-1 for k = t+1..n, and their holding costs
+        ends = np.arange(t + 1, nbPeriodes + 1)
+        holding = cstock * ((W[ends] - W[t]) - t * (D[ends] - D[t]))
+        k = int(choose_end(t, ends, holding, D, cfixes[t]))
+        lots.append((t, k))
+        t = k
+    return lots
+
+
+def _first_local_min(criterion):
+    """Index of the first local minimum of a sequence (greedy stopping rule)."""
+    increase = np.flatnonzero(np.diff(criterion) > 0)
+    return int(increase[0]) if len(increase) else len(criterion) - 1
+
+
+def silver_meal(nbPeriodes, demandes, couts, cfixes, cstock):
+    """Silver-Meal: extend the lot while the cost per period covered decreases."""
+    def choose_end(t, ends, holding, D, setup):
+        per_period = (setup + holding) / (ends - t)
+        return ends[_first_local_min(per_period)]
+    return _lot_ends(nbPeriodes, demandes, cfixes, cstock, choose_end)
+
+
+def least_unit_cost(nbPeriodes, demandes, couts, cfixes, cstock):
+    """Least Unit Cost: extend the lot while the cost per unit produced decreases."""
+    def choose_end(t, ends, holding, D, setup):
+        per_unit = (setup + holding) / (D[ends] - D[t])
+        return ends[_first_local_min(per_unit)]
+    return _lot_ends(nbPeriodes, demandes, cfixes, cstock, choose_end)
+
+
+def part_period_balancing(nbPeriodes, demandes, couts, cfixes, cstock):
+    """Part-Period Balancing: choose the lot whose holding cost is closest to the setup cost."""
+    def choose_end(t, ends, holding, D, setup):
+        return ends[int(np.argmin(np.abs(holding - setup)))]
+    return _lot_ends(nbPeriodes, demandes, cfixes, cstock, choose_end)
+
+
+HEURISTICS = {
+    'Silver-Meal': silver_meal,
+    'LUC': least_unit_cost,
+    'PPB': part_period_balancing,
+}
+
+
+def plan_cost(nbPeriodes, demandes, couts, cfixes, cstock, lots):
+    """Total cost (setup + production + holding) of a plan."""
+    D, W = _cumulative(demandes)
+    cost = 0.0
+    for i, j in lots:
+        demand = D[j] - D[i]
+        if demand > 0:
+            cost += cfixes[i] + couts[i] * demand + cstock * ((W[j] - W[i]) - i * demand)
+    return float(cost)
+
+
+def best_heuristic_plan(nbPeriodes, demandes, couts, cfixes, cstock):
+    """Runs every heuristic and returns (name, lots, cost, runtime) of the cheapest plan."""
+    start_time = time.time()
+    best = None
+    for name, heuristic in HEURISTICS.items():
+        lots = heuristic(nbPeriodes, demandes, couts, cfixes, cstock)
+        cost = plan_cost(nbPeriodes, demandes, couts, cfixes, cstock, lots)
+        if best is None or cost < best[2]:
+            best = (name, lots, cost)
+    runtime = time.time() - start_time
+    return best + (runtime,)
+
+
+# ======= MIP START =======
+def plan_to_col_values(formulation, nbPeriodes, demandes, lots, lean=False):
+    """
+    Maps a plan onto the column layout of a formulation:
+    1: y, x, s ; 2: x_ij (row-major n x n, or i <= j only if lean), y ;
+    3: y, z_ij (arcs of shortest_path_arcs).
+    """
+    n = nbPeriodes
+    D, _ = _cumulative(demandes)
+    y = np.zeros(n)
+    for i, j in lots:
+        if D[j] > D[i]:
+            y[i] = 1.0
+
+    if formulation == 1:
+        x = np.zeros(n)
+        for i, j in lots:
+            x[i] = D[j] - D[i]
+        s = np.cumsum(x - np.asarray(demandes, dtype=np.float64))
+        return np.concatenate([y, x, s])
+
+    if formulation == 2:
+        # x_ij <= y_i holds for zero demands too: a lot without setup is served by the
+        # last setup before it, or by a setup in period 0 (forced by Model 2 when d_0 = 0)
+        x = np.zeros((n, n))
+        last = 0
+        for i, j in lots:
+            if y[i]:
+                last = i
+            x[last, i:j] = 1.0
+        y[0] = max(y[0], x[0].max())
+        if lean:
+            return np.concatenate([x[np.triu_indices(n)], y])
+        return np.concatenate([x.ravel(), y])
+
+    if formulation == 3:
+        # position of arc (i, j) in the order (0,1), (0,2), ..., (0,n), (1,2), ...
+        z = np.zeros(n * (n + 1) // 2)
+        for i, j in lots:
+            z[i * n - i * (i - 1) // 2 + (j - i - 1)] = 1.0
+        return np.concatenate([y, z])
+
+    raise ValueError(f"Formulation inconnue : {formulation}")
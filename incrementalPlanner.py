@@ -0,0 +1,124 @@
+import time
+import numpy as np
+
+from modelisations import build_model_2, solve_and_report
+from heuristics import plan_to_col_values
+from lpRelaxation import run_relaxed
+
+# ======= INCREMENTAL RE-OPTIMIZATION =======
+# Keeps one built Model 2 per instance and applies demand / cost revisions in place:
+# demands only enter the costs (c_i + h (j-i)) d_j of the x_ij columns, so every delta
+# is a change of column costs. The LP relaxation of Model 2 is integral, so a re-solve
+# is a simplex run from the previous optimal basis (which stays primal feasible, since
+# only costs change); a fractional answer falls back to the MIP, started from the
+# previous setup schedule repaired for the new data.
+# Model 1 is not offered: HiGHS does not reuse a basis or a search tree between MIP
+# solves, so a Model 1 re-solve (even with the previous plan as MIP start) costs as much
+# as a cold solve.
+
+class IncrementalPlanner:
+    """Persistent Model 2 of a ULS instance accepting demand and cost deltas."""
+
+    def __init__(self, nbPeriodes, demandes, couts, cfixes, cstock, options=None):
+        self.nbPeriodes = nbPeriodes
+        self.demandes = np.asarray(demandes, dtype=np.float64).copy()
+        self.couts = np.asarray(couts, dtype=np.float64).copy()
+        self.cfixes = np.asarray(cfixes, dtype=np.float64).copy()
+        self.cstock = cstock
+        self.history = []    # (kind, build or solve time) of every step
+
+        start_time = time.time()
+        # the deltas below patch the costs in the (full n x n) layout of the array-built model
+        self.model = build_model_2(nbPeriodes, demandes, couts, cfixes, cstock,
+                                   vectorized=True, options=options)
+        self.build_time = time.time() - start_time
+        self.history.append(('build', self.build_time))
+
+    # ------ COLUMN LAYOUT ------
+    def _y_cols(self):
+        n = self.nbPeriodes
+        return n * n + np.arange(n)
+
+    def setups(self):
+        """Setup periods of the last solution."""
+        y = np.asarray(self.model.getSolution().col_value)[self._y_cols()]
+        return np.flatnonzero(y > 0.5)
+
+    # ------ DELTAS ------
+    def update_demands(self, changes):
+        """changes: {period: new demand}. Modifies the model in place."""
+        periods = np.array(sorted(changes), dtype=np.int32)
+        values = np.array([changes[j] for j in periods], dtype=np.float64)
+        self.demandes[periods] = values
+        self._update_x_costs(columns=periods)
+
+    def update_costs(self, couts=None, cfixes=None, cstock=None):
+        """couts / cfixes: {period: new cost}; cstock: new holding cost."""
+        if cfixes:
+            periods = np.array(sorted(cfixes), dtype=np.int32)
+            self.cfixes[periods] = [cfixes[i] for i in periods]
+            cols = self._y_cols()[periods].astype(np.int32)
+            self.model.changeColsCost(len(cols), cols, self.cfixes[periods])
+        if cstock is not None:
+            self.cstock = cstock
+        if couts:
+            periods = np.array(sorted(couts), dtype=np.int32)
+            self.couts[periods] = [couts[i] for i in periods]
+        if cstock is not None:
+            self._update_x_costs()
+        elif couts:
+            self._update_x_costs(rows=periods)
+
+    def _update_x_costs(self, rows=None, columns=None):
+        """Recomputes the costs of the x_ij (i <= j) for the given rows i or columns j."""
+        n = self.nbPeriodes
+        rows = np.arange(n) if rows is None else rows
+        columns = np.arange(n) if columns is None else columns
+        i_grid, j_grid = np.meshgrid(rows, columns, indexing='ij')
+        keep = j_grid >= i_grid
+        i_sel, j_sel = i_grid[keep], j_grid[keep]
+        costs = (self.couts[i_sel] + self.cstock * (j_sel - i_sel)) * self.demandes[j_sel]
+        cols = (i_sel * n + j_sel).astype(np.int32)
+        self.model.changeColsCost(len(cols), cols, costs)
+
+    # ------ SOLVE ------
+    def _repaired_start(self):
+        """Previous setup schedule turned into a feasible plan for the current data."""
+        starts = self.setups().tolist()
+        if not starts or starts[0] != 0:
+            starts = [0] + starts
+        lots = list(zip(starts, starts[1:] + [self.nbPeriodes]))
+        return plan_to_col_values(2, self.nbPeriodes, self.demandes, lots)
+
+    def _resolve_lp(self):
+        """Re-solves the relaxation from the current basis; None if not integral."""
+        def resolve(model):
+            start_time = time.time()
+            model.run()
+            # the status is reset once integrality is restored
+            return model.getModelStatus(), time.time() - start_time
+
+        model_status, runtime = run_relaxed(self.model, resolve)
+        col_value = np.asarray(self.model.getSolution().col_value)
+        if not np.all(np.abs(col_value - np.rint(col_value)) <= 1e-6):
+            return None
+        self.model.solve_time = runtime
+        print("\n----------------------------------")
+        print('Status de la ré-optimisation (simplexe) = ', self.model.modelStatusToString(model_status))
+        print("Valeur de la fonction objectif = ", self.model.getObjectiveValue())
+        print("Temps de résolution (en secondes) = ", runtime)
+        print("----------------------------------")
+        return model_status
+
+    def solve(self):
+        """Solves (or re-solves warm after deltas) and returns the model status."""
+        if self.history[-1][0] == 'build':
+            model_status = solve_and_report(self.model, self.build_time)
+            self.history.append(('solve', self.model.solve_time))
+            return model_status
+
+        model_status = self._resolve_lp()
+        if model_status is None:
+            model_status = solve_and_report(self.model, 0.0, self._repaired_start())
+        self.history.append(('resolve', self.model.solve_time))
+        return model_status
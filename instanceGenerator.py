@@ -0,0 +1,116 @@
+import os
+import argparse
+import numpy as np
+
+# ======= INSTANCE GENERATOR =======
+# Writes instances in the format of read_data:
+#   n | d_1 .. d_n | c_1 .. c_n | f_1 .. f_n | h
+# Every line is produced chunk by chunk from its own random stream (derived from the
+# seed), so the output is reproducible and a file of millions of periods never sits
+# in memory.
+
+DEMAND_PATTERNS = ('uniform', 'seasonal', 'trending', 'lumpy')
+COST_REGIMES = ('constant', 'varying')
+
+
+def _demand_chunk(rng, t, nbPeriodes, pattern, mean, season, zero_fraction):
+    """Demands of the periods t (array of indices) for the given pattern."""
+    if pattern == 'uniform':
+        d = rng.integers(0, 2 * mean + 1, len(t)).astype(np.float64)
+    elif pattern == 'seasonal':
+        d = mean * (1 + 0.8 * np.sin(2 * np.pi * t / season)) + rng.normal(0, 0.1 * mean, len(t))
+    elif pattern == 'trending':
+        d = mean * (0.5 + t / max(nbPeriodes - 1, 1)) + rng.normal(0, 0.1 * mean, len(t))
+    elif pattern == 'lumpy':
+        # rare large orders, nothing in between
+        d = np.where(rng.random(len(t)) < 0.2, rng.integers(2 * mean, 8 * mean + 1, len(t)), 0)
+    else:
+        raise ValueError(f"Profil de demande inconnu : {pattern}")
+
+    if zero_fraction > 0:
+        d = np.where(rng.random(len(t)) < zero_fraction, 0, d)
+    return np.maximum(np.rint(d), 0).astype(np.int64)
+
+
+def _cost_chunk(rng, t, regime, value, low, high):
+    """Costs of the periods t: constant, or drawn uniformly in [low, high]."""
+    if regime == 'constant':
+        return np.full(len(t), value, dtype=np.int64)
+    if regime == 'varying':
+        return rng.integers(low, high + 1, len(t))
+    raise ValueError(f"Régime de coûts inconnu : {regime}")
+
+
+def _write_line(file, nbPeriodes, chunk_size, make_chunk):
+    for start in range(0, nbPeriodes, chunk_size):
+        t = np.arange(start, min(start + chunk_size, nbPeriodes))
+        if start > 0:
+            file.write(" ")
+        file.write(" ".join(map(str, make_chunk(t).tolist())))
+    file.write("\n")
+
+
+def generate_instance(datafileName, nbPeriodes,
+                      pattern='uniform',
+                      zero_fraction=0.0,
+                      setup_regime='constant',
+                      production_regime='varying',
+                      mean_demand=25,
+                      season=12,
+                      setup_cost=3000,
+                      production_cost=5,
+                      cstock=2,
+                      seed=0,
+                      chunk_size=100000):
+    """
+    Writes one instance to datafileName.
+    pattern: 'uniform', 'seasonal', 'trending' or 'lumpy' demands; zero_fraction adds
+    zero-demand periods at random.
+    setup_regime / production_regime: 'constant' (setup_cost / production_cost in every
+    period) or 'varying' (uniform around those values).
+    seed: int or sequence of ints (numpy SeedSequence entropy).
+    """
+    rng_demand, rng_cost, rng_setup = (np.random.default_rng(s)
+                                       for s in np.random.SeedSequence(seed).spawn(3))
+
+    with open(datafileName, "w") as file:
+        file.write(f"{nbPeriodes}\n")
+        _write_line(file, nbPeriodes, chunk_size, lambda t: _demand_chunk(
+            rng_demand, t, nbPeriodes, pattern, mean_demand, season, zero_fraction))
+        _write_line(file, nbPeriodes, chunk_size, lambda t: _cost_chunk(
+            rng_cost, t, production_regime, production_cost, 1, 2 * production_cost - 1))
+        _write_line(file, nbPeriodes, chunk_size, lambda t: _cost_chunk(
+            rng_setup, t, setup_regime, setup_cost, setup_cost // 2, 3 * setup_cost // 2))
+        file.write(f"{cstock}\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Générateur d'instances ULS")
+    parser.add_argument('--periods', type=int, nargs='+', default=[1000])
+    parser.add_argument('--count', type=int, default=10, help="nombre d'instances par horizon")
+    parser.add_argument('--pattern', choices=DEMAND_PATTERNS, default='uniform')
+    parser.add_argument('--zero-fraction', type=float, default=0.0)
+    parser.add_argument('--setup-regime', choices=COST_REGIMES, default='constant')
+    parser.add_argument('--production-regime', choices=COST_REGIMES, default='varying')
+    parser.add_argument('--cstock', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output-dir', default='./Instances_generated')
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for n in args.periods:
+        for k in range(1, args.count + 1):
+            # same naming as Instances_ULS, so the LaTeX report groups them by horizon
+            datafileName = os.path.join(args.output_dir, f"Instance{n}.{k}.txt")
+            generate_instance(datafileName, n,
+                              pattern=args.pattern,
+                              zero_fraction=args.zero_fraction,
+                              setup_regime=args.setup_regime,
+                              production_regime=args.production_regime,
+                              cstock=args.cstock,
+                              seed=[args.seed, n, k])
+            print(f"Instance générée : {datafileName}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import os
+import json
+import numpy as np
+
+# ======= INSTANCE STORE =======
+# A file holds one or more instances, each written as:
+#   n | d_1 .. d_n | c_1 .. c_n | f_1 .. f_n | h
+# The store keeps every instance of a directory in flat NumPy columns (demandes,
+# couts and cfixes concatenated, sliced through offsets) saved as one .npy file per
+# column, so that later runs open them memory-mapped instead of parsing text again.
+
+COLUMNS = ('offsets', 'demandes', 'couts', 'cfixes', 'cstock')
+
+
+def parse_instances(text):
+    """
+    Parses every instance of a text; returns a list of (nbPeriodes, demandes, couts, cfixes, cstock) arrays.
+    Raises ValueError on a token that is not an integer and on a truncated instance.
+    """
+    words = text.split()
+    try:
+        tokens = np.array(words, dtype=np.int64)
+    except ValueError:
+        # only on failure: find the offending token for the message
+        bad = next(k for k, word in enumerate(words) if not word.lstrip('+-').isdigit())
+        raise ValueError(f"Valeur non entière {words[bad]!r} (valeur n° {bad + 1})") from None
+    instances = []
+    pos = 0
+    while pos < len(tokens):
+        n = int(tokens[pos])
+        if n <= 0:
+            raise ValueError(f"Nombre de périodes invalide ({n}) à la valeur n° {pos + 1}")
+        block = tokens[pos + 1 : pos + 3 * n + 2]
+        if len(block) != 3 * n + 1:
+            raise ValueError(f"Instance tronquée à la valeur n° {pos + 1} : {3 * n + 1} valeurs "
+                             f"attendues après n = {n}, {len(block)} lues")
+        instances.append((n, block[0:n], block[n:2 * n], block[2 * n:3 * n], int(block[3 * n])))
+        pos += 3 * n + 2
+    return instances
+
+
+class InstanceStore:
+    """Columnar collection of instances: instance k spans offsets[k]:offsets[k+1] of each column."""
+
+    def __init__(self, names, offsets, demandes, couts, cfixes, cstock):
+        self.names = list(names)
+        self.offsets = offsets
+        self.demandes = demandes
+        self.couts = couts
+        self.cfixes = cfixes
+        self.cstock = cstock
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, k):
+        """Instance k as (nbPeriodes, demandes, couts, cfixes, cstock) with NumPy views."""
+        start, end = int(self.offsets[k]), int(self.offsets[k + 1])
+        return (end - start, self.demandes[start:end], self.couts[start:end],
+                self.cfixes[start:end], int(self.cstock[k]))
+
+    def instance(self, k):
+        """Instance k in the format of read_data (Python lists)."""
+        nbPeriodes, demandes, couts, cfixes, cstock = self[k]
+        return nbPeriodes, demandes.tolist(), couts.tolist(), cfixes.tolist(), cstock
+
+    def index(self, name):
+        return self.names.index(name)
+
+    # ------ PERSISTENCE ------
+    def save(self, store_path, sources=None):
+        """Writes one .npy file per column plus an index (names, source files and their mtimes)."""
+        os.makedirs(store_path, exist_ok=True)
+        for column in COLUMNS:
+            np.save(os.path.join(store_path, f"{column}.npy"), getattr(self, column))
+        with open(os.path.join(store_path, "index.json"), "w") as file:
+            json.dump({'names': self.names, 'sources': sources or {}}, file)
+
+    @classmethod
+    def open(cls, store_path):
+        """Opens a saved store; the columns are memory-mapped, not read."""
+        with open(os.path.join(store_path, "index.json"), "r") as file:
+            index = json.load(file)
+        columns = [np.load(os.path.join(store_path, f"{column}.npy"), mmap_mode='r')
+                   for column in COLUMNS]
+        return cls(index['names'], *columns)
+
+
+def load_directory(directory_path, store_path=None):
+    """
+    Parses every .txt file of a directory into an InstanceStore, one file read per file
+    and no per-element Python work. Files holding several instances give the names
+    'file.txt#0', 'file.txt#1', ...
+    With store_path, the store is saved there and reopened (memory-mapped) on later calls
+    as long as no source file was added, removed or modified.
+    """
+    filenames = sorted(f for f in os.listdir(directory_path) if f.endswith(".txt"))
+    sources = {f: os.path.getmtime(os.path.join(directory_path, f)) for f in filenames}
+
+    if store_path is not None and os.path.exists(os.path.join(store_path, "index.json")):
+        with open(os.path.join(store_path, "index.json"), "r") as file:
+            if json.load(file)['sources'] == sources:
+                return InstanceStore.open(store_path)
+
+    names, sizes, cstock = [], [], []
+    demandes, couts, cfixes = [], [], []
+    for filename in filenames:
+        with open(os.path.join(directory_path, filename), "r") as file:
+            instances = parse_instances(file.read())
+        for k, (n, d, c, f, h) in enumerate(instances):
+            names.append(filename if len(instances) == 1 else f"{filename}#{k}")
+            sizes.append(n)
+            demandes.append(d)
+            couts.append(c)
+            cfixes.append(f)
+            cstock.append(h)
+
+    empty = np.zeros(0, dtype=np.int64)
+    store = InstanceStore(
+        names,
+        np.concatenate([[0], np.cumsum(sizes, dtype=np.int64)]).astype(np.int64),
+        np.concatenate(demandes) if demandes else empty,
+        np.concatenate(couts) if couts else empty,
+        np.concatenate(cfixes) if cfixes else empty,
+        np.array(cstock, dtype=np.int64)
+    )
+
+    if store_path is not None:
+        store.save(store_path, sources)
+    return store
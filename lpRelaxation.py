@@ -0,0 +1,76 @@
+import time
+import numpy as np
+
+# ======= LP RELAXATION ON A BUILT MODEL =======
+# Relaxation work done on the Highs instance of a MIP (relaxation bound, root cutting
+# planes, LP re-solves) switches integrality off and must restore it afterwards.
+# Restoring integrality keeps the solution values but resets the model status, so
+# callers read what they need inside the callback.
+
+def run_relaxed(model, callback):
+    """Switches integrality off, returns callback(model) and restores integrality (even on error)."""
+    num_col = model.getNumCol()
+    cols = np.arange(num_col, dtype=np.int32)
+    integrality = np.array([int(t) for t in model.getLp().integrality_], dtype=np.uint8)
+    model.changeColsIntegrality(num_col, cols, np.zeros(num_col, dtype=np.uint8))
+    try:
+        return callback(model)
+    finally:
+        if len(integrality):
+            model.changeColsIntegrality(num_col, cols, integrality)
+
+
+def cutting_plane_loop(model, separate, max_rounds, min_improvement=None, max_age=None):
+    """
+    Root cutting-plane loop on the relaxation of a built MIP: solves the LP, calls
+    separate(col_value), which adds the violated rows and returns how many, and repeats
+    until none is added (or max_rounds). Integrality is restored afterwards.
+    min_improvement: also stop once a round raises the bound by less than this fraction.
+    max_age: remove a cut once it has been slack at max_age LP optima in a row (the LP
+    re-solves slow down with the number of rows; a removed cut is found again if needed).
+    Returns the statistics of the loop as a dict.
+    """
+    def loop(model):
+        start_time = time.time()
+        first_cut = model.getNumRow()
+        age = np.zeros(0, dtype=np.int64)    # rounds each cut row has been slack
+        model.run()
+        bound_before = bound = model.getObjectiveValue()
+
+        rounds = 0
+        nb_cuts = 0
+        nb_removed = 0
+        while rounds < max_rounds:
+            solution = model.getSolution()
+            row_value = np.asarray(solution.row_value)[first_cut:first_cut + len(age)]
+            added = separate(np.asarray(solution.col_value))
+            if not added:
+                break
+            nb_cuts += added
+            rounds += 1
+            if max_age is not None:
+                lp = model.getLp()
+                upper = np.asarray(lp.row_upper_)[first_cut:first_cut + len(age)]
+                lower = np.asarray(lp.row_lower_)[first_cut:first_cut + len(age)]
+                slack = (row_value < upper - 1e-6) & (row_value > lower + 1e-6)
+                age = np.concatenate([np.where(slack, age + 1, 0), np.zeros(added, dtype=np.int64)])
+                old = np.flatnonzero(age >= max_age)
+                if len(old):
+                    model.deleteRows(len(old), (first_cut + old).astype(np.int32))
+                    age = np.delete(age, old)
+                    nb_removed += len(old)
+            model.run()
+            previous, bound = bound, model.getObjectiveValue()
+            if min_improvement is not None and bound - previous < min_improvement * max(1.0, abs(bound)):
+                break
+
+        return {
+            'rounds': rounds,
+            'cuts': nb_cuts,
+            'removed': nb_removed,
+            'bound_before': bound_before,
+            'bound_after': bound,
+            'runtime': time.time() - start_time
+        }
+
+    return run_relaxed(model, loop)
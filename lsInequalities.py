@@ -0,0 +1,83 @@
+import numpy as np
+import highspy as hp
+
+from lpRelaxation import cutting_plane_loop
+
+# ======= (l,S) INEQUALITIES =======
+# For Model 1 (columns y: [0, n), x: [n, 2n), s: [2n, 3n)) and every l, S ⊆ {0..l}:
+#   sum_{i in S} x_i <= sum_{i in S} D_il y_i + s_l,   D_il = d_i + ... + d_l
+# Together with the balance rows they describe the convex hull of the ULS.
+
+def separate_ls(nbPeriodes, demandes, y_values, x_values, s_values, tol=1e-6):
+    """
+    Finds the most violated (l,S) inequality for every l, in O(n^2).
+    For a given l the best S is {i <= l : x_i > D_il y_i}. Returns a list of (l, S, violation).
+    """
+    y = np.asarray(y_values, dtype=np.float64)
+    x = np.asarray(x_values, dtype=np.float64)
+    s = np.asarray(s_values, dtype=np.float64)
+    D = np.concatenate([[0.0], np.cumsum(np.asarray(demandes, dtype=np.float64))])
+
+    # D_il[i, l] = D[l + 1] - D[i], only meaningful for i <= l
+    D_il = D[None, 1:] - D[:-1, None]
+    excess = x[:, None] - D_il * y[:, None]
+    in_S = np.triu(excess > tol)
+    violation = np.where(in_S, excess, 0.0).sum(axis=0) - s
+
+    cuts = []
+    for l in np.flatnonzero(violation > tol):
+        cuts.append((int(l), np.flatnonzero(in_S[:, l]), float(violation[l])))
+    return cuts
+
+
+def _add_ls_rows(model, nbPeriodes, demandes, cuts):
+    """Adds the rows sum_{i in S} (x_i - D_il y_i) - s_l <= 0 in a single addRows."""
+    n = nbPeriodes
+    D = np.concatenate([[0.0], np.cumsum(np.asarray(demandes, dtype=np.float64))])
+
+    row_start, row_index, row_value = [], [], []
+    for l, S, _ in cuts:
+        row_start.append(len(row_index))
+        row_index.extend(n + S)
+        row_value.extend([1.0] * len(S))
+        row_index.extend(S)
+        row_value.extend(D[S] - D[l + 1])
+        row_index.append(2 * n + l)
+        row_value.append(-1.0)
+
+    num_row = len(cuts)
+    model.addRows(num_row, np.full(num_row, -hp.kHighsInf), np.zeros(num_row),
+                  len(row_index), np.array(row_start, dtype=np.int32),
+                  np.array(row_index, dtype=np.int32), np.array(row_value, dtype=np.float64))
+
+
+def add_ls_cuts(model, nbPeriodes, demandes, max_rounds=200, max_cuts=None, min_improvement=1e-6,
+                max_age=10, tol=1e-6):
+    """
+    Root cutting-plane loop on a built Model 1: solves the LP relaxation, adds the
+    violated (l,S) inequalities and repeats until none is found, max_rounds is reached
+    or a round raises the bound by less than min_improvement (relative).
+    max_cuts: at most this many cuts per round, the most violated first.
+    max_age: cuts slack at max_age LP optima in a row are removed (see cutting_plane_loop).
+    Integrality is restored afterwards. Returns the statistics of the loop as a dict.
+    """
+    n = nbPeriodes
+
+    def separate(col_value):
+        cuts = separate_ls(n, demandes, col_value[0:n], col_value[n:2 * n], col_value[2 * n:3 * n], tol)
+        if max_cuts is not None and len(cuts) > max_cuts:
+            cuts = sorted(cuts, key=lambda cut: cut[2], reverse=True)[:max_cuts]
+        if cuts:
+            _add_ls_rows(model, n, demandes, cuts)
+        return len(cuts)
+
+    stats = cutting_plane_loop(model, separate, max_rounds, min_improvement, max_age)
+
+    print("\n----------------------------------")
+    print("Inégalités (l,S) ajoutées = ", stats['cuts'], " en ", stats['rounds'], " tours",
+          f"({stats['removed']} retirées)")
+    print("Borne de la relaxation avant / après coupes = ", stats['bound_before'], " / ", stats['bound_after'])
+    print("Temps de séparation (en secondes) = ", stats['runtime'])
+    print("----------------------------------")
+
+    return stats
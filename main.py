@@ -25,6 +25,24 @@ def main():
         label_tab="tab:model2_results"
     )
 
+    ######### Modèle 3 (plus court chemin) #########
+    # process_all_files_in_directory(
+    #     directory_path='./Instances_ULS',
+    #     solve_model=solve_model_3,
+    #     tex_output_path='./model3_results.tex',
+    #     caption_text="Résultats du modèle 3 pour les instances ULS",
+    #     label_tab="tab:model3_results"
+    # )
+
+    ######### Programmation dynamique (Wagner-Whitin) #########
+    # process_all_files_in_directory(
+    #     directory_path='./Instances_ULS',
+    #     solve_model=solve_dp,
+    #     tex_output_path='./dp_results.tex',
+    #     caption_text="Résultats de la programmation dynamique pour les instances ULS",
+    #     label_tab="tab:dp_results"
+    # )
+
     ######### Test: instance spécifique #########
 
     # datafileName = './Instances_ULS/Instance60.1.txt'
@@ -36,5 +54,11 @@ def main():
     # model, model_status = solve_model_2(nbPeriodes, demandes, couts, cfixes, cstock)
     # printSolution_model2(model, nbPeriodes, model_status, demandes)    
 
+    # model, model_status = solve_model_3(nbPeriodes, demandes, couts, cfixes, cstock)
+    # printSolution_model3(model, nbPeriodes, model_status, demandes)
+
+    # model, model_status = solve_dp(nbPeriodes, demandes, couts, cfixes, cstock)
+    # printSolution_model1(model, nbPeriodes, model_status, demandes)
+
 if __name__ == "__main__":
     main()    
\ No newline at end of file
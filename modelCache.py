@@ -0,0 +1,160 @@
+import os
+import json
+import time
+import hashlib
+import numpy as np
+import highspy as hp
+
+from modelisations import new_model
+
+# ======= MODEL ARTIFACT CACHE =======
+# Built models written to disk once and loaded straight into a Highs instance the next
+# time the same instance and formulation are solved (other options, other time limit).
+# One artifact per SHA-256 of the instance data, the build function and its arguments:
+#   - 'mps': written by writeModel, loaded by readModel (portable, readable by any solver);
+#   - 'npz': the column / row arrays and the constraint matrix of getLp(), loaded by
+#     passModel (binary, no text parsing).
+# A sidecar JSON keeps the build time of the artifact so that loads can be compared to it.
+
+class ModelCache:
+    """On-disk cache of built (not solved) HiGHS models, keyed by content hash."""
+
+    def __init__(self, cache_dir='./.uls_models', fmt='mps'):
+        if fmt not in ('mps', 'npz'):
+            raise ValueError(f"format de modèle inconnu : {fmt}")
+        self.cache_dir = cache_dir
+        self.fmt = fmt
+        self.stats = []
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def __repr__(self):
+        # stable, so that partial(solve_model_*, model_cache=...) keeps a stable ResultCache key
+        return f"ModelCache({self.cache_dir!r}, fmt={self.fmt!r})"
+
+    def make_key(self, build_model, nbPeriodes, demandes, couts, cfixes, cstock, **build_kwargs):
+        """Hash of the instance data, the build function and its arguments (options excluded)."""
+        digest = hashlib.sha256()
+        digest.update(f"{build_model.__name__}:{nbPeriodes}:{float(cstock)!r}".encode())
+        for values in (demandes, couts, cfixes):
+            digest.update(np.asarray(values, dtype=np.float64).tobytes())
+        digest.update(json.dumps(build_kwargs, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.{self.fmt}")
+
+    def get_model(self, build_model, nbPeriodes, demandes, couts, cfixes, cstock,
+                  options=None, **build_kwargs):
+        """
+        Returns the model of build_model(...) with the given options, loaded from its
+        artifact if there is one, built (and written) otherwise. model.model_source is
+        'cache' or 'build'.
+        """
+        key = self.make_key(build_model, nbPeriodes, demandes, couts, cfixes, cstock, **build_kwargs)
+        path = self._path(key)
+
+        if os.path.exists(path):
+            start_time = time.time()
+            model = new_model(options)
+            if self._read(model, path):
+                load_time = time.time() - start_time
+                build_time = self._read_meta(key).get('build_time')
+                model.model_source = 'cache'
+                self.stats.append({'formulation': build_model.__name__, 'source': 'cache',
+                                   'time': load_time, 'build_time': build_time})
+                print(f"\nModèle chargé depuis le cache en {load_time:.4f} s"
+                      + (f" (construction : {build_time:.4f} s)" if build_time is not None else ""))
+                return model
+
+        start_time = time.time()
+        model = build_model(nbPeriodes, demandes, couts, cfixes, cstock, options=options, **build_kwargs)
+        build_time = time.time() - start_time
+        start_time = time.time()
+        self._write(model, key, build_time)
+        write_time = time.time() - start_time
+        model.model_source = 'build'
+        self.stats.append({'formulation': build_model.__name__, 'source': 'build',
+                           'time': build_time, 'build_time': build_time})
+        print(f"\nModèle construit en {build_time:.4f} s, écrit dans le cache en {write_time:.4f} s")
+        return model
+
+    def report(self):
+        """Prints and returns the mean build and load times per formulation."""
+        summary = {}
+        for record in self.stats:
+            entry = summary.setdefault(record['formulation'], {'builds': [], 'loads': []})
+            if record['source'] == 'build':
+                entry['builds'].append(record['time'])
+            else:
+                entry['loads'].append(record['time'])
+                # the build time of an artifact written by an earlier run
+                if record['build_time'] is not None:
+                    entry['builds'].append(record['build_time'])
+
+        print("\n----------------------------------")
+        print(f"| {'Formulation':<15} | {'Chargements':<11} | {'Chargement (s)':<14} | {'Construction (s)':<16} |")
+        for formulation, entry in summary.items():
+            entry['load_time'] = float(np.mean(entry['loads'])) if entry['loads'] else None
+            entry['build_time'] = float(np.mean(entry['builds'])) if entry['builds'] else None
+            entry['nb_loads'] = len(entry.pop('loads'))
+            entry.pop('builds')
+            load = f"{entry['load_time']:.4f}" if entry['load_time'] is not None else "-"
+            build = f"{entry['build_time']:.4f}" if entry['build_time'] is not None else "-"
+            print(f"| {formulation:<15} | {entry['nb_loads']:<11} | {load:<14} | {build:<16} |")
+        print("----------------------------------")
+        return summary
+
+    def invalidate(self):
+        """Removes every artifact of the cache."""
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(('.mps', '.npz', '.json')):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except FileNotFoundError:
+                    pass
+
+    # ------ ARTIFACTS ------
+    def _write(self, model, key, build_time):
+        path = self._path(key)
+        # sidecar first: an artifact in place always has its build time
+        with open(os.path.join(self.cache_dir, f"{key}.json"), "w") as file:
+            json.dump({'build_time': build_time}, file)
+        # HiGHS picks the writer from the extension: keep it on the temporary file
+        tmp_path = os.path.join(self.cache_dir, f"{key}.{os.getpid()}.tmp.{self.fmt}")
+        if self.fmt == 'mps':
+            model.writeModel(tmp_path)
+        else:
+            lp = model.getLp()
+            matrix = lp.a_matrix_
+            with open(tmp_path, "wb") as file:
+                np.savez(file, col_cost=lp.col_cost_, col_lower=lp.col_lower_, col_upper=lp.col_upper_,
+                         row_lower=lp.row_lower_, row_upper=lp.row_upper_,
+                         start=matrix.start_, index=matrix.index_, value=matrix.value_,
+                         integrality=np.array([int(t) for t in lp.integrality_], dtype=np.uint8),
+                         a_format=int(matrix.format_), sense=int(lp.sense_), offset=lp.offset_)
+        os.replace(tmp_path, path)
+
+    def _read_meta(self, key):
+        try:
+            with open(os.path.join(self.cache_dir, f"{key}.json"), "r") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _read(self, model, path):
+        """Loads an artifact into model; False if it cannot be read (then rebuilt)."""
+        if self.fmt == 'mps':
+            return model.readModel(path) != hp.HighsStatus.kError
+        try:
+            arrays = np.load(path)
+        except (OSError, ValueError):
+            return False
+        num_col = len(arrays['col_cost'])
+        # a continuous model has no integrality vector: pass it explicitly
+        integrality = arrays['integrality'] if len(arrays['integrality']) else np.zeros(num_col, dtype=np.uint8)
+        status = model.passModel(num_col, len(arrays['row_lower']), len(arrays['value']),
+                                 int(arrays['a_format']), int(arrays['sense']), float(arrays['offset']),
+                                 arrays['col_cost'], arrays['col_lower'], arrays['col_upper'],
+                                 arrays['row_lower'], arrays['row_upper'],
+                                 arrays['start'], arrays['index'], arrays['value'], integrality)
+        return status != hp.HighsStatus.kError
@@ -1,19 +1,151 @@
 from typing_extensions import runtime
 import highspy as hp
 import time # pour le temps de résolution
+import math
+from types import SimpleNamespace
+import numpy as np
 
-# ======= MODEL 1 =======
-def solve_model_1(nbPeriodes, demandes, 
-                  couts, cfixes, cstock, 
-                  output_flag=True, 
-                  type_vars=hp.HighsVarType.kInteger):
-    """Builds and solves Model 1, returning the required metrics."""
-    
+from wagnerWhitin import wagner_whitin, wagner_whitin_batch, plan_from_successors
+from lsInequalities import add_ls_cuts
+from lpRelaxation import run_relaxed, cutting_plane_loop
+from heuristics import best_heuristic_plan, plan_to_col_values
+from planningHorizon import fix_setups
+
+# ======= SOLVER SETTINGS =======
+def new_model(options=None):
+    """
+    Creates a Highs instance with the settings shared by every formulation.
+    options: optional dict of HiGHS options overriding the defaults (e.g. {'threads': 2}).
+    """
     model = hp.Highs()
     model.setOptionValue('time_limit', 180)
     model.setOptionValue('mip_rel_gap', 1e-10)
     model.setOptionValue('mip_abs_gap', 1)
     model.setOptionValue('output_flag', True)
+    for name, value in (options or {}).items():
+        model.setOptionValue(name, value)
+    return model
+
+
+def solve_and_report(model, build_time=0.0, mip_start=None, telemetry=None):
+    """
+    Solves a built model, prints the required metrics and returns its status.
+    mip_start: optional full vector of column values given to HiGHS as an incumbent.
+    telemetry: optional SolverTelemetry recording the incumbent / bound timeline.
+    """
+    #model.write("test.lp")
+
+    if telemetry is not None:
+        telemetry.attach(model)
+
+    if mip_start is not None:
+        solution = hp.HighsSolution()
+        solution.col_value = list(mip_start)
+        model.setSolution(solution)
+
+    start_time = time.time()
+    status = model.optimize()
+    end_time = time.time()
+    runtime = end_time - start_time
+
+    # timings kept on the model so the callers can report them separately
+    model.build_time = build_time
+    model.solve_time = runtime
+
+    print("\n----------------------------------")
+    info = model.getInfo()
+    model_status = model.getModelStatus()
+    print('Status de la résolution par le solveur = ', model.modelStatusToString(model_status))
+    print("Valeur de la fonction objectif = ", model.getObjectiveValue())
+    print("Meilleure borne inférieure sur la valeur de la fonction objectif: ", info.mip_dual_bound)
+    print("Gap: ", info.mip_gap)
+    print("# de noeuds explorés: ", info.mip_node_count)
+    print("Temps de construction du modèle (en secondes) = ", build_time)
+    print("Temps de résolution (en secondes) = ", runtime)
+    print("----------------------------------")
+    
+    return model_status
+
+
+def solve_relaxation_then_mip(model, build_time=0.0, mip_start=None, telemetry=None, lp_bound=None):
+    """
+    Solves the LP relaxation of a built MIP on the same Highs instance (integrality
+    switched off), then restores integrality and solves the MIP on it, without building
+    the model again. HiGHS does not start a MIP from an LP basis: the fractional LP point
+    is dropped so that it is not offered (and rejected) as a MIP start. A time_limit
+    option covers both solves. The relaxation value is stored in model.rl_obj_val.
+    lp_bound: relaxation of the model before the root cuts it holds; it is then stored in
+    model.rl_obj_val and the relaxation with the cuts in model.rl_cut_obj_val.
+    """
+    # --- SOLVE (RL) ---
+    start_time = time.time()
+    relaxation = run_relaxed(model, lambda model: (model.run(), model.getObjectiveValue())[1])
+    model.rl_time = time.time() - start_time
+    model.rl_obj_val = relaxation if lp_bound is None else lp_bound
+    print("\nValeur de la relaxation linéaire = ", model.rl_obj_val)
+    if lp_bound is not None:
+        model.rl_cut_obj_val = relaxation
+        print("Valeur de la relaxation avec les coupes = ", model.rl_cut_obj_val)
+    print("Temps de résolution de la relaxation (en secondes) = ", model.rl_time)
+
+    # --- SOLVE (PLNE) ---
+    model.clearSolver()
+    # time_limit applies to every run(): the MIP only gets what the relaxation left of it
+    _, time_limit = model.getOptionValue('time_limit')
+    if math.isfinite(time_limit):
+        model.setOptionValue('time_limit', max(time_limit - model.rl_time, 0.0))
+    try:
+        return solve_and_report(model, build_time, mip_start, telemetry)
+    finally:
+        model.setOptionValue('time_limit', time_limit)
+
+
+def heuristic_start(model, formulation, nbPeriodes, demandes, couts, cfixes, cstock, lean=False):
+    """
+    Computes the best of the Silver-Meal / LUC / PPB plans, stores its name, cost and
+    time in model.heuristic and returns it as column values for the given formulation.
+    """
+    name, lots, cost, runtime = best_heuristic_plan(nbPeriodes, demandes, couts, cfixes, cstock)
+    model.heuristic = {'name': name, 'cost': cost, 'runtime': runtime}
+    print(f"\nHeuristique {name} : coût = {cost} (en {runtime:.4f} secondes)")
+    return plan_to_col_values(formulation, nbPeriodes, demandes, lots, lean)
+
+
+def _load_arrays(model, col_cost, col_lower, col_upper, 
+                 row_lower, row_upper, row_start, row_index, row_value, 
+                 type_vars):
+    """Loads a model given as NumPy arrays (CSR constraint matrix) in a single addCols/addRows."""
+    num_col = len(col_cost)
+    num_row = len(row_lower)
+    model.addCols(num_col, col_cost, col_lower, col_upper, 
+                  0, np.zeros(num_col, dtype=np.int32), 
+                  np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float64))
+    model.addRows(num_row, row_lower, row_upper, 
+                  len(row_index), row_start, row_index, row_value)
+    if type_vars != hp.HighsVarType.kContinuous:
+        model.changeColsIntegrality(num_col, np.arange(num_col, dtype=np.int32), 
+                                    np.full(num_col, int(type_vars), dtype=np.uint8))
+
+
+def _build(build_model, model_cache, nbPeriodes, demandes, couts, cfixes, cstock, **kwargs):
+    """Builds a model, or loads it from a ModelCache (see modelCache.py) when one is given."""
+    if model_cache is not None:
+        return model_cache.get_model(build_model, nbPeriodes, demandes, couts, cfixes, cstock, **kwargs)
+    return build_model(nbPeriodes, demandes, couts, cfixes, cstock, **kwargs)
+
+
+# ======= MODEL 1 =======
+def build_model_1(nbPeriodes, demandes, 
+                  couts, cfixes, cstock, 
+                  type_vars=hp.HighsVarType.kInteger, 
+                  vectorized=False, 
+                  options=None):
+    """Builds Model 1 (columns: y, x, s) without solving it."""
+    model = new_model(options)
+
+    if vectorized:
+        _build_model_1_arrays(model, nbPeriodes, demandes, couts, cfixes, cstock, type_vars)
+        return model
 
     # ------ VARIABLES ------
     # y_i binary: 0 or 1
@@ -56,39 +188,111 @@ def solve_model_1(nbPeriodes, demandes,
             name=f"setup_production_{i}"
         )
 
-    # --- SOLVE ---
-    #model.write("test.lp")
+    return model
+
 
+def _build_model_1_arrays(model, nbPeriodes, demandes, couts, cfixes, cstock, type_vars):
+    """Array version of Model 1: same columns and rows, loaded in one call."""
+    n = nbPeriodes
+    d = np.asarray(demandes, dtype=np.float64)
+    idx = np.arange(n, dtype=np.int32)
+
+    # ------ VARIABLES / OBJECTIVE ------ y: [0, n), x: [n, 2n), s: [2n, 3n)
+    col_cost = np.concatenate([np.asarray(cfixes, dtype=np.float64), 
+                               np.asarray(couts, dtype=np.float64), 
+                               np.full(n, cstock, dtype=np.float64)])
+    col_lower = np.zeros(3 * n)
+    col_upper = np.concatenate([np.ones(n), np.full(2 * n, hp.kHighsInf)])
+
+    # --- CONSTRAINTS ---
+    # 1. s_i - x_i - s_{i-1} = -d_i  (no s_{i-1} in the first row)
+    bal_index = np.delete(np.stack([2 * n + idx, n + idx, 2 * n + idx - 1], axis=1).ravel(), 2)
+    bal_value = np.delete(np.tile(np.array([1.0, -1.0, -1.0]), n), 2)
+    bal_len = np.where(idx == 0, 2, 3)
+
+    # 2. x_i - M y_i <= 0
+    M = d.sum()  # Big M
+    setup_index = np.stack([n + idx, idx], axis=1)
+    setup_value = np.tile(np.array([1.0, -M]), (n, 1))
+
+    row_index = np.concatenate([bal_index, setup_index.ravel()])
+    row_value = np.concatenate([bal_value, setup_value.ravel()])
+    row_start = np.concatenate([[0], np.cumsum(bal_len)[:-1], 
+                                bal_len.sum() + 2 * idx]).astype(np.int32)
+    row_lower = np.concatenate([-d, np.full(n, -hp.kHighsInf)])
+    row_upper = np.concatenate([-d, np.zeros(n)])
+
+    _load_arrays(model, col_cost, col_lower, col_upper, 
+                 row_lower, row_upper, row_start, row_index, row_value, type_vars)
+
+
+def solve_model_1(nbPeriodes, demandes, 
+                  couts, cfixes, cstock, 
+                  output_flag=True, 
+                  type_vars=hp.HighsVarType.kInteger, 
+                  vectorized=False, 
+                  options=None, 
+                  with_relaxation=False, 
+                  ls_cuts=False, 
+                  warm_start=False, 
+                  telemetry=None, 
+                  model_cache=None, 
+                  horizon_fixing=False):
+    """
+    Builds and solves Model 1, returning the required metrics.
+    with_relaxation: also solve the LP relaxation on the same model (see solve_relaxation_then_mip).
+    ls_cuts: strengthen the model with (l,S) inequalities at the root before solving;
+    the statistics of the cutting-plane loop are stored in model.ls_stats. The relaxation
+    (with_relaxation) stays the one without cuts, the one with cuts is model.rl_cut_obj_val.
+    warm_start: give the best heuristic plan (see heuristics.py) to HiGHS as a MIP start.
+    telemetry: optional SolverTelemetry (see telemetry.py) hooked to the MIP callbacks.
+    model_cache: optional ModelCache (see modelCache.py); the build time is then the load time.
+    horizon_fixing: fix the setups proven 1 or 0 by the planning-horizon results (see
+    planningHorizon.py) before solving; the statistics are stored in model.horizon_stats.
+    """
     start_time = time.time()
-    status = model.optimize()
-    end_time = time.time()
-    runtime = end_time - start_time
+    model = _build(build_model_1, model_cache, nbPeriodes, demandes, couts, cfixes, cstock, 
+                   type_vars=type_vars, vectorized=vectorized, options=options)
+    build_time = time.time() - start_time
 
-    print("\n----------------------------------")
-    info = model.getInfo()
-    model_status = model.getModelStatus()
-    print('Status de la résolution par le solveur = ', model.modelStatusToString(model_status))
-    print("Valeur de la fonction objectif = ", model.getObjectiveValue())
-    print("Meilleure borne inférieure sur la valeur de la fonction objectif: ", info.mip_dual_bound)
-    print("Gap: ", info.mip_gap)
-    print("# de noeuds explorés: ", info.mip_node_count)
-    print("Temps de résolution (en secondes) = ", runtime)
-    print("----------------------------------")
+    if horizon_fixing:
+        model.horizon_stats = fix_setups(model, 0, nbPeriodes, demandes, couts, cfixes, cstock)
+
+    if ls_cuts:
+        model.ls_stats = add_ls_cuts(model, nbPeriodes, demandes)
+
+    mip_start = None
+    if warm_start and type_vars != hp.HighsVarType.kContinuous:
+        mip_start = heuristic_start(model, 1, nbPeriodes, demandes, couts, cfixes, cstock)
+
+    if with_relaxation:
+        lp_bound = model.ls_stats['bound_before'] if ls_cuts else None
+        model_status = solve_relaxation_then_mip(model, build_time, mip_start, telemetry, lp_bound)
+    else:
+        model_status = solve_and_report(model, build_time, mip_start, telemetry)
     
     return model, model_status
 
 # ======= MODEL 2 =======
-def solve_model_2(nbPeriodes, demandes, 
+def build_model_2(nbPeriodes, demandes, 
                   couts, cfixes, cstock, 
-                  output_flag=True, 
-                  type_vars=hp.HighsVarType.kInteger):
-    """Builds and solves Model 1, returning the required metrics."""
-    
-    model = hp.Highs()
-    model.setOptionValue('time_limit', 180)
-    model.setOptionValue('mip_rel_gap', 1e-10)
-    model.setOptionValue('mip_abs_gap', 1)
-    model.setOptionValue('output_flag', True)
+                  type_vars=hp.HighsVarType.kInteger, 
+                  vectorized=False, 
+                  options=None, 
+                  lean=False):
+    """
+    Builds Model 2 (columns: x_ij row-major, then y) without solving it.
+    lean: only the x_ij with i <= j (see _build_model_2_lean); always built from arrays.
+    """
+    model = new_model(options)
+
+    if lean:
+        _build_model_2_lean(model, nbPeriodes, demandes, couts, cfixes, cstock, type_vars)
+        return model
+
+    if vectorized:
+        _build_model_2_arrays(model, nbPeriodes, demandes, couts, cfixes, cstock, type_vars)
+        return model
 
     # ------ VARIABLES ------
     # x_ij binary: 0 or 1
@@ -128,24 +332,417 @@ def solve_model_2(nbPeriodes, demandes,
                 name=f"setup_production_{i}_{j}"
             )
 
-    # --- SOLVE ---
-    #model.write("test.lp")
+    return model
+
+
+def _build_model_2_arrays(model, nbPeriodes, demandes, couts, cfixes, cstock, type_vars):
+    """Array version of Model 2: same columns and rows, loaded in one call."""
+    n = nbPeriodes
+    d = np.asarray(demandes, dtype=np.float64)
+    c = np.asarray(couts, dtype=np.float64)
+
+    # ------ VARIABLES / OBJECTIVE ------ x_ij: i * n + j, y_i: n * n + i
+    i_grid, j_grid = np.indices((n, n))
+    x_cost = np.where(j_grid >= i_grid, 
+                      (c[:, None] + cstock * (j_grid - i_grid)) * d[None, :], 0.0)
+    col_cost = np.concatenate([x_cost.ravel(), np.asarray(cfixes, dtype=np.float64)])
+    col_lower = np.zeros(n * n + n)
+    col_upper = np.ones(n * n + n)
+
+    # --- CONSTRAINTS ---
+    # 1. sum_{i <= j} x_ij = 1 : lower triangle of (j, i), row by row
+    assign_j, assign_i = np.tril_indices(n)
+    assign_index = (assign_i * n + assign_j).astype(np.int32)
+    assign_len = np.arange(1, n + 1)
+
+    # 2. x_ij - y_i <= 0 for i <= j
+    link_i, link_j = np.triu_indices(n)
+    link_index = np.stack([link_i * n + link_j, n * n + link_i], axis=1).astype(np.int32)
+    num_link = len(link_i)
+
+    row_index = np.concatenate([assign_index, link_index.ravel()])
+    row_value = np.concatenate([np.ones(len(assign_index)), 
+                                np.tile(np.array([1.0, -1.0]), num_link)])
+    row_start = np.concatenate([[0], np.cumsum(assign_len)[:-1], 
+                                assign_len.sum() + 2 * np.arange(num_link)]).astype(np.int32)
+    row_lower = np.concatenate([np.ones(n), np.full(num_link, -hp.kHighsInf)])
+    row_upper = np.concatenate([np.ones(n), np.zeros(num_link)])
+
+    _load_arrays(model, col_cost, col_lower, col_upper, 
+                 row_lower, row_upper, row_start, row_index, row_value, type_vars)
+
 
-    start_time = time.time()
-    status = model.optimize()
-    end_time = time.time()
-    runtime = end_time - start_time
+
+# ------ LEAN VARIANT ------
+# Only the x_ij with i <= j are columns, in the order of np.triu_indices (row by row):
+# x_ij is column i*n - i*(i-1)/2 + (j-i), y_i is column n(n+1)/2 + i. Instead of the
+# n(n+1)/2 rows x_ij <= y_i, the model starts with their aggregation per setup,
+#   sum_{j >= i} x_ij <= (n - i) y_i,
+# which is enough for integer y; the violated x_ij <= y_i are then added as cuts
+# (add_linking_cuts) until the relaxation is as tight as the full one.
+
+def lean_index(nbPeriodes, i, j):
+    """Column of x_ij (i <= j) in the lean layout of Model 2."""
+    return i * nbPeriodes - i * (i - 1) // 2 + (j - i)
+
+
+def _build_model_2_lean(model, nbPeriodes, demandes, couts, cfixes, cstock, type_vars):
+    """Lean Model 2: triangular x_ij, assignment rows and aggregated linking rows."""
+    n = nbPeriodes
+    d = np.asarray(demandes, dtype=np.float64)
+    c = np.asarray(couts, dtype=np.float64)
+    t = np.arange(n)
+
+    # ------ VARIABLES / OBJECTIVE ------
+    x_i, x_j = np.triu_indices(n)
+    num_x = len(x_i)
+    col_cost = np.concatenate([(c[x_i] + cstock * (x_j - x_i)) * d[x_j], 
+                               np.asarray(cfixes, dtype=np.float64)])
+    col_lower = np.zeros(num_x + n)
+    col_upper = np.ones(num_x + n)
+
+    # --- CONSTRAINTS ---
+    # 1. sum_{i <= j} x_ij = 1, row j
+    # 2. sum_{j >= i} x_ij - (n - i) y_i <= 0, row n + i
+    entries_row = np.concatenate([x_j, n + x_i, n + t])
+    entries_col = np.concatenate([np.arange(num_x), np.arange(num_x), num_x + t])
+    entries_val = np.concatenate([np.ones(2 * num_x), -(n - t).astype(np.float64)])
+    order = np.argsort(entries_row, kind='stable')
+    row_index = entries_col[order].astype(np.int32)
+    row_value = entries_val[order]
+    row_len = np.bincount(entries_row, minlength=2 * n)
+    row_start = np.concatenate([[0], np.cumsum(row_len)[:-1]]).astype(np.int32)
+    row_lower = np.concatenate([np.ones(n), np.full(n, -hp.kHighsInf)])
+    row_upper = np.concatenate([np.ones(n), np.zeros(n)])
+
+    _load_arrays(model, col_cost, col_lower, col_upper, 
+                 row_lower, row_upper, row_start, row_index, row_value, type_vars)
+
+
+def add_linking_cuts(model, nbPeriodes, max_rounds=100, tol=1e-6):
+    """
+    Root cutting-plane loop on a lean Model 2: solves the LP relaxation, adds the
+    violated x_ij <= y_i and repeats until none is found (or max_rounds).
+    Integrality is restored afterwards. Returns the statistics of the loop as a dict.
+    """
+    n = nbPeriodes
+    x_i, _ = np.triu_indices(n)
+    num_x = len(x_i)
+
+    def separate(col_value):
+        violated = np.flatnonzero(col_value[:num_x] > col_value[num_x + x_i] + tol)
+        if len(violated):
+            # x_ij - y_i <= 0
+            num_row = len(violated)
+            row_index = np.stack([violated, num_x + x_i[violated]], axis=1).ravel().astype(np.int32)
+            model.addRows(num_row, np.full(num_row, -hp.kHighsInf), np.zeros(num_row), 
+                          len(row_index), (2 * np.arange(num_row)).astype(np.int32), 
+                          row_index, np.tile(np.array([1.0, -1.0]), num_row))
+        return len(violated)
+
+    stats = cutting_plane_loop(model, separate, max_rounds)
 
     print("\n----------------------------------")
-    info = model.getInfo()
-    model_status = model.getModelStatus()
-    print('Status de la résolution par le solveur = ', model.modelStatusToString(model_status))
-    print("Valeur de la fonction objectif = ", model.getObjectiveValue())
-    print("Meilleure borne inférieure sur la valeur de la fonction objectif: ", info.mip_dual_bound)
-    print("Gap: ", info.mip_gap)
-    print("# de noeuds explorés: ", info.mip_node_count)
-    print("Temps de résolution (en secondes) = ", runtime)
+    print("Contraintes x_ij <= y_i ajoutées = ", stats['cuts'], " sur ", num_x, " en ", stats['rounds'], " tours")
+    print("Borne de la relaxation avant / après coupes = ", stats['bound_before'], " / ", stats['bound_after'])
+    print("Temps de séparation (en secondes) = ", stats['runtime'])
     print("----------------------------------")
+
+    return stats
+
+
+def solve_model_2(nbPeriodes, demandes, 
+                  couts, cfixes, cstock, 
+                  output_flag=True, 
+                  type_vars=hp.HighsVarType.kInteger, 
+                  vectorized=False, 
+                  options=None, 
+                  with_relaxation=False, 
+                  warm_start=False, 
+                  telemetry=None, 
+                  lean=False, 
+                  model_cache=None, 
+                  horizon_fixing=False):
+    """
+    Builds and solves Model 2, returning the required metrics.
+    with_relaxation: also solve the LP relaxation on the same model (see solve_relaxation_then_mip).
+    warm_start: give the best heuristic plan (see heuristics.py) to HiGHS as a MIP start.
+    telemetry: optional SolverTelemetry (see telemetry.py) hooked to the MIP callbacks.
+    model_cache: optional ModelCache (see modelCache.py); the build time is then the load time.
+    horizon_fixing: fix the setups proven 1 or 0 by the planning-horizon results (see
+    planningHorizon.py) before solving; the statistics are stored in model.horizon_stats.
+    lean: triangular layout with the linking rows added lazily; the statistics of the
+    cutting-plane loop are stored in model.link_stats.
+    """
+    start_time = time.time()
+    model = _build(build_model_2, model_cache, nbPeriodes, demandes, couts, cfixes, cstock, 
+                   type_vars=type_vars, vectorized=vectorized, options=options, lean=lean)
+    build_time = time.time() - start_time
+
+    if horizon_fixing:
+        # y comes after the x_ij in both layouts
+        model.horizon_stats = fix_setups(model, model.getNumCol() - nbPeriodes, 
+                                         nbPeriodes, demandes, couts, cfixes, cstock)
+
+    mip_start = None
+    if lean:
+        model.link_stats = add_linking_cuts(model, nbPeriodes)
+        # the relaxation is integral once no linking row is violated: its solution is optimal
+        col_value = np.asarray(model.getSolution().col_value)
+        if np.all(np.abs(col_value - np.rint(col_value)) <= 1e-6):
+            mip_start = np.rint(col_value)
+        # HiGHS presolve spends most of the time probing the aggregated rows (unless the caller chose)
+        if 'presolve' not in (options or {}):
+            model.setOptionValue('presolve', 'off')
+
+    if warm_start and type_vars != hp.HighsVarType.kContinuous:
+        heuristic = heuristic_start(model, 2, nbPeriodes, demandes, couts, cfixes, cstock, lean)
+        # an integral relaxation is already optimal: keep it unless the heuristic plan is cheaper
+        if mip_start is None or model.heuristic['cost'] < model.link_stats['bound_after'] - 1e-6:
+            mip_start = heuristic
+
+    if with_relaxation:
+        model_status = solve_relaxation_then_mip(model, build_time, mip_start, telemetry)
+    else:
+        model_status = solve_and_report(model, build_time, mip_start, telemetry)
     
     return model, model_status
 
+# ======= MODEL 3 =======
+def shortest_path_arcs(nbPeriodes):
+    """Arcs (i, j), 0 <= i < j <= n, in the column order of Model 3."""
+    return [(i, j) for i in range(nbPeriodes) for j in range(i + 1, nbPeriodes + 1)]
+
+
+def _arc_costs(nbPeriodes, demandes, couts, cstock):
+    """Returns D (cumulative demands) and the function giving the cost of producing in i for i..j-1."""
+    D = [0] * (nbPeriodes + 1)
+    W = [0] * (nbPeriodes + 1)   # W[k] = sum_{t < k} t d_t
+    for t in range(nbPeriodes):
+        D[t + 1] = D[t] + demandes[t]
+        W[t + 1] = W[t] + t * demandes[t]
+
+    def arc_cost(i, j):
+        # sum_{t=i}^{j-1} (c_i + h (t - i)) d_t
+        return couts[i] * (D[j] - D[i]) + cstock * ((W[j] - W[i]) - i * (D[j] - D[i]))
+
+    return D, arc_cost
+
+
+def build_model_3(nbPeriodes, demandes, 
+                  couts, cfixes, cstock, 
+                  type_vars=hp.HighsVarType.kInteger, 
+                  vectorized=False, 
+                  options=None):
+    """
+    Builds Model 3 (columns: y, then z_ij for the arcs of shortest_path_arcs) without solving it.
+    z_ij = 1 if the production of period i covers the demands of i..j-1; a unit flow goes
+    from node 0 to node n. Arcs carrying no demand need no setup.
+    """
+    model = new_model(options)
+
+    if vectorized:
+        _build_model_3_arrays(model, nbPeriodes, demandes, couts, cfixes, cstock, type_vars)
+        return model
+
+    arcs = shortest_path_arcs(nbPeriodes)
+    D, arc_cost = _arc_costs(nbPeriodes, demandes, couts, cstock)
+
+    # ------ VARIABLES ------
+    # y_i binary: 0 or 1
+    y = model.addVariables(nbPeriodes, type=type_vars, lb=0, ub=1, name_prefix="y")
+
+    # z_ij binary: production in i covers i..j-1
+    z = model.addVariables(arcs, type=type_vars, lb=0, ub=1, name_prefix="z")
+
+    # ------ OBJECTIVE ------
+    model.setObjective(
+        sum(cfixes[i] * y[i] for i in range(nbPeriodes)) +
+        sum(arc_cost(i, j) * z[i, j] for (i, j) in arcs),
+        sense=hp.ObjSense.kMinimize
+    )
+
+    # --- CONSTRAINTS ---
+    # 1. Flow conservation: one unit leaves node 0, nodes 1..n-1 are balanced
+    model.addConstr(
+        sum(z[0, j] for j in range(1, nbPeriodes + 1)) == 1, 
+        name="flow_0"
+    )
+    for k in range(1, nbPeriodes):
+        model.addConstr(
+            sum(z[i, k] for i in range(k)) == sum(z[k, j] for j in range(k + 1, nbPeriodes + 1)), 
+            name=f"flow_{k}"
+        )
+
+    # 2. Production only if setup: sum_{j > i} z_ij <= y_i
+    for i in range(nbPeriodes):
+        producing = [z[i, j] for j in range(i + 1, nbPeriodes + 1) if D[j] > D[i]]
+        if producing:
+            model.addConstr(
+                sum(producing) <= y[i], 
+                name=f"setup_production_{i}"
+            )
+
+    return model
+
+
+def _build_model_3_arrays(model, nbPeriodes, demandes, couts, cfixes, cstock, type_vars):
+    """Array version of Model 3: same columns, loaded in one call."""
+    n = nbPeriodes
+    d = np.asarray(demandes, dtype=np.float64)
+    t = np.arange(n)
+    D = np.concatenate([[0.0], np.cumsum(d)])
+    W = np.concatenate([[0.0], np.cumsum(t * d)])
+
+    # ------ VARIABLES / OBJECTIVE ------ y_i: i, z_ij: n + position in shortest_path_arcs
+    arc_i, arc_j = np.triu_indices(n + 1, k=1)
+    dem = D[arc_j] - D[arc_i]
+    arc_cost = (np.asarray(couts, dtype=np.float64)[arc_i] * dem + 
+                cstock * ((W[arc_j] - W[arc_i]) - arc_i * dem))
+    num_arc = len(arc_i)
+    col_cost = np.concatenate([np.asarray(cfixes, dtype=np.float64), arc_cost])
+    col_lower = np.zeros(n + num_arc)
+    col_upper = np.ones(n + num_arc)
+    arc_col = n + np.arange(num_arc)
+
+    # --- CONSTRAINTS ---
+    # 1. Flow conservation, row k for node k < n: out-arcs +1, in-arcs -1 ; rhs 1 for node 0
+    # 2. sum_{j > i, D_ij > 0} z_ij - y_i <= 0, row n + i (n + 1 + i before dropping node n)
+    producing = dem > 0
+    entries_row = np.concatenate([arc_i, arc_j, n + 1 + arc_i[producing], n + 1 + t])
+    entries_col = np.concatenate([arc_col, arc_col, arc_col[producing], t])
+    entries_val = np.concatenate([np.ones(num_arc), -np.ones(num_arc), 
+                                  np.ones(producing.sum()), -np.ones(n)])
+    keep = entries_row != n   # no row for node n (implied)
+    entries_row = np.where(entries_row > n, entries_row - 1, entries_row)[keep]
+    entries_col = entries_col[keep]
+    entries_val = entries_val[keep]
+
+    order = np.lexsort((entries_col, entries_row))
+    row_index = entries_col[order].astype(np.int32)
+    row_value = entries_val[order]
+    row_len = np.bincount(entries_row, minlength=2 * n)
+    row_start = np.concatenate([[0], np.cumsum(row_len)[:-1]]).astype(np.int32)
+    flow_rhs = np.zeros(n)
+    flow_rhs[0] = 1.0
+    row_lower = np.concatenate([flow_rhs, np.full(n, -hp.kHighsInf)])
+    row_upper = np.concatenate([flow_rhs, np.zeros(n)])
+
+    _load_arrays(model, col_cost, col_lower, col_upper, 
+                 row_lower, row_upper, row_start, row_index, row_value, type_vars)
+
+
+def solve_model_3(nbPeriodes, demandes, 
+                  couts, cfixes, cstock, 
+                  output_flag=True, 
+                  type_vars=hp.HighsVarType.kInteger, 
+                  vectorized=False, 
+                  options=None, 
+                  with_relaxation=False, 
+                  warm_start=False, 
+                  telemetry=None, 
+                  model_cache=None):
+    """
+    Builds and solves Model 3, returning the required metrics.
+    Its LP relaxation is integral, so HiGHS closes the MIP at the root node.
+    warm_start: give the best heuristic plan (see heuristics.py) to HiGHS as a MIP start.
+    telemetry: optional SolverTelemetry (see telemetry.py) hooked to the MIP callbacks.
+    model_cache: optional ModelCache (see modelCache.py); the build time is then the load time.
+    """
+    start_time = time.time()
+    model = _build(build_model_3, model_cache, nbPeriodes, demandes, couts, cfixes, cstock, 
+                   type_vars=type_vars, vectorized=vectorized, options=options)
+    build_time = time.time() - start_time
+
+    mip_start = None
+    if warm_start and type_vars != hp.HighsVarType.kContinuous:
+        mip_start = heuristic_start(model, 3, nbPeriodes, demandes, couts, cfixes, cstock)
+
+    if with_relaxation:
+        model_status = solve_relaxation_then_mip(model, build_time, mip_start, telemetry)
+    else:
+        model_status = solve_and_report(model, build_time, mip_start, telemetry)
+    
+    return model, model_status
+
+# ======= DYNAMIC PROGRAMMING (WAGNER-WHITIN) =======
+class DPResult:
+    """
+    Result of solve_dp, exposing the subset of the hp.Highs interface used by
+    process_all_files_in_directory and the print helpers.
+    Columns follow the layout of Model 1: y (setups), x (production), s (stock).
+    """
+
+    def __init__(self, objective, y_values, x_values, s_values):
+        self.objective = objective
+        self.col_value = list(y_values) + list(x_values) + list(s_values)
+
+    def getObjectiveValue(self):
+        return self.objective
+
+    def getInfo(self):
+        return SimpleNamespace(objective_function_value=self.objective,
+                               mip_dual_bound=self.objective,
+                               mip_gap=0.0,
+                               mip_node_count=0)
+
+    def getSolution(self):
+        return SimpleNamespace(col_value=self.col_value)
+
+    def modelStatusToString(self, model_status):
+        return hp.Highs().modelStatusToString(model_status)
+
+
+def solve_dp(nbPeriodes, demandes, 
+             couts, cfixes, cstock, 
+             output_flag=True, 
+             type_vars=hp.HighsVarType.kInteger, 
+             options=None, 
+             with_relaxation=False, 
+             telemetry=None):
+    """
+    Solves the instance exactly with the Wagner-Whitin recursion, as a drop-in
+    replacement for solve_model_1/solve_model_2. type_vars is ignored: the LP
+    relaxation of the assignment formulation (Model 2) is integral for the ULS,
+    so the optimum is also the relaxation value (model.rl_obj_val when with_relaxation).
+    options (HiGHS settings) and telemetry (no MIP callbacks) are ignored.
+    """
+    start_time = time.time()
+    objective, succ = wagner_whitin(nbPeriodes, demandes, couts, cfixes, cstock)
+    y_values, x_values, s_values = plan_from_successors(nbPeriodes, demandes, succ)
+    end_time = time.time()
+    runtime = end_time - start_time
+
+    model = DPResult(objective, y_values, x_values, s_values)
+    if with_relaxation:
+        model.rl_obj_val = objective
+    model_status = hp.HighsModelStatus.kOptimal
+
+    if output_flag:
+        print("\n----------------------------------")
+        print('Status de la résolution par programmation dynamique = ', model.modelStatusToString(model_status))
+        print("Valeur de la fonction objectif = ", objective)
+        print("Temps de résolution (en secondes) = ", runtime)
+        print("----------------------------------")
+
+    return model, model_status
+
+
+def solve_dp_batch(demandes, couts, cfixes, cstock, output_flag=True):
+    """
+    Solves a batch of demand scenarios sharing couts, cfixes and cstock: demandes is a
+    (scenarios x periods) array. Returns the optimal costs and the setups (boolean
+    array) of every scenario; see wagner_whitin_batch.
+    """
+    start_time = time.time()
+    costs, setups = wagner_whitin_batch(demandes, couts, cfixes, cstock)
+    runtime = time.time() - start_time
+
+    if output_flag:
+        print("\n----------------------------------")
+        print("Nombre de scénarios résolus = ", len(costs))
+        print("Coût moyen = ", costs.mean())
+        print("Temps de résolution (en secondes) = ", runtime)
+        print("----------------------------------")
+
+    return costs, setups
@@ -0,0 +1,82 @@
+import time
+import numpy as np
+
+# ======= PLANNING HORIZONS AND SETUP FIXING =======
+# Dominance results computed from the instance arrays only, with p_k = c_k - h k (the
+# unit cost of producing in k for a later period t is p_k + h t):
+#   - regeneration: if d_i > 0 and every earlier period k of the current subhorizon
+#     serves d_i at a higher cost, (p_k - p_i) d_i > f_i, then every optimal plan
+#     produces in i (moving d_i to i pays for the setup). Some optimal plan (zero
+#     inventory ordering) has no stock entering i: y_i = 1 and a new, independent
+#     subhorizon starts in i. Period 0 with d_0 > 0 is the first one.
+#   - inside a subhorizon, y_i = 0 when no demand is left from i to its end, when
+#     d_i = 0, p_{i+1} <= p_i and f_{i+1} <= f_i (a setup in i moves to i+1 at no
+#     extra cost), or when the subhorizon starts with a fixed setup s and p_s <= p_i
+#     (the production of i moves to s at no extra cost). The first period of a
+#     subhorizon is never fixed to 0 (Model 2 needs it).
+# Some optimal plan satisfies all these fixings at once, so they keep the optimum.
+
+def planning_horizons(nbPeriodes, demandes, couts, cfixes, cstock):
+    """
+    Returns a dict with the subhorizons [(start, end)], the periods whose setup is
+    fixed to 1 and to 0, and the computing time. O(n).
+    """
+    start_time = time.time()
+    n = nbPeriodes
+    d = np.asarray(demandes, dtype=np.float64)
+    f = np.asarray(cfixes, dtype=np.float64)
+    p = np.asarray(couts, dtype=np.float64) - cstock * np.arange(n)
+
+    # --- REGENERATION POINTS (y_i = 1) ---
+    fix_one, starts = [], []
+    best = np.inf    # min p_k over the current subhorizon, k < i
+    for i in range(n):
+        if d[i] > 0 and (best - p[i]) * d[i] > f[i]:
+            fix_one.append(i)
+            starts.append(i)
+            best = p[i]
+        else:
+            best = min(best, p[i])
+    if not starts or starts[0] != 0:
+        starts = [0] + starts
+    blocks = list(zip(starts, starts[1:] + [n]))
+
+    # --- DOMINATED SETUPS (y_i = 0) ---
+    fix_zero = []
+    for start, end in blocks:
+        fixed_start = d[start] > 0
+        remaining = 0.0
+        for i in range(end - 1, start, -1):
+            remaining += d[i]
+            if (remaining == 0 or (fixed_start and p[start] <= p[i]) or 
+                    (d[i] == 0 and i + 1 < end and p[i + 1] <= p[i] and f[i + 1] <= f[i])):
+                fix_zero.append(i)
+    fix_zero.sort()
+
+    return {
+        'blocks': blocks,
+        'fix_one': fix_one,
+        'fix_zero': fix_zero,
+        'runtime': time.time() - start_time
+    }
+
+
+def fix_setups(model, y_offset, nbPeriodes, demandes, couts, cfixes, cstock):
+    """
+    Fixes the bounds of the setup columns y_i (y_0 at column y_offset) of a built model
+    from planning_horizons. Returns the statistics, also printed. When setup costs are
+    high compared with the demands (as on Instances_ULS), little more than y_0 is fixed.
+    """
+    horizons = planning_horizons(nbPeriodes, demandes, couts, cfixes, cstock)
+    for fixed, value in ((horizons['fix_one'], 1.0), (horizons['fix_zero'], 0.0)):
+        if fixed:
+            cols = (y_offset + np.asarray(fixed)).astype(np.int32)
+            bounds = np.full(len(cols), value)
+            model.changeColsBounds(len(cols), cols, bounds, bounds)
+
+    eliminated = len(horizons['fix_one']) + len(horizons['fix_zero'])
+    print(f"\nPrétraitement (horizons de planification) : {len(horizons['fix_one'])} setups fixés à 1, "
+          f"{len(horizons['fix_zero'])} fixés à 0, {len(horizons['blocks'])} sous-horizons")
+    print(f"Binaires éliminées avant le branch-and-bound : {eliminated} / {nbPeriodes} "
+          f"(en {horizons['runtime']:.4f} secondes)")
+    return dict(horizons, eliminated=eliminated)
@@ -0,0 +1,199 @@
+import time
+import queue
+import contextlib
+import multiprocessing
+import numpy as np
+import highspy as hp
+
+from engines import ENGINES
+from solution import Solution
+from heuristics import plan_to_col_values
+
+# ======= PORTFOLIO RACE =======
+# Runs several engines on the same instance, one process each. Through their MIP
+# callbacks they publish every improving incumbent (its cost and its production
+# periods) and their dual bound in shared memory. An engine whose own incumbent is worse
+# than the shared one receives it, mapped onto its column layout, as a user solution
+# (MIP user-solution callback), so it prunes with the best plan found by any engine.
+# As soon as the best incumbent meets the best bound (whoever found them) or an engine
+# reports an optimum, the race is over and the others are killed.
+# Model 2 forces a setup in period 0 (no other period can serve it): when d_0 = 0 it
+# solves a restriction, so its bound is not shared and its optimum does not end the race.
+
+def _publish(shared, obj_val, producing):
+    """Makes a plan (cost, production periods) the shared incumbent if it is the best so far."""
+    incumbent, plan, version = shared[:3]
+    with incumbent.get_lock():
+        if obj_val < incumbent.value:
+            incumbent.value = obj_val
+            plan[:] = np.asarray(producing, dtype=np.float64)
+            version.value += 1
+
+
+class _RaceHook:
+    """Stands in for a SolverTelemetry: shares incumbent and bound, stops once they meet."""
+
+    def __init__(self, shared, formulation, demandes, share_bound, poll_interval=0.05):
+        self.shared = shared
+        self.incumbent, self.plan, self.version, self.bound, self.done, self.abs_gap = shared
+        self.formulation = formulation
+        self.demandes = demandes
+        self.share_bound = share_bound
+        self.poll_interval = poll_interval
+        self.injected = 0    # shared plans given to this engine
+        self._last_poll = -poll_interval
+        self._seen = 0       # version of the shared plan last looked at
+
+    def attach(self, model):
+        n = len(self.demandes)
+        self.lean = self.formulation == 2 and model.getNumCol() == n * (n + 1) // 2 + n
+        model.cbMipImprovingSolution.subscribe(self._on_incumbent)
+        model.cbMipInterrupt.subscribe(self._on_interrupt)
+        model.cbMipUserSolution.subscribe(self._on_user_solution)
+
+    def _on_incumbent(self, e):
+        solution = Solution.from_columns(self.formulation, len(self.demandes), e.data_out.mip_solution,
+                                         self.demandes)
+        _publish(self.shared, e.data_out.objective_function_value, solution.production > 1e-9)
+
+    def _on_user_solution(self, e):
+        if self.version.value == self._seen:
+            return
+        with self.incumbent.get_lock():
+            self._seen = self.version.value
+            value = self.incumbent.value
+            producing = np.asarray(self.plan[:]) > 0.5
+        if value >= e.data_out.mip_primal_bound - 1e-9:
+            # this engine already has a plan as good
+            return
+        n = len(self.demandes)
+        starts = np.flatnonzero(producing).tolist()
+        if not starts or starts[0] != 0:
+            # the periods before the first production have no demand
+            starts = [0] + starts
+        lots = list(zip(starts, starts[1:] + [n]))
+        e.data_in.setSolution(plan_to_col_values(self.formulation, n, self.demandes, lots, self.lean))
+        self.injected += 1
+
+    def _on_interrupt(self, e):
+        if e.data_out.running_time - self._last_poll < self.poll_interval:
+            return
+        self._last_poll = e.data_out.running_time
+        if self.share_bound:
+            with self.bound.get_lock():
+                self.bound.value = max(self.bound.value, e.data_out.mip_dual_bound)
+        if self.done.is_set() or self.incumbent.value - self.bound.value <= self.abs_gap:
+            e.interrupt()
+
+
+def _race_worker(engine, instance, options, shared, results):
+    """Runs one engine of the race and puts its result in the results queue."""
+    incumbent, _, _, bound, done, _ = shared
+    formulation, solve_model = ENGINES[engine]
+    nbPeriodes, demandes, couts, cfixes, cstock = instance
+    share_bound = not (formulation == 2 and demandes[0] == 0)
+    hook = _RaceHook(shared, formulation, demandes, share_bound)
+
+    start_time = time.time()
+    with contextlib.redirect_stdout(None):
+        model, model_status = solve_model(nbPeriodes, demandes, couts, cfixes, cstock,
+                                          options=options, telemetry=hook)
+    runtime = time.time() - start_time
+
+    status = model.modelStatusToString(model_status)
+    result = {'engine': engine, 'status': status, 'obj_val': model.getObjectiveValue(),
+              'dual_bound': model.getInfo().mip_dual_bound, 'runtime': runtime,
+              'exact': share_bound, 'injected': hook.injected}
+    if len(model.getSolution().col_value):
+        solution = Solution.from_model(model, formulation, nbPeriodes, demandes)
+        result['setups'] = (np.flatnonzero(solution.setups > 0.5) + 1).tolist()
+        _publish(shared, result['obj_val'], solution.production > 1e-9)
+    if model_status == hp.HighsModelStatus.kOptimal and share_bound:
+        with bound.get_lock():
+            bound.value = max(bound.value, result['obj_val'])
+        done.set()
+    results.put(result)
+
+
+def race(nbPeriodes, demandes, couts, cfixes, cstock, engines=('1', '2'), time_limit=180,
+         options=None):
+    """
+    Races the given engines (keys of engines.ENGINES) on one instance.
+    Returns a dict with the winner (first optimum, or best incumbent), its result, whether
+    it is proven optimal (possibly by the bound of another engine),
+    the per-engine results and timings, and the time saved over running the same engines
+    one after the other: the sum of their runtimes minus the race time (an engine killed
+    at the end of the race counts for the race time, a lower bound on its runtime).
+    """
+    instance = (nbPeriodes, list(demandes), list(couts), list(cfixes), cstock)
+    options = dict(options or {}, output_flag=False, time_limit=time_limit, threads=1)
+    integral = all(float(v).is_integer() for v in [*instance[1], *instance[2], *instance[3], cstock])
+    incumbent, bound = multiprocessing.Value('d', np.inf), multiprocessing.Value('d', -np.inf)
+    done = multiprocessing.Event()
+    abs_gap = 1 - 1e-6 if integral else 1e-6
+    # the plan and its version are guarded by the lock of the incumbent value
+    shared = (incumbent, multiprocessing.Array('d', nbPeriodes, lock=False),
+              multiprocessing.Value('i', 0, lock=False), bound, done, abs_gap)
+    results = multiprocessing.Queue()
+
+    start_time = time.time()
+    processes = {engine: multiprocessing.Process(target=_race_worker,
+                                                 args=(engine, instance, options, shared, results))
+                 for engine in engines}
+    for process in processes.values():
+        process.start()
+
+    finished = {}
+    winner = None
+    while len(finished) < len(processes):
+        try:
+            result = results.get(timeout=0.1)
+        except queue.Empty:
+            # an engine that died without a result is out of the race
+            for engine, process in processes.items():
+                if engine not in finished and not process.is_alive() and process.exitcode != 0:
+                    finished[engine] = {'engine': engine, 'status': 'Failed', 'runtime': time.time() - start_time}
+            continue
+        finished[result['engine']] = result
+        if result['status'] == 'Optimal' and result['exact']:
+            winner = result
+            break
+    wall_time = time.time() - start_time
+
+    # the race is over: stop the engines still running
+    done.set()
+    for engine, process in processes.items():
+        if engine not in finished:
+            process.kill()
+            finished[engine] = {'engine': engine, 'status': 'Killed', 'runtime': wall_time}
+        process.join()
+
+    if winner is None:
+        # no proven optimum: keep the best incumbent (e.g. all hit the time limit)
+        candidates = [r for r in finished.values() if 'setups' in r]
+        winner = min(candidates, key=lambda r: r['obj_val']) if candidates else None
+    best_bound = bound.value
+    # an incumbent meeting the bound of another engine is optimal as well
+    proven = winner is not None and winner['obj_val'] - best_bound <= abs_gap
+    time_saved = max(0.0, sum(r['runtime'] for r in finished.values()) - wall_time)
+
+    print("\n----------------------------------")
+    for engine in engines:
+        r = finished[engine]
+        print(f"Moteur {engine:<7}: {r['status']:<20} {r.get('obj_val', float('nan'))} "
+              f"({r['runtime']:.3f} s)")
+    if winner:
+        print(f"Vainqueur : moteur {winner['engine']} ({winner['status']}), objectif = {winner['obj_val']}"
+              f"{' (optimalité prouvée)' if proven else ''}")
+    print("Meilleure borne partagée = ", best_bound)
+    print("Temps de la course (en secondes) = ", wall_time)
+    print("Temps économisé (au moins, en secondes) = ", time_saved)
+    print("----------------------------------")
+
+    return {'winner': winner['engine'] if winner else None,
+            'result': winner,
+            'engines': finished,
+            'best_bound': best_bound,
+            'proven': proven,
+            'wall_time': wall_time,
+            'time_saved': time_saved}
@@ -1,32 +1,9 @@
 # ======= READ DATA FILE =======
-datafileName = './Instances_ULS/Toy_Instance.txt'
+from helperFunctions import read_data
 
-with open(datafileName, "r") as file:
-    line = file.readline()  
-    lineTab = line.split()    
-    nbPeriodes = int(lineTab[0])
-    
-    line = file.readline()  
-    lineTab = line.split()
-    demandes = []
-    for i in range(nbPeriodes):
-        demandes.append(int(lineTab[i]))
-        
-    line = file.readline()  
-    lineTab = line.split()
-    couts = []
-    for i in range(nbPeriodes):
-        couts.append(int(lineTab[i]))
+datafileName = './Instances_ULS/Toy_Instance.txt'
 
-    line = file.readline()  
-    lineTab = line.split()
-    cfixes = []
-    for i in range(nbPeriodes):
-        cfixes.append(int(lineTab[i]))
-    
-    line = file.readline()  
-    lineTab = line.split()    
-    cstock = int(lineTab[0])
+nbPeriodes, demandes, couts, cfixes, cstock = read_data(datafileName)
 
 # ======= DONNÉES =======
 # print(f"Nombre de périodes (n) : {nbPeriodes}") 
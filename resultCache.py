@@ -0,0 +1,124 @@
+import os
+import json
+import hashlib
+import functools
+
+# ======= RESULT CACHE =======
+# One JSON file per solve, named after a SHA-256 of everything that determines the
+# result: instance file contents, formulation, variable type and solver options.
+# The number and size of the entries are counted as they are written; once max_entries /
+# max_bytes is exceeded, the least recently used entries are evicted down to 90% of the
+# limits, so that the directory is only listed once in a while.
+
+def formulation_name(solve_model):
+    """Stable name of a solve function, including the arguments bound by functools.partial."""
+    if isinstance(solve_model, functools.partial):
+        bound = json.dumps({'args': solve_model.args, 'kwargs': solve_model.keywords},
+                           sort_keys=True, default=str)
+        return f"{formulation_name(solve_model.func)}{bound}"
+    return f"{solve_model.__module__}.{solve_model.__qualname__}"
+
+
+class ResultCache:
+    """Persistent, size-bounded cache of solve results keyed by content hash."""
+
+    def __init__(self, cache_dir='./.uls_cache', max_entries=10000, max_bytes=None):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+        # number and total size of the entries, counted on the first put
+        self._count = None
+        self._bytes = None
+
+    def make_key(self, datafileName, solve_model, var_type, options=None):
+        """Hash of the instance contents, the formulation, the variable type and the options."""
+        digest = hashlib.sha256()
+        with open(datafileName, "rb") as file:
+            digest.update(file.read())
+        digest.update(formulation_name(solve_model).encode())
+        digest.update(str(var_type).encode())
+        # the number of threads changes the solve time, not the result
+        options = {k: v for k, v in (options or {}).items() if k != 'threads'}
+        digest.update(json.dumps(options, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        """Returns the cached record, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "r") as file:
+                record = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        # mark as recently used for the eviction order
+        os.utime(path)
+        return record
+
+    def put(self, key, record):
+        """Stores a record (atomically) and evicts old entries if the cache is too large."""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(record, file)
+        size = os.path.getsize(tmp_path)
+        try:
+            old_size = os.path.getsize(path)
+        except FileNotFoundError:
+            old_size = None
+        os.replace(tmp_path, path)
+
+        if self._count is None:
+            self._count, self._bytes = self._scan_count()
+        else:
+            self._count += old_size is None
+            self._bytes += size - (old_size or 0)
+        if self._over(1.0):
+            self._evict()
+
+    def invalidate(self, key=None):
+        """Removes one entry, or the whole cache when key is None."""
+        keys = [key] if key is not None else [name[:-5] for name in os.listdir(self.cache_dir)
+                                              if name.endswith(".json")]
+        for k in keys:
+            try:
+                os.remove(self._path(k))
+            except FileNotFoundError:
+                pass
+        self._count = self._bytes = None
+
+    def _over(self, fraction):
+        return ((self.max_entries is not None and self._count > fraction * self.max_entries) or
+                (self.max_bytes is not None and self._bytes > fraction * self.max_bytes))
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".json"):
+                try:
+                    stat = os.stat(os.path.join(self.cache_dir, name))
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+        return entries
+
+    def _scan_count(self):
+        entries = self._entries()
+        return len(entries), sum(size for _, size, _ in entries)
+
+    def _evict(self):
+        # other processes may share the directory: recount before evicting
+        entries = sorted(self._entries())
+        self._count, self._bytes = len(entries), sum(size for _, size, _ in entries)
+        # the entry just written (the most recent) is kept
+        while len(entries) > 1 and self._over(0.9):
+            _, size, name = entries.pop(0)
+            self._count -= 1
+            self._bytes -= size
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                pass
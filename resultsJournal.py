@@ -0,0 +1,51 @@
+import os
+import json
+
+from resultCache import formulation_name
+
+# ======= RESULTS JOURNAL =======
+# Append-only JSON Lines file with one report row per solved instance, written and
+# fsynced as soon as the instance is done, so an interrupted sweep keeps everything
+# solved so far. Rows are tagged with the formulation; on reload the last row of an
+# (instance, formulation) pair wins and a line cut by a crash is ignored.
+
+class ResultsJournal:
+    """Per-instance results of a sweep, persisted line by line."""
+
+    def __init__(self, journal_path):
+        self.journal_path = journal_path
+        directory = os.path.dirname(journal_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # end a line cut by a crash, so that the next row starts on its own line
+        if os.path.exists(journal_path) and os.path.getsize(journal_path):
+            with open(journal_path, "rb+") as file:
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    file.write(b"\n")
+
+    def append(self, result, solve_model=None):
+        """Writes one report row (see _merge_passes) and flushes it to disk."""
+        record = dict(result)
+        if solve_model is not None:
+            record['formulation'] = formulation_name(solve_model)
+        with open(self.journal_path, "a") as file:
+            file.write(json.dumps(record) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    def load(self, solve_model=None):
+        """Journaled rows by instance file name (only those of solve_model if given)."""
+        formulation = formulation_name(solve_model) if solve_model is not None else None
+        rows = {}
+        if not os.path.exists(self.journal_path):
+            return rows
+        with open(self.journal_path, "r") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if formulation is None or record.get('formulation') == formulation:
+                    rows[record['filename']] = record
+        return rows
@@ -0,0 +1,178 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+from modelisations import solve_model_1, solve_model_2, solve_model_3, solve_dp
+from wagnerWhitin import wagner_whitin
+from heuristics import plan_cost
+from planningHorizon import planning_horizons
+from solution import Solution
+
+# ======= ROLLING HORIZON =======
+# Solves a long horizon as a sequence of windows of `window` periods: the last
+# `overlap` periods of a window only serve as lookahead, the lots starting before
+# them are committed. A committed lot may cover periods beyond the commit point
+# (inventory carried over), so the next window starts at the first period left
+# uncovered.
+# With n_workers > 1, the horizon is cut into blocks of window - overlap periods,
+# solved independently (in parallel) with `overlap` periods of lookback and lookahead;
+# each block keeps the setups falling in its own periods. Any set of setups gives a
+# feasible plan (each production covers the demands up to the next setup), so the
+# setups of all blocks are merged into one.
+# The plan is compared with the Wagner-Whitin optimum, a global lower bound.
+
+ENGINES = {'1': solve_model_1, '2': solve_model_2, '3': solve_model_3, 'dp': solve_dp}
+# column layout of each engine (see Solution.from_columns)
+LAYOUTS = {'1': 1, '2': 2, '3': 3, 'dp': 1}
+
+
+def solve_window(formulation, start, end, demandes, couts, cfixes, cstock, options=None, 
+                 horizon_fixing=False):
+    """
+    Solves periods start..end-1 (no entering inventory); returns its lots in absolute periods.
+    horizon_fixing: fix the setups of the window from planningHorizon.py (Models 1 and 2).
+    """
+    n = end - start
+    kwargs = {'horizon_fixing': True} if horizon_fixing else {}
+    model, model_status = ENGINES[formulation](n, demandes[start:end], couts[start:end],
+                                               cfixes[start:end], cstock, options=options, **kwargs)
+    if len(model.getSolution().col_value) == 0:
+        raise RuntimeError(f"Aucune solution pour la fenêtre {start}..{end - 1} "
+                           f"({model.modelStatusToString(model_status)})")
+    solution = Solution.from_model(model, LAYOUTS[formulation], n, demandes[start:end])
+
+    # lots start where something is produced (a setup without production, e.g. at zero
+    # setup cost, is not a lot); in an optimal plan each production covers the demands
+    # up to the next one
+    producing = (start + np.flatnonzero(solution.production > 1e-9)).tolist()
+    if not producing or producing[0] != start:
+        producing = [start] + producing
+    lots = list(zip(producing, producing[1:] + [end]))
+
+    # Model 2 forces a setup in the first period (no other period can serve it): with a
+    # zero demand there, its optimum is only exact among the plans producing in start.
+    # The others are the plans of start+1..end-1: keep the cheaper of the two.
+    if formulation == '2' and demandes[start] == 0 and n > 1:
+        later = [(start, start + 1)] + solve_window(formulation, start + 1, end, demandes, couts,
+                                                    cfixes, cstock, options, horizon_fixing)
+        if (plan_cost(end, demandes, couts, cfixes, cstock, later) < 
+                plan_cost(end, demandes, couts, cfixes, cstock, lots)):
+            lots = later
+    return lots
+
+
+def _solve_block(task):
+    """Entry point of the worker processes: solves a block with its margins, keeps its own setups."""
+    formulation, block_start, block_end, start, end, demandes, couts, cfixes, cstock, options = task
+    lots = solve_window(formulation, start, end, demandes, couts, cfixes, cstock, options)
+    return [i for i, _ in lots if block_start <= i < block_end]
+
+
+def solve_rolling_horizon(nbPeriodes, demandes, couts, cfixes, cstock,
+                          formulation='2', window=60, overlap=20, n_workers=1, options=None):
+    """
+    Rolling-horizon plan with any formulation ('1', '2', '3' or 'dp').
+    Returns a dict with the plan (lots (i, j): production in i covers i..j-1), its cost,
+    the global lower bound, the gap (%), the number of windows and the runtime.
+    """
+    if not 0 <= overlap < window:
+        raise ValueError("Il faut 0 <= overlap < window")
+    start_time = time.time()
+    step = window - overlap
+
+    if n_workers <= 1:
+        lots = []
+        t = 0
+        windows = 0
+        while t < nbPeriodes:
+            end = min(t + window, nbPeriodes)
+            commit_end = end if end == nbPeriodes else t + step
+            committed = [(i, j) for i, j in
+                         solve_window(formulation, t, end, demandes, couts, cfixes, cstock, options)
+                         if i < commit_end]
+            lots += committed
+            t = committed[-1][1]
+            windows += 1
+    else:
+        threads = max(1, (os.cpu_count() or 1) // n_workers)
+        options = dict(options or {}, threads=threads)
+        tasks = [(formulation, t, min(t + step, nbPeriodes), 
+                  max(t - overlap, 0), min(t + step + overlap, nbPeriodes), 
+                  demandes, couts, cfixes, cstock, options)
+                 for t in range(0, nbPeriodes, step)]
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            setups = sorted({0}.union(*executor.map(_solve_block, tasks)))
+        lots = list(zip(setups, setups[1:] + [nbPeriodes]))
+        windows = len(tasks)
+
+    cost = plan_cost(nbPeriodes, demandes, couts, cfixes, cstock, lots)
+    lower_bound, _ = wagner_whitin(nbPeriodes, demandes, couts, cfixes, cstock)
+    gap = (cost - lower_bound) / cost * 100 if cost else 0.0
+    runtime = time.time() - start_time
+
+    print("\n----------------------------------")
+    print(f"Horizon glissant (modèle {formulation}, fenêtre {window}, recouvrement {overlap}) : {windows} fenêtres")
+    print("Coût du plan = ", cost)
+    print("Borne inférieure globale (Wagner-Whitin) = ", lower_bound)
+    print(f"Gap = {gap:.4f} %")
+    print("Temps total (en secondes) = ", runtime)
+    print("----------------------------------")
+
+    return {'lots': lots, 'cost': cost, 'lower_bound': lower_bound, 'gap': gap,
+            'windows': windows, 'runtime': runtime}
+
+
+# ======= INDEPENDENT SUBHORIZONS =======
+# Exact counterpart of the decomposition above: the regeneration points proven by
+# planningHorizon.py cut the horizon into subproblems without entering inventory,
+# solved independently (in parallel with n_workers > 1) and simply concatenated.
+
+def _solve_subhorizon(task):
+    """Entry point of the worker processes: solves one subhorizon with its setups fixed."""
+    formulation, start, end, demandes, couts, cfixes, cstock, options = task
+    return solve_window(formulation, start, end, demandes, couts, cfixes, cstock, options,
+                        horizon_fixing=formulation in ('1', '2'))
+
+
+def solve_subhorizons(nbPeriodes, demandes, couts, cfixes, cstock, formulation='2', 
+                      n_workers=1, options=None):
+    """
+    Optimal plan through the planning-horizon decomposition, any formulation ('1', '2',
+    '3' or 'dp'; the setups are fixed in the subproblems of Models 1 and 2).
+    Returns a dict with the plan, its cost, the subhorizons, the fixed setups, the
+    number of binaries eliminated before branch-and-bound and the runtime.
+    """
+    start_time = time.time()
+    horizons = planning_horizons(nbPeriodes, demandes, couts, cfixes, cstock)
+    blocks = horizons['blocks']
+    tasks = [(formulation, start, end, demandes, couts, cfixes, cstock, options)
+             for start, end in blocks]
+
+    if n_workers <= 1:
+        lots = [lot for task in tasks for lot in _solve_subhorizon(task)]
+    else:
+        threads = max(1, (os.cpu_count() or 1) // n_workers)
+        tasks = [task[:-1] + (dict(options or {}, threads=threads),) for task in tasks]
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            lots = [lot for block_lots in executor.map(_solve_subhorizon, tasks) for lot in block_lots]
+
+    # setups fixed in the subproblems, and for Model 2 the x_ij (i <= j) linking two subhorizons
+    eliminated = len(horizons['fix_one']) + len(horizons['fix_zero']) if formulation in ('1', '2') else 0
+    if formulation == '2':
+        eliminated += nbPeriodes * (nbPeriodes + 1) // 2 - sum((end - start) * (end - start + 1) // 2
+                                                              for start, end in blocks)
+    cost = plan_cost(nbPeriodes, demandes, couts, cfixes, cstock, lots)
+    runtime = time.time() - start_time
+
+    print("\n----------------------------------")
+    print(f"Décomposition en sous-horizons (modèle {formulation}) : {len(blocks)} sous-horizons, "
+          f"le plus long de {max(end - start for start, end in blocks)} périodes")
+    print(f"Setups fixés : {len(horizons['fix_one'])} à 1, {len(horizons['fix_zero'])} à 0")
+    print("Binaires éliminées avant le branch-and-bound = ", eliminated)
+    print("Coût du plan = ", cost)
+    print("Temps total (en secondes) = ", runtime)
+    print("----------------------------------")
+
+    return {'lots': lots, 'cost': cost, 'blocks': blocks, 'fix_one': horizons['fix_one'],
+            'fix_zero': horizons['fix_zero'], 'eliminated': eliminated, 'runtime': runtime}
@@ -0,0 +1,123 @@
+import csv
+import json
+import numpy as np
+
+# ======= SOLUTION =======
+# Column-oriented view of a ULS plan, whatever the formulation that produced it:
+# setups (y), production (x) and inventory (s) as arrays of length n, and the
+# assignment of the demand of period j to the production of period i as two
+# parallel arrays of pairs (assign_i, assign_j). Exports write whole columns at once.
+
+class Solution:
+    """Plan of one instance: setups, production, inventory and assignment pairs."""
+
+    def __init__(self, setups, production, inventory, assign_i, assign_j, objective=None):
+        self.setups = np.asarray(setups, dtype=np.float64)
+        self.production = np.asarray(production, dtype=np.float64)
+        self.inventory = np.asarray(inventory, dtype=np.float64)
+        self.assign_i = np.asarray(assign_i, dtype=np.int64)
+        self.assign_j = np.asarray(assign_j, dtype=np.int64)
+        self.objective = objective
+
+    def __len__(self):
+        return len(self.setups)
+
+    @classmethod
+    def from_columns(cls, formulation, nbPeriodes, col_value, demandes=None, objective=None):
+        """
+        Reads the column layout of a formulation (see plan_to_col_values):
+        1 (and solve_dp): y, x, s ; 2: x_ij (full n x n or lean i <= j), y ; 3: y, z_ij.
+        Production and inventory of Models 2 and 3 need the demands (NaN otherwise).
+        """
+        n = nbPeriodes
+        col_value = np.asarray(col_value, dtype=np.float64)
+        d = (np.asarray(demandes, dtype=np.float64) if demandes is not None
+             else np.full(n, np.nan))
+
+        if formulation == 1:
+            y, x, s = col_value[0:n], col_value[n:2 * n], col_value[2 * n:3 * n]
+            # each period is served by the last production up to it
+            producing = np.flatnonzero(x > 1e-9)
+            source = np.searchsorted(producing, np.arange(n), side='right') - 1
+            served = source >= 0
+            return cls(y, x, s, producing[source[served]], np.flatnonzero(served), objective)
+
+        if formulation == 2:
+            y = col_value[-n:]
+            if len(col_value) == n * n + n:
+                # the x_ij with i > j are free, costless columns: the solver may set them
+                assign_i, assign_j = np.nonzero(np.triu(col_value[0:n * n].reshape(n, n) > 0.5))
+            else:
+                x_i, x_j = np.triu_indices(n)
+                taken = col_value[0:n * (n + 1) // 2] > 0.5
+                assign_i, assign_j = x_i[taken], x_j[taken]
+        elif formulation == 3:
+            y = col_value[0:n]
+            arc_i, arc_j = np.triu_indices(n + 1, k=1)
+            taken = col_value[n:n + len(arc_i)] > 0.5
+            # arc (i, j) serves the periods i..j-1
+            lengths = arc_j[taken] - arc_i[taken]
+            assign_i = np.repeat(arc_i[taken], lengths)
+            assign_j = assign_i + (np.arange(lengths.sum()) -
+                                   np.repeat(np.cumsum(lengths) - lengths, lengths))
+        else:
+            raise ValueError(f"Formulation inconnue : {formulation}")
+
+        x = np.bincount(assign_i, weights=d[assign_j], minlength=n)
+        return cls(y, x, np.cumsum(x - d), assign_i, assign_j, objective)
+
+    @classmethod
+    def from_model(cls, model, formulation, nbPeriodes, demandes=None):
+        """Solution of a solved model (hp.Highs or DPResult)."""
+        return cls.from_columns(formulation, nbPeriodes, model.getSolution().col_value,
+                                demandes, model.getObjectiveValue())
+
+    # ------ PLAN VIEW ------
+    def coverage(self):
+        """Last period served by each period's production (-1 if none)."""
+        last = np.full(len(self), -1)
+        np.maximum.at(last, self.assign_i, self.assign_j)
+        return last
+
+    def plan_view(self):
+        """Per-period table (setup, production, inventory, periods covered) as one string."""
+        last = self.coverage()
+        lines = [f"| {'Mois':<5} | {'y_i (Setup)':<12} | {'x_i (Prod.)':<12} | {'s_i (Stock)':<12} | {'Couverture':<12} |",
+                 "-" * 66]
+        for t, (y_t, x_t, s_t, j) in enumerate(zip(self.setups.tolist(), self.production.tolist(),
+                                                    self.inventory.tolist(), last.tolist())):
+            couverture = f"{t+1}..{j+1}" if j >= 0 else "-"
+            lines.append(f"| {t+1:<5} | {abs(y_t):<12.0f} | {x_t:<12.2f} | {s_t:<12.2f} | {couverture:<12} |")
+        return "\n".join(lines)
+
+    # ------ EXPORTS ------
+    def columns(self):
+        """Per-period columns as a dict of arrays."""
+        return {
+            'period': np.arange(1, len(self) + 1),
+            'setup': np.rint(self.setups).astype(np.int64),
+            'production': self.production,
+            'inventory': self.inventory,
+            'covered_until': self.coverage() + 1
+        }
+
+    def to_csv(self, path):
+        """Writes the per-period plan as CSV (one row per period)."""
+        columns = self.columns()
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(columns.keys())
+            writer.writerows(zip(*(column.tolist() for column in columns.values())))
+
+    def to_json(self, path):
+        """Writes the per-period columns, the assignment pairs and the objective as JSON."""
+        record = {name: column.tolist() for name, column in self.columns().items()}
+        record['assignments'] = np.stack([self.assign_i + 1, self.assign_j + 1], axis=1).tolist()
+        record['objective'] = self.objective
+        with open(path, "w") as file:
+            json.dump(record, file)
+
+    def to_parquet(self, path):
+        """Writes the per-period plan as Parquet (needs pandas and pyarrow)."""
+        import pandas as pd
+        pd.DataFrame(self.columns()).to_parquet(path, index=False)
@@ -0,0 +1,276 @@
+import sys
+import json
+import time
+import uuid
+import asyncio
+import argparse
+import contextlib
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+from engines import ENGINES
+from instanceStore import parse_instances
+from solution import Solution
+
+# ======= LOCAL SOLVE SERVICE =======
+# Long-running asyncio server (HTTP on TCP or on a Unix socket) handing instances to a
+# pool of worker processes that have already imported highspy:
+#   POST   /solve        {"id"?, "engine"?, "time_limit"?, "instance": {...} or "text": "..."}
+#   DELETE /solve/<id>   cancels a queued or running request
+#   GET    /metrics      queue depth, running / completed / failed / cancelled, latencies
+#   GET    /health
+# At most `workers` solves run at once, further requests wait in the queue (up to
+# max_queue, then 503). A running HiGHS solve is stopped through its MIP interrupt
+# callback, polled against a shared cancellation flag.
+
+class _CancelHook:
+    """Stands in for a SolverTelemetry: interrupts the MIP once the flag is set."""
+
+    def __init__(self, cancel_event, poll_interval=0.1):
+        self.cancel_event = cancel_event
+        self.poll_interval = poll_interval
+        self._last_poll = -poll_interval
+
+    def attach(self, model):
+        model.cbMipInterrupt.subscribe(self._on_interrupt)
+
+    def _on_interrupt(self, e):
+        if e.data_out.running_time - self._last_poll < self.poll_interval:
+            return
+        self._last_poll = e.data_out.running_time
+        if self.cancel_event.is_set():
+            e.interrupt()
+
+
+def _finite(value):
+    """JSON has no inf / nan: a missing incumbent or bound is sent as null."""
+    return value if np.isfinite(value) else None
+
+
+def _solve_request(engine, instance, time_limit, cancel_event):
+    """Runs in a worker process: solves one instance and returns a JSON-ready result."""
+    formulation, solve_model = ENGINES[engine]
+    nbPeriodes, demandes, couts, cfixes, cstock = instance
+    options = {'output_flag': False, 'time_limit': time_limit, 'threads': 1}
+
+    start_time = time.time()
+    with contextlib.redirect_stdout(None):
+        model, model_status = solve_model(nbPeriodes, demandes, couts, cfixes, cstock,
+                                          options=options, telemetry=_CancelHook(cancel_event))
+    runtime = time.time() - start_time
+
+    info = model.getInfo()
+    result = {
+        'status': model.modelStatusToString(model_status),
+        'obj_val': _finite(model.getObjectiveValue()),
+        'dual_bound': _finite(info.mip_dual_bound),
+        'gap': _finite(info.mip_gap),
+        'node_count': info.mip_node_count,
+        'runtime': runtime
+    }
+    if len(model.getSolution().col_value):
+        solution = Solution.from_model(model, formulation, nbPeriodes, demandes)
+        result['setups'] = (np.flatnonzero(solution.setups > 0.5) + 1).tolist()
+        result['production'] = solution.production.tolist()
+    return result
+
+
+def _parse_instance(payload):
+    """Instance of a request, as (nbPeriodes, demandes, couts, cfixes, cstock)."""
+    if 'text' in payload:
+        n, d, c, f, h = parse_instances(payload['text'])[0]
+        return n, d.tolist(), c.tolist(), f.tolist(), h
+    instance = payload['instance']
+    return (int(instance['nbPeriodes']), list(instance['demandes']), list(instance['couts']),
+            list(instance['cfixes']), instance['cstock'])
+
+
+class SolveService:
+    """Request queue, worker pool and metrics of the service."""
+
+    def __init__(self, workers=2, max_queue=100, default_time_limit=60, grace=5):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.default_time_limit = default_time_limit
+        self.grace = grace
+        # workers are started on demand, while connections are open: forked ones would
+        # inherit the client sockets and keep them open after the response
+        self.executor = ProcessPoolExecutor(max_workers=workers,
+                                            mp_context=multiprocessing.get_context('forkserver'))
+        self.manager = multiprocessing.Manager()
+        self.semaphore = asyncio.Semaphore(workers)
+        self.cancel_events = {}
+        self.queued = 0
+        self.running = 0
+        self.counts = {'completed': 0, 'failed': 0, 'cancelled': 0, 'rejected': 0}
+        self.latencies = deque(maxlen=1000)
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+        self.manager.shutdown()
+
+    # ------ REQUESTS ------
+    async def solve(self, payload):
+        """Returns (HTTP status, result dict) for a /solve request."""
+        if self.queued >= self.max_queue:
+            self.counts['rejected'] += 1
+            return 503, {'error': "file d'attente pleine"}
+        try:
+            if not isinstance(payload, dict):
+                raise TypeError("la requête doit être un objet JSON")
+            engine = payload.get('engine', 'dp')
+            if engine not in ENGINES:
+                raise ValueError(f"moteur inconnu : {engine}")
+            instance = _parse_instance(payload)
+            job_id = str(payload.get('id') or uuid.uuid4())
+            time_limit = float(payload.get('time_limit', self.default_time_limit))
+            if not time_limit > 0:
+                raise ValueError(f"time_limit invalide : {time_limit}")
+        except (KeyError, ValueError, TypeError, AttributeError, IndexError) as error:
+            return 400, {'error': str(error)}
+        if job_id in self.cancel_events:
+            return 409, {'error': f"requête déjà en cours : {job_id}"}
+
+        cancel_event = self.manager.Event()
+        self.cancel_events[job_id] = cancel_event
+        start_time = time.perf_counter()
+        self.queued += 1
+        started = False
+        try:
+            async with self.semaphore:
+                self.queued -= 1
+                started = True
+                if cancel_event.is_set():
+                    self.counts['cancelled'] += 1
+                    return 200, {'id': job_id, 'status': 'Cancelled'}
+                self.running += 1
+                try:
+                    return 200, await self._run(job_id, engine, instance, time_limit, cancel_event)
+                finally:
+                    self.running -= 1
+        finally:
+            if not started:
+                self.queued -= 1
+            self.cancel_events.pop(job_id, None)
+            self.latencies.append(time.perf_counter() - start_time)
+
+    async def _run(self, job_id, engine, instance, time_limit, cancel_event):
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, _solve_request,
+                                      engine, instance, time_limit, cancel_event)
+        try:
+            # HiGHS stops at time_limit; the interrupt is a safety net past the grace period
+            result = await asyncio.wait_for(asyncio.shield(future), time_limit + self.grace)
+        except asyncio.TimeoutError:
+            cancel_event.set()
+            result = await future
+        except Exception as error:
+            self.counts['failed'] += 1
+            return {'id': job_id, 'status': 'Failed', 'error': str(error)}
+        self.counts['cancelled' if cancel_event.is_set() else 'completed'] += 1
+        return dict(result, id=job_id, engine=engine)
+
+    def cancel(self, job_id):
+        cancel_event = self.cancel_events.get(job_id)
+        if cancel_event is None:
+            return 404, {'error': f"requête inconnue : {job_id}"}
+        cancel_event.set()
+        return 200, {'id': job_id, 'cancelling': True}
+
+    def metrics(self):
+        latencies = np.array(self.latencies)
+        return 200, {
+            'queue_depth': self.queued,
+            'running': self.running,
+            'workers': self.workers,
+            **self.counts,
+            'latency_mean': float(latencies.mean()) if len(latencies) else None,
+            'latency_p50': float(np.percentile(latencies, 50)) if len(latencies) else None,
+            'latency_p95': float(np.percentile(latencies, 95)) if len(latencies) else None
+        }
+
+    # ------ HTTP ------
+    async def route(self, method, path, body):
+        if method == 'POST' and path == '/solve':
+            try:
+                payload = json.loads(body or b'{}')
+            except ValueError:
+                return 400, {'error': "JSON invalide"}
+            return await self.solve(payload)
+        if method == 'DELETE' and path.startswith('/solve/'):
+            return self.cancel(path[len('/solve/'):])
+        if method == 'GET' and path == '/metrics':
+            return self.metrics()
+        if method == 'GET' and path == '/health':
+            return 200, {'status': 'ok'}
+        return 404, {'error': f"route inconnue : {method} {path}"}
+
+    async def handle(self, reader, writer):
+        """One HTTP/1.1 request per connection; any unexpected error is answered with a 500."""
+        try:
+            try:
+                request_line = (await reader.readline()).decode().split()
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode().strip()
+                    if not line:
+                        break
+                    name, _, value = line.partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                if len(request_line) < 2:
+                    status, response = 400, {'error': "requête HTTP invalide"}
+                else:
+                    status, response = await self.route(request_line[0], request_line[1], body)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+            except Exception as error:
+                status, response = 500, {'error': f"erreur interne : {error}"}
+
+            data = json.dumps(response, allow_nan=False).encode()
+            reason = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 409: 'Conflict',
+                      500: 'Internal Server Error', 503: 'Service Unavailable'}[status]
+            writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+                         f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode() + data)
+            with contextlib.suppress(ConnectionError):
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+async def serve(host='127.0.0.1', port=8765, unix_path=None, workers=2, max_queue=100,
+                default_time_limit=60):
+    """Runs the service until interrupted."""
+    service = SolveService(workers, max_queue, default_time_limit)
+    if unix_path is not None:
+        server = await asyncio.start_unix_server(service.handle, path=unix_path)
+        print(f"Service de résolution à l'écoute sur {unix_path}")
+    else:
+        server = await asyncio.start_server(service.handle, host, port)
+        print(f"Service de résolution à l'écoute sur http://{host}:{port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Service local de résolution ULS")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="socket Unix (à la place de TCP)")
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--max-queue', type=int, default=100)
+    parser.add_argument('--time-limit', type=float, default=60, help="limite par défaut par requête (s)")
+    args = parser.parse_args(argv)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers, args.max_queue,
+                          args.time_limit))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
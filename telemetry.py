@@ -0,0 +1,89 @@
+import os
+import json
+import time
+import resource
+
+# ======= SOLVER TELEMETRY =======
+# Writes a JSONL trace per solve: one line per event, flushed as it happens, so a
+# running solve can be followed with `tail -f`.
+#   {"event": "incumbent", ...}  every improving MIP solution (HiGHS callback)
+#   {"event": "sample", ...}     incumbent / dual bound / gap / nodes, at most every
+#                                sample_interval seconds (MIP interrupt callback)
+#   {"event": "phase", ...}      duration of parse / build / solve / extract
+#   {"event": "summary", ...}    final metrics and peak memory of the process
+# The peak memory is the resident set high-water mark of the whole process (ru_maxrss):
+# with several solves in one process it covers all the solves so far, not this one only.
+
+def _finite(value):
+    """JSON has no infinity: unbounded values are written as null."""
+    return value if value is not None and abs(value) != float('inf') else None
+
+
+class SolverTelemetry:
+    """Timeline of one solve, written to trace_path as JSON lines."""
+
+    def __init__(self, trace_path, instance=None, sample_interval=1.0):
+        """sample_interval: seconds between two samples; None records the incumbents only."""
+        self.trace_path = trace_path
+        self.instance = instance
+        self.sample_interval = sample_interval
+        self.phases = {}
+        self._last_sample = None
+        self._start = time.time()
+        directory = os.path.dirname(trace_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # a new solve replaces the trace of an earlier run (same trace_dir)
+        self._file = open(trace_path, "w")
+
+    def _write(self, event, **fields):
+        record = {'event': event, 'instance': self.instance,
+                  'timestamp': time.time(), 'elapsed': time.time() - self._start}
+        record.update(fields)
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    # ------ HIGHS CALLBACKS ------
+    def attach(self, model):
+        """Subscribes the MIP callbacks of a Highs model (before optimize/run)."""
+        model.cbMipImprovingSolution.subscribe(self._on_incumbent)
+        if self.sample_interval is not None:
+            model.cbMipInterrupt.subscribe(self._on_interrupt)
+
+    def _on_incumbent(self, e):
+        out = e.data_out
+        self._write('incumbent',
+                    running_time=out.running_time,
+                    incumbent=_finite(out.objective_function_value),
+                    dual_bound=_finite(out.mip_dual_bound),
+                    gap=_finite(out.mip_gap),
+                    nodes=out.mip_node_count)
+
+    def _on_interrupt(self, e):
+        out = e.data_out
+        if self._last_sample is not None and out.running_time - self._last_sample < self.sample_interval:
+            return
+        self._last_sample = out.running_time
+        primal = _finite(out.mip_primal_bound)
+        dual = _finite(out.mip_dual_bound)
+        gap = (primal - dual) / abs(primal) if primal and dual is not None else None
+        self._write('sample',
+                    running_time=out.running_time,
+                    incumbent=primal,
+                    dual_bound=dual,
+                    gap=gap,
+                    nodes=out.mip_node_count)
+
+    # ------ PHASES ------
+    def phase(self, name, duration):
+        """Records the duration (in seconds) of a phase."""
+        self.phases[name] = duration
+        self._write('phase', phase=name, duration=duration)
+
+    def close(self, **summary):
+        """Writes the summary line (final metrics, phases, process peak memory) and closes the trace."""
+        # ru_maxrss is in kilobytes on Linux
+        process_peak_memory_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        self._write('summary', phases=self.phases, process_peak_memory_mb=process_peak_memory_mb,
+                    **{k: _finite(v) if isinstance(v, float) else v for k, v in summary.items()})
+        self._file.close()
@@ -0,0 +1,22 @@
+import itertools
+
+# ======= BRUTE-FORCE REFERENCE =======
+# Enumerates every setup vector of a small instance. Some optimal plan produces in a
+# setup period exactly the demands up to the next setup (zero inventory ordering), so
+# the cheapest such plan over all setup vectors is the optimum.
+
+def plan_cost(nbPeriodes, demandes, couts, cfixes, cstock, setups):
+    """Cost of the zero inventory plan with the given setups, inf if it is infeasible."""
+    starts = [i for i in range(nbPeriodes) if setups[i]]
+    if sum(demandes[:starts[0] if starts else nbPeriodes]) > 0:
+        return float('inf')
+    cost = 0
+    for i, j in zip(starts, starts[1:] + [nbPeriodes]):
+        cost += cfixes[i] + sum((couts[i] + cstock * (t - i)) * demandes[t] for t in range(i, j))
+    return cost
+
+
+def brute_force(nbPeriodes, demandes, couts, cfixes, cstock):
+    """Returns the optimal cost and the setups (0/1 tuple) of a cheapest plan."""
+    return min((plan_cost(nbPeriodes, demandes, couts, cfixes, cstock, setups), setups)
+               for setups in itertools.product((0, 1), repeat=nbPeriodes))
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from costSweep import PARAMETERS, sweep_costs, _breakpoints
+from wagnerWhitin import plan_from_successors, wagner_whitin
+
+rng = np.random.default_rng(0)
+N = 40
+D = rng.integers(1, 50, N).tolist()
+C = rng.integers(1, 10, N).tolist()
+F = rng.integers(50, 500, N).tolist()
+CSTOCKS = [1, 2, 3]
+
+
+def _row(cstock, setups, optimal=True):
+    return {'cstock': cstock, 'cfixes_scale': 1.0, 'couts_scale': 1.0, 'setups': setups,
+            'optimal': optimal, 'time_limit': not optimal}
+
+
+def test_optimal_sweep_matches_wagner_whitin():
+    result = sweep_costs(N, D, C, F, CSTOCKS)
+    for row in result['table']:
+        assert row['optimal'] and not row['time_limit']
+        assert row['cost'] == pytest.approx(wagner_whitin(N, D, C, F, row['cstock'])[0])
+    assert result['breakpoints']
+
+
+def test_time_limited_points_are_marked_and_not_breakpoints():
+    result = sweep_costs(N, D, C, F, CSTOCKS, options={'time_limit': 0.0})
+    assert all(row['time_limit'] and not row['optimal'] for row in result['table'])
+    assert result['breakpoints'] == []
+
+
+def test_breakpoints_skip_non_optimal_points():
+    rows = [_row(1, [0]), _row(2, [0, 5], optimal=False), _row(3, [0, 7])]
+    assert _breakpoints(rows, CSTOCKS, (1.0,), (1.0,)) == []
+    rows[1]['optimal'] = True
+    assert len(_breakpoints(rows, CSTOCKS, (1.0,), (1.0,))) == 2
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_breakpoints_of_a_full_grid_match_wagner_whitin(n_workers):
+    # continuous costs: every grid point has a single optimal plan
+    rng = np.random.default_rng(1)
+    n = 12
+    d = rng.integers(1, 50, n).tolist()
+    c = rng.uniform(1, 10, n)
+    f = rng.uniform(50, 500, n)
+    axes = ([0.5, 1.0, 2.0, 4.0], [0.25, 1.0, 3.0], [0.5, 1.0, 2.0])
+
+    setups = {}
+    for cstock in axes[0]:
+        for cfixes_scale in axes[1]:
+            for couts_scale in axes[2]:
+                _, succ = wagner_whitin(n, d, (c * couts_scale).tolist(), (f * cfixes_scale).tolist(), cstock)
+                y, _, _ = plan_from_successors(n, d, succ)
+                setups[cstock, cfixes_scale, couts_scale] = {t for t in range(n) if y[t]}
+    expected = []
+    for point, before in setups.items():
+        for axis, values in enumerate(axes):
+            k = values.index(point[axis])
+            if k + 1 < len(values):
+                to = point[:axis] + (values[k + 1],) + point[axis + 1:]
+                if setups[to] != before:
+                    expected.append((axis, point, to, sorted(setups[to] - before), sorted(before - setups[to])))
+
+    result = sweep_costs(n, d, c, f, *axes, n_workers=n_workers)
+    assert len(result['table']) == len(setups)
+    for row in result['table']:
+        point = (row['cstock'], row['cfixes_scale'], row['couts_scale'])
+        assert set(row['setups']) == setups[point], point
+    found = [(PARAMETERS.index(b['parameter']), b['from'], b['to'], b['added'], b['removed'])
+             for b in result['breakpoints']]
+    assert sorted(found) == sorted(expected)
+    assert {axis for axis, *_ in expected} == {0, 1, 2}
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from bruteForce import brute_force
+from dualAscent import dual_ascent_bound
+
+
+def _instance(seed):
+    """Small instance with zero demands (but d_0 > 0), and zero setup costs in some periods."""
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 10))
+    d = rng.integers(0, 60, n)
+    d[rng.random(n) < 0.3] = 0
+    d[0] = rng.integers(1, 60)
+    c = rng.integers(0, 12, n)
+    f = rng.integers(0, 200, n)
+    f[rng.random(n) < 0.3] = 0
+    return n, d.tolist(), c.tolist(), f.tolist(), int(rng.integers(0, 4))
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_bound_is_the_brute_force_optimum(seed):
+    n, d, c, f, h = _instance(seed)
+    bound, _, _ = dual_ascent_bound(n, d, c, f, h)
+    assert bound == pytest.approx(brute_force(n, d, c, f, h)[0])
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_multipliers_are_dual_feasible(seed):
+    n, d, c, f, h = _instance(seed)
+    bound, v, w = dual_ascent_bound(n, d, c, f, h)
+    i, j = np.indices((n, n))
+    cost = (np.asarray(c)[i] + h * (j - i)) * np.asarray(d)[j]
+
+    assert bound == pytest.approx(v.sum())
+    assert np.all(w >= 0) and np.all(w[i > j] == 0)
+    assert np.all((w >= v[j] - cost - 1e-9)[i <= j])
+    assert np.all(w.sum(axis=1) <= np.asarray(f) + 1e-9)
@@ -0,0 +1,44 @@
+import functools
+
+import pytest
+
+from helperFunctions import solve_instance, process_all_files_in_directory
+from modelisations import solve_model_1, solve_model_2, solve_model_3
+
+INSTANCE = "\n".join(["6", "10 0 30 25 5 40", "3 4 2 5 3 2", "50 40 60 30 45 35", "1"]) + "\n"
+
+
+@pytest.fixture
+def instances(tmp_path):
+    directory = tmp_path / "instances"
+    directory.mkdir()
+    (directory / "inst.txt").write_text(INSTANCE)
+    return directory
+
+
+@pytest.mark.parametrize("solve_model", [solve_model_1, functools.partial(solve_model_3, vectorized=True)])
+def test_fast_rl_refuses_other_formulations(instances, tmp_path, solve_model):
+    with pytest.raises(ValueError):
+        solve_instance(str(instances / "inst.txt"), solve_model, fast_rl=True)
+    with pytest.raises(ValueError):
+        process_all_files_in_directory(str(instances), solve_model, str(tmp_path / "table.tex"), 
+                                       "caption", "tab:test", fast_rl=True)
+
+
+@pytest.mark.parametrize("solve_model", [solve_model_2, functools.partial(solve_model_2, vectorized=True)])
+def test_fast_rl_matches_the_lp_of_model_2(instances, solve_model):
+    fast = solve_instance(str(instances / "inst.txt"), solve_model, {'output_flag': False}, fast_rl=True)
+    lp = solve_instance(str(instances / "inst.txt"), solve_model, {'output_flag': False})
+    assert fast['rl_obj_val'] == pytest.approx(lp['rl_obj_val'])
+    assert fast['gap'] == pytest.approx(lp['gap'], abs=1e-6)
+
+
+@pytest.mark.parametrize("reuse_model", [False, True])
+def test_ls_cuts_report_the_plain_relaxation(instances, reuse_model):
+    datafileName = str(instances / "inst.txt")
+    plain = solve_instance(datafileName, solve_model_1, {'output_flag': False})
+    cut = solve_instance(datafileName, functools.partial(solve_model_1, ls_cuts=True), 
+                         {'output_flag': False}, reuse_model)
+    assert cut['rl_obj_val'] == pytest.approx(plain['rl_obj_val'])
+    assert cut['gap'] == pytest.approx(plain['gap'])
+    assert cut['rl_cut_obj_val'] >= cut['rl_obj_val'] - 1e-6
@@ -0,0 +1,90 @@
+import contextlib
+
+import numpy as np
+import pytest
+
+import bruteForce
+from heuristics import HEURISTICS, best_heuristic_plan, plan_cost, plan_to_col_values
+from modelisations import build_model_1, build_model_2, build_model_3
+
+OPTIONS = {'output_flag': False, 'threads': 1}
+
+
+def _instance(seed):
+    """Small instance with zero demands (but d_0 > 0), and zero setup costs in some periods."""
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 10))
+    d = rng.integers(0, 60, n)
+    d[rng.random(n) < 0.3] = 0
+    d[0] = rng.integers(1, 60)
+    c = rng.integers(0, 12, n)
+    f = rng.integers(0, 200, n)
+    f[rng.random(n) < 0.3] = 0
+    return n, d.tolist(), c.tolist(), f.tolist(), int(rng.integers(0, 4))
+
+
+def _setups(nbPeriodes, demandes, lots):
+    setups = [0] * nbPeriodes
+    for i, j in lots:
+        setups[i] = int(sum(demandes[i:j]) > 0)
+    return setups
+
+
+@pytest.mark.parametrize("seed", range(40))
+@pytest.mark.parametrize("name", list(HEURISTICS))
+def test_plans_are_feasible_and_not_below_the_optimum(seed, name):
+    n, d, c, f, h = _instance(seed)
+    lots = HEURISTICS[name](n, d, c, f, h)
+    # consecutive lots covering 0..n-1
+    assert lots[0][0] == 0 and lots[-1][1] == n
+    assert all(i < j for i, j in lots)
+    assert all(j == k for (_, j), (k, _) in zip(lots, lots[1:]))
+
+    cost = plan_cost(n, d, c, f, h, lots)
+    assert cost == bruteForce.plan_cost(n, d, c, f, h, _setups(n, d, lots))
+    assert cost >= bruteForce.brute_force(n, d, c, f, h)[0]
+
+
+def test_best_plan_is_the_cheapest_heuristic():
+    for seed in range(20):
+        n, d, c, f, h = _instance(seed)
+        name, lots, cost, _ = best_heuristic_plan(n, d, c, f, h)
+        costs = {key: plan_cost(n, d, c, f, h, heuristic(n, d, c, f, h)) for key, heuristic in HEURISTICS.items()}
+        assert cost == min(costs.values()) == costs[name]
+        assert plan_cost(n, d, c, f, h, lots) == cost
+
+
+@pytest.mark.parametrize("formulation, build_model, kwargs", [
+    (1, build_model_1, {}),
+    (2, build_model_2, {}),
+    (2, build_model_2, {'lean': True}),
+    (3, build_model_3, {}),
+])
+def test_columns_are_a_feasible_point_of_the_model(formulation, build_model, kwargs):
+    for seed in range(20):
+        n, d, c, f, h = _instance(seed)
+        name, lots, cost, _ = best_heuristic_plan(n, d, c, f, h)
+        col = plan_to_col_values(formulation, n, d, lots, **kwargs)
+
+        # fix every column to the mapped plan: the model must stay feasible, at the plan cost
+        model = build_model(n, d, c, f, h, vectorized=True, options=OPTIONS, **kwargs)
+        assert model.getNumCol() == len(col)
+        model.changeColsBounds(len(col), np.arange(len(col), dtype=np.int32), col, col)
+        with contextlib.redirect_stdout(None):
+            model.run()
+        assert model.modelStatusToString(model.getModelStatus()) == 'Optimal', (seed, name)
+        assert model.getObjectiveValue() == pytest.approx(cost)
+
+
+@pytest.mark.parametrize("lean", [False, True])
+def test_model_2_columns_with_leading_zero_demands(lean):
+    # Model 2 serves the periods before the first demand with a setup in period 0
+    n, d, c, f, h = 5, [0, 0, 20, 0, 10], [1, 2, 1, 3, 1], [30, 40, 25, 50, 20], 1
+    lots = [(0, 1), (1, 2), (2, 4), (4, 5)]
+    col = plan_to_col_values(2, n, d, lots, lean=lean)
+    model = build_model_2(n, d, c, f, h, vectorized=True, options=OPTIONS, lean=lean)
+    model.changeColsBounds(len(col), np.arange(len(col), dtype=np.int32), col, col)
+    with contextlib.redirect_stdout(None):
+        model.run()
+    assert model.modelStatusToString(model.getModelStatus()) == 'Optimal'
+    assert model.getObjectiveValue() == pytest.approx(plan_cost(n, d, c, f, h, lots) + f[0])
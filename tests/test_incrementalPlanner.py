@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from incrementalPlanner import IncrementalPlanner
+from wagnerWhitin import wagner_whitin
+
+OPTIONS = {'output_flag': False, 'threads': 1}
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_every_resolve_matches_wagner_whitin(seed):
+    rng = np.random.default_rng(seed)
+    n = 10
+    d = rng.integers(1, 60, n).astype(float)
+    c = rng.integers(1, 12, n).astype(float)
+    f = rng.integers(50, 300, n).astype(float)
+    h = 2.0
+
+    planner = IncrementalPlanner(n, d, c, f, h, options=OPTIONS)
+    planner.solve()
+    assert planner.model.getObjectiveValue() == pytest.approx(wagner_whitin(n, d, c, f, h)[0])
+
+    for step in range(4):
+        changes = {int(j): float(rng.integers(0, 120)) for j in rng.choice(n, 3, replace=False)}
+        planner.update_demands(changes)
+        for j, value in changes.items():
+            d[j] = value
+        if step % 2:
+            h = float(rng.integers(0, 5))
+            cfixes = {int(i): float(rng.integers(50, 300)) for i in rng.choice(n, 2, replace=False)}
+            planner.update_costs(cfixes=cfixes, cstock=h)
+            for i, value in cfixes.items():
+                f[i] = value
+        else:
+            couts = {int(i): float(rng.integers(1, 12)) for i in rng.choice(n, 2, replace=False)}
+            planner.update_costs(couts=couts)
+            for i, value in couts.items():
+                c[i] = value
+        planner.solve()
+        # Model 2 needs a setup in period 0 when d_0 = 0 (it solves a restriction)
+        expected = wagner_whitin(n, d, c, f, h)[0]
+        if d[0] == 0:
+            assert planner.model.getObjectiveValue() >= expected - 1e-6
+        else:
+            assert planner.model.getObjectiveValue() == pytest.approx(expected)
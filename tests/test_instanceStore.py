@@ -0,0 +1,68 @@
+import os
+
+import numpy as np
+import pytest
+
+from helperFunctions import read_data
+from instanceStore import InstanceStore, load_directory, parse_instances
+
+TOY = "3\n5 0 7\n1 2 3\n10 20 30\n1\n"
+SECOND = "2\n4 6\n3 3\n8 9\n2\n"
+
+
+def test_parse_instances_reads_every_instance():
+    instances = parse_instances(TOY + SECOND)
+    assert len(instances) == 2
+    n, d, c, f, h = instances[0]
+    assert n == 3 and d.tolist() == [5, 0, 7] and c.tolist() == [1, 2, 3] and f.tolist() == [10, 20, 30] and h == 1
+    assert instances[1][0] == 2 and instances[1][4] == 2
+
+
+@pytest.mark.parametrize("text", ["3\n5 x 7\n1 2 3\n10 20 30\n1\n", "3\n5 0 7\n1 2.5 3\n10 20 30\n1\n",
+                                  "3\n5 0 7\n1 2 3\n10 20\n", "0\n", "-2 1 1 1 1 1 1 1\n"])
+def test_parse_instances_rejects_malformed_text(text):
+    with pytest.raises(ValueError):
+        parse_instances(text)
+
+
+def test_read_data_on_an_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("\n")
+    with pytest.raises(ValueError, match="Aucune instance"):
+        read_data(str(path))
+
+
+def _write(directory, name, text, mtime):
+    path = directory / name
+    path.write_text(text)
+    os.utime(path, (mtime, mtime))
+
+
+def test_store_round_trip_and_staleness(tmp_path):
+    data = tmp_path / "data"
+    data.mkdir()
+    _write(data, "a.txt", TOY, 1_000_000)
+    _write(data, "b.txt", TOY + SECOND, 1_000_000)
+    store_path = str(tmp_path / "store")
+
+    store = load_directory(str(data), store_path)
+    assert store.names == ["a.txt", "b.txt#0", "b.txt#1"]
+    assert store.instance(2) == (2, [4, 6], [3, 3], [8, 9], 2)
+    n, d, c, f, h = store[0]
+    assert (n, d.tolist(), h) == (3, [5, 0, 7], 1)
+
+    # unchanged sources: the saved store is reopened, memory-mapped
+    reopened = load_directory(str(data), store_path)
+    assert isinstance(reopened.demandes, np.memmap)
+    assert reopened.instance(1) == store.instance(1)
+
+    # a modified source makes the store stale: parsed again
+    _write(data, "a.txt", SECOND, 2_000_000)
+    rebuilt = load_directory(str(data), store_path)
+    assert rebuilt.instance(0) == (2, [4, 6], [3, 3], [8, 9], 2)
+    assert not isinstance(rebuilt.demandes, np.memmap)
+
+    # and so does a removed one
+    os.remove(data / "b.txt")
+    assert load_directory(str(data), store_path).names == ["a.txt"]
+    assert len(InstanceStore.open(store_path)) == 1
@@ -0,0 +1,48 @@
+import contextlib
+
+import numpy as np
+import pytest
+
+from lsInequalities import add_ls_cuts, separate_ls
+from modelisations import build_model_1
+from wagnerWhitin import wagner_whitin
+
+OPTIONS = {'output_flag': False, 'threads': 1}
+
+
+def _instance(seed, n=15):
+    rng = np.random.default_rng(seed)
+    d = rng.integers(0, 60, n).tolist()
+    c = rng.integers(1, 10, n).tolist()
+    f = rng.integers(20, 300, n).tolist()
+    return n, d, c, f, int(rng.integers(0, 4))
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_cuts_close_the_gap_to_the_wagner_whitin_optimum(seed):
+    n, d, c, f, h = _instance(seed)
+    model = build_model_1(n, d, c, f, h, vectorized=True, options=OPTIONS)
+    with contextlib.redirect_stdout(None):
+        stats = add_ls_cuts(model, n, d)
+    # the (l,S) inequalities describe the convex hull: the relaxation reaches the optimum
+    assert stats['bound_after'] >= stats['bound_before'] - 1e-6
+    assert stats['bound_after'] == pytest.approx(wagner_whitin(n, d, c, f, h)[0])
+    assert all(int(t) != 0 for t in model.getLp().integrality_)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_capped_rounds_keep_a_valid_bound(seed):
+    n, d, c, f, h = _instance(seed)
+    model = build_model_1(n, d, c, f, h, vectorized=True, options=OPTIONS)
+    with contextlib.redirect_stdout(None):
+        stats = add_ls_cuts(model, n, d, max_rounds=5, max_cuts=2)
+    assert stats['cuts'] <= 10
+    assert stats['bound_before'] - 1e-6 <= stats['bound_after'] <= wagner_whitin(n, d, c, f, h)[0] + 1e-6
+
+
+def test_separation_finds_no_cut_on_an_integral_plan():
+    # produce everything in period 0: x_0 = D_0n, y_0 = 1, stocks carried forward
+    d = np.array([5.0, 3.0, 0.0, 7.0])
+    x = np.array([d.sum(), 0, 0, 0])
+    s = d.sum() - np.cumsum(d)
+    assert separate_ls(4, d, [1, 0, 0, 0], x, s) == []
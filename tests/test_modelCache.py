@@ -0,0 +1,70 @@
+import contextlib
+
+import highspy as hp
+import numpy as np
+import pytest
+
+from bruteForce import brute_force
+from modelCache import ModelCache
+from modelisations import build_model_1, solve_model_1, solve_model_2, solve_model_3
+
+D = [10, 0, 30, 25, 5, 40, 0, 15]
+C = [3, 4, 2, 5, 3, 2, 4, 3]
+F = [50, 40, 60, 30, 45, 35, 50, 40]
+H = 1
+OPTIONS = {'output_flag': False, 'threads': 1}
+
+
+def _dense(lp):
+    """Constraint matrix of a HighsLp as a dense array, whatever its storage format."""
+    matrix = lp.a_matrix_
+    dense = np.zeros((lp.num_row_, lp.num_col_))
+    rowwise = matrix.format_ == hp.MatrixFormat.kRowwise
+    for k in range(len(matrix.start_) - 1):
+        for p in range(matrix.start_[k], matrix.start_[k + 1]):
+            i, j = (k, matrix.index_[p]) if rowwise else (matrix.index_[p], k)
+            dense[i, j] = matrix.value_[p]
+    return dense
+
+
+@pytest.mark.parametrize("fmt", ['mps', 'npz'])
+@pytest.mark.parametrize("solve_model", [solve_model_1, solve_model_2, solve_model_3])
+def test_loaded_model_gives_the_optimum(tmp_path, fmt, solve_model):
+    cache = ModelCache(str(tmp_path), fmt=fmt)
+    optimum = brute_force(len(D), D, C, F, H)[0]
+    for source in ('build', 'cache'):
+        with contextlib.redirect_stdout(None):
+            model, _ = solve_model(len(D), D, C, F, H, options=OPTIONS, model_cache=cache)
+        assert model.model_source == source
+        assert model.getObjectiveValue() == pytest.approx(optimum)
+
+
+@pytest.mark.parametrize("fmt", ['mps', 'npz'])
+@pytest.mark.parametrize("type_vars", [hp.HighsVarType.kInteger, hp.HighsVarType.kContinuous])
+def test_artifact_round_trip_keeps_the_lp(tmp_path, fmt, type_vars):
+    cache = ModelCache(str(tmp_path), fmt=fmt)
+    with contextlib.redirect_stdout(None):
+        built = cache.get_model(build_model_1, len(D), D, C, F, H, options=OPTIONS, type_vars=type_vars)
+        loaded = cache.get_model(build_model_1, len(D), D, C, F, H, options=OPTIONS, type_vars=type_vars)
+    assert loaded.model_source == 'cache'
+
+    expected, lp = built.getLp(), loaded.getLp()
+    for name in ('col_cost_', 'col_lower_', 'col_upper_', 'row_lower_', 'row_upper_'):
+        assert np.array_equal(getattr(lp, name), getattr(expected, name)), name
+    assert np.array_equal(_dense(lp), _dense(expected))
+    integer = [t == hp.HighsVarType.kInteger for t in lp.integrality_]
+    assert any(integer) == (type_vars == hp.HighsVarType.kInteger)
+
+
+def test_key_depends_on_data_and_build_arguments(tmp_path):
+    cache = ModelCache(str(tmp_path))
+    key = cache.make_key(build_model_1, len(D), D, C, F, H, vectorized=True)
+    assert cache.make_key(build_model_1, len(D), D, C, F, H, vectorized=True) == key
+    assert cache.make_key(build_model_1, len(D), D, C, F, H, vectorized=False) != key
+    assert cache.make_key(build_model_1, len(D), D, C, F, H + 1, vectorized=True) != key
+    assert cache.make_key(build_model_1, len(D), [d + 1 for d in D], C, F, H, vectorized=True) != key
+
+
+def test_unknown_format_is_refused(tmp_path):
+    with pytest.raises(ValueError):
+        ModelCache(str(tmp_path), fmt='lp')
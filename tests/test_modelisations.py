@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+import highspy as hp
+
+from modelisations import solve_model_1, solve_model_2
+
+OPTIONS = {'output_flag': False, 'threads': 1}
+
+
+def _presolve(model):
+    # highspy returns (status, value)
+    return model.getOptionValue('presolve')[1]
+
+
+def _instance(seed, n=12):
+    rng = np.random.default_rng(seed)
+    # d_0 > 0: Model 2 is not restricted by y_0 = 1
+    d = rng.integers(1, 60, n).tolist()
+    c = rng.integers(1, 10, n).tolist()
+    f = rng.integers(0, 80, n).tolist()
+    return n, d, c, f, 1
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("warm_start", [False, True])
+@pytest.mark.parametrize("with_relaxation", [False, True])
+def test_lean_model_2_matches_full_model(seed, warm_start, with_relaxation):
+    instance = _instance(seed)
+    full, _ = solve_model_2(*instance, vectorized=True, options=OPTIONS)
+    lean, _ = solve_model_2(*instance, options=OPTIONS, lean=True,
+                            warm_start=warm_start, with_relaxation=with_relaxation)
+    assert lean.getObjectiveValue() == pytest.approx(full.getObjectiveValue())
+    assert _presolve(lean) == 'off'
+    if with_relaxation:
+        # the relaxation switch leaves the model integral
+        assert all(int(t) != 0 for t in lean.getLp().integrality_)
+
+
+def test_lean_model_2_keeps_the_presolve_option():
+    lean, _ = solve_model_2(*_instance(0), options=dict(OPTIONS, presolve='on'), lean=True)
+    assert _presolve(lean) == 'on'
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_ls_cuts_restore_integrality(seed):
+    model, _ = solve_model_1(*_instance(seed), vectorized=True, options=OPTIONS, ls_cuts=True)
+    full, _ = solve_model_2(*_instance(seed), vectorized=True, options=OPTIONS)
+    assert model.getObjectiveValue() == pytest.approx(full.getObjectiveValue())
+    assert all(int(t) != 0 for t in model.getLp().integrality_)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_ls_cuts_keep_the_plain_relaxation_as_rl(seed):
+    plain, _ = solve_model_1(*_instance(seed), vectorized=True, options=OPTIONS, 
+                             type_vars=hp.HighsVarType.kContinuous)
+    model, _ = solve_model_1(*_instance(seed), vectorized=True, options=OPTIONS, 
+                             ls_cuts=True, with_relaxation=True)
+    assert model.ls_stats['cuts'] > 0
+    assert model.rl_obj_val == pytest.approx(plain.getObjectiveValue())
+    assert model.rl_cut_obj_val > model.rl_obj_val + 1e-6
@@ -0,0 +1,83 @@
+import contextlib
+import itertools
+
+import numpy as np
+import pytest
+
+from bruteForce import brute_force, plan_cost
+from rollingHorizon import solve_subhorizons
+from planningHorizon import fix_setups, planning_horizons
+from modelisations import build_model_1, solve_model_1
+from wagnerWhitin import wagner_whitin
+
+OPTIONS = {'output_flag': False, 'threads': 1}
+
+
+def _instance(seed):
+    """Small instance with zero demands, and zero setup costs in some periods."""
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(2, 16))
+    d = rng.integers(0, 60, n)
+    d[rng.random(n) < 0.3] = 0
+    c = rng.integers(0, 12, n)
+    f = rng.integers(0, 200, n)
+    f[rng.random(n) < 0.3] = 0
+    return n, d.tolist(), c.tolist(), f.tolist(), int(rng.integers(0, 4))
+
+
+@pytest.mark.parametrize("formulation", ['1', '2', '3', 'dp'])
+def test_subhorizons_match_wagner_whitin(formulation):
+    for seed in range(40):
+        n, d, c, f, h = _instance(seed)
+        result = solve_subhorizons(n, d, c, f, h, formulation=formulation, options=OPTIONS)
+        assert result['cost'] == pytest.approx(wagner_whitin(n, d, c, f, h)[0]), seed
+
+
+def test_fixings_keep_the_optimum():
+    for seed in range(40):
+        n, d, c, f, h = _instance(seed)
+        horizons = planning_horizons(n, d, c, f, h)
+        assert not set(horizons['fix_one']) & set(horizons['fix_zero'])
+        model, _ = solve_model_1(n, d, c, f, h, vectorized=True, options=OPTIONS, horizon_fixing=True)
+        assert model.getObjectiveValue() == pytest.approx(wagner_whitin(n, d, c, f, h)[0]), seed
+
+
+def test_fixings_keep_the_brute_force_optimum():
+    for seed in range(40):
+        n, d, c, f, h = _instance(seed)
+        if n > 12:
+            continue
+        horizons = planning_horizons(n, d, c, f, h)
+        fixed = {**{i: 1 for i in horizons['fix_one']}, **{i: 0 for i in horizons['fix_zero']}}
+        restricted = min(plan_cost(n, d, c, f, h, setups)
+                         for setups in itertools.product((0, 1), repeat=n)
+                         if all(setups[i] == value for i, value in fixed.items()))
+        assert restricted == brute_force(n, d, c, f, h)[0], seed
+
+
+def test_subhorizons_are_independent():
+    for seed in range(40):
+        n, d, c, f, h = _instance(seed)
+        if n > 12:
+            continue
+        blocks = planning_horizons(n, d, c, f, h)['blocks']
+        assert blocks[0][0] == 0 and blocks[-1][1] == n
+        assert all(end == start for (_, end), (start, _) in zip(blocks, blocks[1:]))
+        total = sum(brute_force(end - start, d[start:end], c[start:end], f[start:end], h)[0]
+                    for start, end in blocks)
+        assert total == brute_force(n, d, c, f, h)[0], seed
+
+
+def test_fix_setups_sets_the_column_bounds():
+    for seed in range(10):
+        n, d, c, f, h = _instance(seed)
+        model = build_model_1(n, d, c, f, h, vectorized=True, options=OPTIONS)
+        with contextlib.redirect_stdout(None):
+            fix_setups(model, 0, n, d, c, f, h)
+        horizons = planning_horizons(n, d, c, f, h)
+        lp = model.getLp()
+        lower, upper = np.asarray(lp.col_lower_[:n]), np.asarray(lp.col_upper_[:n])
+        assert np.all(lower[horizons['fix_one']] == 1)
+        assert np.all(upper[horizons['fix_zero']] == 0)
+        free = np.setdiff1d(np.arange(n), horizons['fix_one'] + horizons['fix_zero'])
+        assert np.all(lower[free] == 0) and np.all(upper[free] == 1)
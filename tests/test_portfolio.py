@@ -0,0 +1,47 @@
+import contextlib
+import multiprocessing
+import os
+
+import numpy as np
+import pytest
+
+from helperFunctions import read_data
+from modelisations import solve_model_1
+from portfolio import _RaceHook, _publish, race
+from wagnerWhitin import plan_from_successors, wagner_whitin
+
+D = [10, 0, 30, 25, 5, 40, 0, 15]
+C = [3, 4, 2, 5, 3, 2, 4, 3]
+F = [50, 40, 60, 30, 45, 35, 50, 40]
+H = 1
+INSTANCES = os.path.join(os.path.dirname(__file__), '..', 'Instances_ULS')
+
+
+@pytest.mark.parametrize("engines", [('dp', '1'), ('1', '2', '3')])
+def test_time_saved_is_sequential_time_minus_race_time(engines):
+    result = race(len(D), D, C, F, H, engines=engines, time_limit=30)
+    optimum, _ = wagner_whitin(len(D), D, C, F, H)
+    assert result['result']['obj_val'] == pytest.approx(optimum)
+
+    sequential = sum(r['runtime'] for r in result['engines'].values())
+    assert result['time_saved'] == pytest.approx(max(0.0, sequential - result['wall_time']))
+    # no engine ran longer than the race
+    assert all(r['runtime'] <= result['wall_time'] for r in result['engines'].values())
+
+
+def test_shared_plan_is_given_to_the_other_engines():
+    n, d, c, f, h = read_data(os.path.join(INSTANCES, 'Instance60.1.txt'))
+    optimum, succ = wagner_whitin(n, d, c, f, h)
+    _, production, _ = plan_from_successors(n, d, succ)
+    shared = (multiprocessing.Value('d', np.inf), multiprocessing.Array('d', n, lock=False),
+              multiprocessing.Value('i', 0, lock=False), multiprocessing.Value('d', -np.inf),
+              multiprocessing.Event(), 1 - 1e-6)
+    _publish(shared, optimum, np.asarray(production) > 0)
+
+    # Model 1 does not find this plan by itself in a few seconds
+    hook = _RaceHook(shared, 1, d, share_bound=True)
+    with contextlib.redirect_stdout(None):
+        model, _ = solve_model_1(n, d, c, f, h, telemetry=hook,
+                                 options={'output_flag': False, 'time_limit': 3, 'threads': 1})
+    assert hook.injected == 1
+    assert model.getObjectiveValue() == pytest.approx(optimum)
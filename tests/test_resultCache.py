@@ -0,0 +1,49 @@
+import os
+
+import resultCache
+from modelisations import solve_model_2
+from resultCache import ResultCache
+
+
+def _instance(tmp_path):
+    path = tmp_path / "inst.txt"
+    path.write_text("3\n10 0 5\n1 1 1\n20 20 20\n1\n")
+    return str(path)
+
+
+def test_threads_are_not_part_of_the_key(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"))
+    datafile = _instance(tmp_path)
+    key = cache.make_key(datafile, solve_model_2, 'kInteger', {'time_limit': 10})
+    assert cache.make_key(datafile, solve_model_2, 'kInteger', {'time_limit': 10, 'threads': 4}) == key
+    assert cache.make_key(datafile, solve_model_2, 'kInteger', {'time_limit': 20, 'threads': 4}) != key
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResultCache(str(tmp_path), max_entries=10)
+    for k in range(10):
+        cache.put(f"k{k}", {'obj_val': k})
+        os.utime(cache._path(f"k{k}"), (k, k))
+    cache.get("k0")    # k0 becomes the most recently used
+    cache.put("k10", {'obj_val': 10})
+
+    kept = sorted(name[:-5] for name in os.listdir(tmp_path))
+    assert len(kept) == 9
+    assert "k0" in kept and "k10" in kept
+    assert "k1" not in kept and "k2" not in kept
+    assert cache.get("k1") is None and cache.get("k0") == {'obj_val': 0}
+
+
+def test_directory_is_listed_only_to_count_and_to_evict(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path), max_entries=100)
+    listings = []
+    listdir = os.listdir
+    monkeypatch.setattr(resultCache.os, 'listdir', lambda path: listings.append(path) or listdir(path))
+
+    for k in range(100):
+        cache.put(f"k{k}", {'obj_val': k})
+        cache.put(f"k{k}", {'obj_val': k})    # overwriting does not add an entry
+    assert len(listings) == 1
+    cache.put("k100", {'obj_val': 100})
+    assert len(listings) == 2
+    assert len(listdir(tmp_path)) == 90
@@ -0,0 +1,95 @@
+import csv
+import contextlib
+import functools
+
+import pytest
+
+import helperFunctions
+from helperFunctions import process_all_files_in_directory, regenerate_reports
+from modelisations import solve_dp, solve_model_2
+from resultsJournal import ResultsJournal
+from wagnerWhitin import wagner_whitin
+
+INSTANCES = {
+    'a.txt': (4, [10, 20, 0, 15], [1, 2, 1, 3], [50, 60, 40, 70], 1),
+    'b.txt': (5, [5, 0, 30, 25, 10], [3, 1, 2, 2, 4], [40, 45, 30, 50, 35], 2),
+    'c.txt': (3, [20, 10, 40], [2, 2, 1], [80, 20, 60], 1),
+}
+
+
+@pytest.fixture
+def instances(tmp_path):
+    directory = tmp_path / "instances"
+    directory.mkdir()
+    for name, (n, d, c, f, h) in INSTANCES.items():
+        lines = [str(n)] + [" ".join(map(str, values)) for values in (d, c, f)] + [str(h)]
+        (directory / name).write_text("\n".join(lines) + "\n")
+    return directory
+
+
+def _sweep(instances, tmp_path, **kwargs):
+    with contextlib.redirect_stdout(None):
+        process_all_files_in_directory(str(instances), solve_dp, str(tmp_path / "table.tex"), "caption",
+                                       "tab:test", journal=str(tmp_path / "journal.jsonl"),
+                                       csv_output_path=str(tmp_path / "table.csv"), **kwargs)
+    with open(tmp_path / "table.csv") as file:
+        return list(csv.DictReader(file))
+
+
+def test_rows_round_trip_by_formulation(tmp_path):
+    journal = ResultsJournal(str(tmp_path / "sub" / "journal.jsonl"))
+    journal.append({'filename': 'a.txt', 'obj_val': 1.0}, solve_dp)
+    journal.append({'filename': 'a.txt', 'obj_val': 2.0}, solve_model_2)
+    journal.append({'filename': 'a.txt', 'obj_val': 3.0}, solve_dp)    # the last row wins
+    journal.append({'filename': 'b.txt', 'obj_val': 4.0}, functools.partial(solve_model_2, lean=True))
+
+    assert journal.load(solve_dp) == {'a.txt': {'filename': 'a.txt', 'obj_val': 3.0,
+                                                'formulation': 'modelisations.solve_dp'}}
+    assert journal.load(solve_model_2)['a.txt']['obj_val'] == 2.0
+    assert 'b.txt' not in journal.load(solve_model_2)
+    assert journal.load(functools.partial(solve_model_2, lean=True))['b.txt']['obj_val'] == 4.0
+    assert len(journal.load()) == 2
+
+
+def test_line_cut_by_a_crash_is_ignored(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    ResultsJournal(str(path)).append({'filename': 'a.txt', 'obj_val': 1.0})
+    with open(path, "a") as file:
+        file.write('{"filename": "b.txt", "obj')
+
+    journal = ResultsJournal(str(path))
+    journal.append({'filename': 'c.txt', 'obj_val': 3.0})
+    assert sorted(journal.load()) == ['a.txt', 'c.txt']
+
+
+def test_resume_solves_only_the_missing_instances(instances, tmp_path, monkeypatch):
+    full = _sweep(instances, tmp_path)
+    assert [row['filename'] for row in full] == sorted(INSTANCES)
+    for row in full:
+        assert float(row['obj_val']) == wagner_whitin(*INSTANCES[row['filename']])[0]
+
+    # crash after the first instance, in the middle of the second row
+    path = tmp_path / "journal.jsonl"
+    lines = path.read_text().splitlines(keepends=True)
+    path.write_text(lines[0] + lines[1][:20])
+
+    solved = []
+    solve_instance = helperFunctions.solve_instance
+    monkeypatch.setattr(helperFunctions, 'solve_instance',
+                        lambda datafileName, *args: solved.append(datafileName) or solve_instance(datafileName, *args))
+    resumed = _sweep(instances, tmp_path, resume=True)
+
+    assert sorted(map(str, solved)) == [str(instances / name) for name in ('b.txt', 'c.txt')]
+    assert resumed[0] == full[0]    # journaled row, runtime included
+    assert [row['obj_val'] for row in resumed] == [row['obj_val'] for row in full]
+    assert sorted(ResultsJournal(str(path)).load(solve_dp)) == sorted(INSTANCES)
+
+
+def test_reports_are_regenerated_from_the_journal(instances, tmp_path):
+    full = _sweep(instances, tmp_path)
+    with contextlib.redirect_stdout(None):
+        regenerate_reports(str(tmp_path / "journal.jsonl"), str(tmp_path / "again.tex"), "caption",
+                           "tab:test", solve_model=solve_dp, csv_output_path=str(tmp_path / "again.csv"))
+    with open(tmp_path / "again.csv") as file:
+        assert list(csv.DictReader(file)) == full
+    assert (tmp_path / "again.tex").read_text() == (tmp_path / "table.tex").read_text()
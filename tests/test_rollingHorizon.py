@@ -0,0 +1,23 @@
+import pytest
+
+from rollingHorizon import solve_rolling_horizon, solve_window
+from wagnerWhitin import wagner_whitin
+
+OPTIONS = {'output_flag': False, 'threads': 1}
+
+# zero setup cost in the last period: a solver may open it without producing there
+D = [0, 5, 1, 80, 20, 0, 5, 5, 80, 1]
+C = [5, 3, 10, 8, 4, 9, 5, 3, 1, 8]
+F = [7, 36, 60, 59, 42, 47, 4, 19, 57, 0]
+H = 0
+
+
+@pytest.mark.parametrize("formulation", ['1', '2', '3', 'dp'])
+def test_window_lots_follow_production_with_zero_setup_cost(formulation):
+    optimum, _ = wagner_whitin(len(D), D, C, F, H)
+    result = solve_rolling_horizon(len(D), D, C, F, H, formulation=formulation, options=OPTIONS)
+    assert result['cost'] == pytest.approx(optimum)
+
+    lots = solve_window(formulation, 0, len(D), D, C, F, H, OPTIONS)
+    assert lots[0][0] == 0 and lots[-1][1] == len(D)
+    assert all(j == i_next for (_, j), (i_next, _) in zip(lots, lots[1:]))
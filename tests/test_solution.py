@@ -0,0 +1,52 @@
+import csv
+import json
+
+import numpy as np
+import pytest
+
+from heuristics import plan_to_col_values
+from solution import Solution
+
+D = [10, 0, 30, 25, 5, 40]
+LOTS = [(0, 2), (2, 4), (4, 6)]
+N = len(D)
+
+
+def _read_back(solution, tmp_path):
+    solution.to_csv(tmp_path / "plan.csv")
+    solution.to_json(tmp_path / "plan.json")
+    with open(tmp_path / "plan.csv", newline="") as file:
+        rows = list(csv.DictReader(file))
+    with open(tmp_path / "plan.json") as file:
+        record = json.load(file)
+    return rows, record
+
+
+@pytest.mark.parametrize("formulation, lean", [(1, False), (2, False), (2, True), (3, False)])
+def test_export_round_trip(tmp_path, formulation, lean):
+    solution = Solution.from_columns(formulation, N, plan_to_col_values(formulation, N, D, LOTS, lean),
+                                     D, objective=123.0)
+    rows, record = _read_back(solution, tmp_path)
+
+    assert [float(r['production']) for r in rows] == pytest.approx([10, 0, 55, 0, 45, 0])
+    assert [int(r['covered_until']) for r in rows] == [2, 0, 4, 0, 6, 0]
+    assert record['production'] == pytest.approx(solution.production.tolist())
+    assert record['inventory'] == pytest.approx(solution.inventory.tolist())
+    assert record['objective'] == 123.0
+    # every demand is served by a production in the same or an earlier period
+    assert all(i <= j for i, j in record['assignments'])
+    if formulation != 1:
+        assert sorted(j for _, j in record['assignments']) == list(range(1, N + 1))
+
+
+def test_full_model_2_ignores_the_free_columns_below_the_diagonal(tmp_path):
+    col_value = plan_to_col_values(2, N, D, LOTS)
+    x = col_value[:N * N].reshape(N, N)
+    # x_ij with i > j do not appear in any row: the solver may leave them at 1
+    x[np.tril_indices(N, k=-1)] = 1.0
+    solution = Solution.from_columns(2, N, col_value, D)
+    clean = Solution.from_columns(2, N, plan_to_col_values(2, N, D, LOTS), D)
+
+    assert np.all(solution.assign_i <= solution.assign_j)
+    assert solution.production == pytest.approx(clean.production)
+    assert _read_back(solution, tmp_path)[1]['assignments'] == _read_back(clean, tmp_path)[1]['assignments']
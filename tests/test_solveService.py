@@ -0,0 +1,77 @@
+import json
+import asyncio
+import threading
+
+import pytest
+
+from solveService import SolveService, _solve_request
+
+INSTANCE = {'nbPeriodes': 3, 'demandes': [10, 0, 5], 'couts': [1, 1, 1],
+            'cfixes': [20, 20, 20], 'cstock': 1}
+
+
+async def _request(service, body):
+    """Sends one POST /solve to a server running service.handle; returns (status, json)."""
+    server = await asyncio.start_server(service.handle, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(f"POST /solve HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), 10)
+        writer.close()
+    head, _, data = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(data)
+
+
+@pytest.fixture
+def service():
+    service = SolveService(workers=1)
+    yield service
+    service.close()
+
+
+@pytest.mark.parametrize("body", [
+    b'[1, 2, 3]',
+    json.dumps({'engine': 'dp', 'time_limit': 'abc', 'instance': INSTANCE}).encode(),
+    json.dumps({'engine': 'dp', 'instance': [1, 2]}).encode(),
+])
+def test_malformed_body_is_rejected(service, body):
+    status, response = asyncio.run(_request(service, body))
+    assert status == 400
+    assert 'error' in response
+    assert service.queued == 0 and service.running == 0
+
+
+def test_unexpected_error_answers_500(service, monkeypatch):
+    async def broken_route(method, path, body):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(service, 'route', broken_route)
+    status, response = asyncio.run(_request(service, b'{}'))
+    assert status == 500
+    assert 'boom' in response['error']
+
+
+def test_valid_request_is_solved(service):
+    body = json.dumps({'engine': 'dp', 'time_limit': 5, 'instance': INSTANCE}).encode()
+    status, response = asyncio.run(_request(service, body))
+    assert status == 200
+    assert response['status'] == 'Optimal'
+    assert response['obj_val'] == pytest.approx(20 + 10 + 5 + 2 * 5)
+
+
+def test_duplicate_id_is_rejected(service):
+    service.cancel_events['job'] = threading.Event()    # a request 'job' is running
+    body = {'id': 'job', 'engine': 'dp', 'instance': INSTANCE}
+    status, response = asyncio.run(service.solve(body))
+    assert status == 409
+    assert 'job' in response['error']
+    assert service.queued == 0
+
+
+def test_missing_incumbent_is_null():
+    instance = tuple(INSTANCE.values())
+    result = _solve_request('1', instance, 1e-6, threading.Event())
+    assert result['status'] == 'Time limit reached'
+    assert result['obj_val'] is None and result['dual_bound'] is None
+    json.dumps(result, allow_nan=False)
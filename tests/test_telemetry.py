@@ -0,0 +1,51 @@
+import os
+import json
+
+import numpy as np
+import pytest
+
+from helperFunctions import process_all_files_in_directory
+from modelisations import solve_model_1
+from telemetry import SolverTelemetry
+
+def _events(path):
+    with open(path) as file:
+        return [json.loads(line) for line in file]
+
+
+@pytest.mark.parametrize("sample_interval", [0.0, None])
+def test_process_all_passes_the_sample_interval_to_the_traces(tmp_path, sample_interval):
+    rng = np.random.default_rng(0)
+    n = 40
+    instances = tmp_path / "instances"
+    instances.mkdir()
+    (instances / "inst.txt").write_text("\n".join([
+        str(n),
+        " ".join(map(str, rng.integers(1, 50, n))),
+        " ".join(map(str, rng.integers(1, 10, n))),
+        " ".join(map(str, rng.integers(50, 500, n))),
+        "1"]) + "\n")
+    trace_dir = tmp_path / "traces"
+
+    process_all_files_in_directory(str(instances), solve_model_1, str(tmp_path / "table.tex"), 
+                                   "caption", "tab:test", trace_dir=str(trace_dir), 
+                                   sample_interval=sample_interval)
+
+    events = _events(os.path.join(trace_dir, "inst.kInteger.jsonl"))
+    samples = [e for e in events if e['event'] == 'sample']
+    # a zero interval samples every interrupt callback, None none at all
+    assert bool(samples) == (sample_interval is not None)
+    summary = events[-1]
+    assert summary['event'] == 'summary' and summary['process_peak_memory_mb'] > 0
+
+
+def test_a_new_solve_replaces_the_trace(tmp_path):
+    path = str(tmp_path / "inst.jsonl")
+    for runtime in (1.0, 2.0):
+        telemetry = SolverTelemetry(path, instance="inst.txt")
+        telemetry.phase('solve', runtime)
+        telemetry.close(runtime=runtime)
+
+    events = _events(path)
+    assert [e['event'] for e in events] == ['phase', 'summary']
+    assert events[-1]['runtime'] == 2.0
@@ -0,0 +1,69 @@
+import math
+import time
+from functools import partial
+
+import pytest
+
+from modelisations import solve_model_2
+from timeBudget import solve_with_budget
+from helperFunctions import process_all_files_in_directory
+
+# small instances: (nbPeriodes, demandes, couts, cfixes, cstock)
+INSTANCES = [(f"inst{k}.txt", (4, [10, 20, 0, 15], [1, 2, 1, 3], [50 + k, 60, 40, 70], 1))
+             for k in range(6)]
+
+
+def _slow_solve(limits, *data, options=None, with_relaxation=False):
+    """solve_model_2 that records its time limit and overruns it, as a slow build would."""
+    limits.append(options['time_limit'])
+    time.sleep(2 * options['time_limit'])
+    return solve_model_2(*data, vectorized=True, with_relaxation=with_relaxation,
+                         options=dict(options, output_flag=False))
+
+
+def test_small_budget_never_solves_with_zero_limit():
+    limits = []
+    time_budget = 0.6
+    results, allocations = solve_with_budget(INSTANCES, partial(_slow_solve, limits), time_budget,
+                                             min_slice=1.0)
+
+    assert limits and all(limit > 0 for limit in limits)
+    # the first pass never takes more than an even share of the budget
+    assert limits[0] <= time_budget / len(INSTANCES) + 1e-9
+
+    skipped = {a['filename'] for a in allocations if a['status'] == 'Skipped'}
+    assert skipped
+    assert {r['filename'] for r in results} == {name for name, _ in INSTANCES} - skipped
+    assert all(math.isfinite(r['obj_val']) and math.isfinite(r['gap']) for r in results)
+
+
+def test_relaxation_and_mip_share_the_time_limit(monkeypatch):
+    import modelisations
+
+    def slow_relaxed(model, callback):
+        time.sleep(0.3)
+        return run_relaxed(model, callback)
+
+    mip_limits = []
+
+    def recording_solve(model, *args):
+        mip_limits.append(model.getOptionValue('time_limit')[1])
+        return solve_and_report(model, *args)
+
+    run_relaxed, solve_and_report = modelisations.run_relaxed, modelisations.solve_and_report
+    monkeypatch.setattr(modelisations, 'run_relaxed', slow_relaxed)
+    monkeypatch.setattr(modelisations, 'solve_and_report', recording_solve)
+    model, _ = solve_model_2(*INSTANCES[0][1], vectorized=True, with_relaxation=True,
+                             options={'output_flag': False, 'time_limit': 1.0})
+
+    assert mip_limits[0] <= 1.0 - 0.3
+    # the option is the caller's again once the MIP is solved
+    assert model.getOptionValue('time_limit')[1] == 1.0
+
+
+@pytest.mark.parametrize("kwargs", [{'n_workers': 2}, {'cache': object()}, {'trace_dir': 'traces'},
+                                    {'fast_rl': True}])
+def test_time_budget_refuses_the_options_it_ignores(tmp_path, kwargs):
+    with pytest.raises(ValueError):
+        process_all_files_in_directory(str(tmp_path), solve_model_2, str(tmp_path / "table.tex"),
+                                       "caption", "tab:test", time_budget=10, **kwargs)
@@ -0,0 +1,67 @@
+import contextlib
+
+import numpy as np
+import pytest
+
+from bruteForce import brute_force, plan_cost
+from modelisations import solve_dp, solve_dp_batch
+from wagnerWhitin import plan_from_successors, wagner_whitin, wagner_whitin_batch
+
+
+def _instance(seed):
+    """Small instance with zero demands, and zero setup costs in some periods."""
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 10))
+    d = rng.integers(0, 60, n)
+    d[rng.random(n) < 0.3] = 0
+    c = rng.integers(0, 12, n)
+    f = rng.integers(0, 200, n)
+    f[rng.random(n) < 0.3] = 0
+    return n, d.tolist(), c.tolist(), f.tolist(), int(rng.integers(0, 4))
+
+
+@pytest.mark.parametrize("seed", range(60))
+def test_wagner_whitin_matches_brute_force(seed):
+    n, d, c, f, h = _instance(seed)
+    optimum, succ = wagner_whitin(n, d, c, f, h)
+    assert optimum == brute_force(n, d, c, f, h)[0]
+    setups, _, _ = plan_from_successors(n, d, succ)
+    assert plan_cost(n, d, c, f, h, setups) == optimum
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_solve_dp_returns_a_feasible_optimal_plan(seed):
+    n, d, c, f, h = _instance(seed)
+    with contextlib.redirect_stdout(None):
+        model, _ = solve_dp(n, d, c, f, h, output_flag=False)
+    col = np.asarray(model.getSolution().col_value)
+    y, x, s = col[:n], col[n:2 * n], col[2 * n:]
+
+    assert np.all(x <= y * sum(d)) and np.all(s >= 0)
+    assert np.allclose(np.cumsum(x) - np.cumsum(d), s)
+    cost = np.dot(f, y) + np.dot(c, x) + h * s.sum()
+    assert cost == model.getObjectiveValue() == brute_force(n, d, c, f, h)[0]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_batch_matches_brute_force_for_every_scenario(seed):
+    n, _, c, f, h = _instance(seed)
+    rng = np.random.default_rng(100 + seed)
+    demandes = rng.integers(0, 60, (8, n))
+    demandes[rng.random((8, n)) < 0.3] = 0
+    costs, setups = wagner_whitin_batch(demandes, c, f, h)
+    for r, d in enumerate(demandes.tolist()):
+        assert costs[r] == brute_force(n, d, c, f, h)[0]
+        assert plan_cost(n, d, c, f, h, setups[r].tolist()) == costs[r]
+
+
+def test_batch_of_one_scenario_and_float_data():
+    n, d, c, f, h = _instance(3)
+    costs, setups = wagner_whitin_batch(d, c, f, h)    # a single scenario as a vector
+    assert costs.shape == (1,) and setups.shape == (1, n)
+    assert costs[0] == wagner_whitin(n, d, c, f, h)[0]
+
+    scaled = np.array([d, d]) * 0.5
+    with contextlib.redirect_stdout(None):
+        costs, _ = solve_dp_batch(scaled, c, f, h, output_flag=False)
+    assert costs == pytest.approx([wagner_whitin(n, scaled[0].tolist(), c, f, h)[0]] * 2)
@@ -0,0 +1,132 @@
+import os
+import math
+import time
+
+from modelisations import solve_and_report
+
+# ======= GLOBAL TIME BUDGET =======
+# Splits one wall-clock budget over a set of instances instead of a fixed time_limit
+# per instance:
+#   1. first pass: every instance is solved (RL then PLNE on the same model) with a
+#      short time limit;
+#   2. the remaining time goes to the open instances, largest gaps first and in
+#      proportion to their gaps; each kept model is solved again with its incumbent
+#      as MIP start.
+# The gap of an instance is measured against the best dual bound of all its runs.
+# The first pass never takes more than an even share of the budget; an instance left
+# without time is reported as skipped, not solved.
+
+def _gap(obj_val, bound):
+    if not math.isfinite(obj_val):
+        # no incumbent yet
+        return 1.0
+    return (obj_val - bound) / abs(obj_val) if obj_val else 0.0
+
+
+def _resume(state, limit):
+    """Solves the kept model of an instance again for limit seconds, from its incumbent."""
+    model = state['model']
+    incumbent = list(model.getSolution().col_value)
+    model.setOptionValue('time_limit', limit)
+    start_time = time.time()
+    model_status = solve_and_report(model, 0.0, incumbent if len(incumbent) else None)
+    info = model.getInfo()
+    state['runtime'] += time.time() - start_time
+    state['passes'] += 1
+    state['node_count'] += info.mip_node_count
+    state['status'] = model.modelStatusToString(model_status)
+    state['obj_val'] = model.getObjectiveValue()
+    state['bound'] = max(state['bound'], info.mip_dual_bound)
+    if state['obj_val'] - state['bound'] < 1e-6 * max(1.0, abs(state['obj_val'])):
+        state['status'] = 'Optimal'
+
+
+def solve_with_budget(instances, solve_model, time_budget, first_pass=None, min_slice=1.0,
+                      options=None):
+    """
+    instances: list of (datafileName, (nbPeriodes, demandes, couts, cfixes, cstock)).
+    first_pass: time limit of the first pass (default: a quarter of the budget, shared),
+    at most an even share of the budget.
+    Returns the rows of the report (as _merge_passes) of the instances solved and the
+    per-instance allocations, where instances left without time have the status 'Skipped'.
+    """
+    deadline = time.time() + time_budget
+    share = time_budget / max(len(instances), 1)
+    if first_pass is None:
+        first_pass = max(min_slice, 0.25 * share)
+    first_pass = min(first_pass, share)
+
+    states = []
+    skipped = []
+    for datafileName, data in instances:
+        limit = min(first_pass, deadline - time.time())
+        if limit <= 0:
+            # budget exhausted: never call the solver with no time
+            print(f"\nINSTANCE IGNORÉE {datafileName} (budget épuisé)")
+            skipped.append(os.path.basename(datafileName))
+            continue
+        print(f"\nPROCESSING FILE {datafileName} (premier passage, {limit:.1f} s)")
+        start_time = time.time()
+        model, model_status = solve_model(*data, options=dict(options or {}, time_limit=limit),
+                                          with_relaxation=True)
+        info = model.getInfo()
+        states.append({
+            'filename': os.path.basename(datafileName),
+            'model': model,
+            'status': model.modelStatusToString(model_status),
+            'obj_val': model.getObjectiveValue(),
+            'rl_obj_val': model.rl_obj_val,
+            'bound': info.mip_dual_bound,
+            'node_count': info.mip_node_count,
+            'runtime': time.time() - start_time,
+            'passes': 1
+        })
+
+    # --- REMAINING BUDGET: largest open gaps first ---
+    # every resume restarts branch-and-bound, so each round gives one slice per open
+    # instance, in proportion to its gap; time left over by early finishes goes to the next round
+    while True:
+        open_states = [s for s in states if s['status'] != 'Optimal' and hasattr(s['model'], 'setOptionValue')]
+        if deadline - time.time() < min_slice or not open_states:
+            break
+        open_states.sort(key=lambda s: _gap(s['obj_val'], s['bound']), reverse=True)
+        total_gap = sum(_gap(s['obj_val'], s['bound']) for s in open_states) or 1.0
+        for state in open_states:
+            remaining = deadline - time.time()
+            if remaining < min_slice:
+                break
+            gap = _gap(state['obj_val'], state['bound'])
+            limit = min(remaining, max(min_slice, remaining * gap / total_gap))
+            total_gap -= gap
+            print(f"\nREPRISE {state['filename']} (gap {100 * gap:.2f} %, {limit:.1f} s)")
+            _resume(state, limit)
+
+    results, allocations = [], []
+    for s in states:
+        results.append({
+            'filename': s['filename'],
+            'status': s['status'],
+            'obj_val': s['obj_val'],
+            'rl_obj_val': s['rl_obj_val'],
+            'gap': ((s['obj_val'] - s['rl_obj_val']) / s['obj_val']) * 100,
+            'node_count': s['node_count'],
+            'runtime': s['runtime']
+        })
+        allocations.append({
+            'filename': s['filename'],
+            'time': s['runtime'],
+            'passes': s['passes'],
+            'status': s['status'],
+            'mip_gap': 100 * _gap(s['obj_val'], s['bound'])
+        })
+    for filename in skipped:
+        allocations.append({'filename': filename, 'time': 0.0, 'passes': 0,
+                            'status': 'Skipped', 'mip_gap': float('nan')})
+
+    print("\n----------------------------------")
+    print(f"Budget global : {time_budget:.1f} s, utilisé : {time_budget - max(deadline - time.time(), 0):.1f} s")
+    print(f"| {'Instance':<20} | {'Temps (s)':<10} | {'Passages':<8} | {'Gap MIP %':<10} | {'Status':<20} |")
+    print("\n".join(f"| {a['filename']:<20} | {a['time']:<10.2f} | {a['passes']:<8} | {a['mip_gap']:<10.4f} | {a['status']:<20} |"
+                    for a in allocations))
+    print("----------------------------------")
+    return results, allocations
@@ -0,0 +1,148 @@
+import numpy as np
+
+# ======= WAGNER-WHITIN (Wagelmans, van Hoesel & Kolen) =======
+# Backward recursion over regeneration points, with periods indexed 0..n-1:
+#   G[n] = 0
+#   G[i] = f_i - p_i * D[i] + min_{j > i} ( G[j] + p_i * D[j] )
+# where D[k] = d_0 + ... + d_{k-1} and p_i = c_i - h * i. Producing in i to
+# cover i..j-1 costs f_i + sum_t (c_i + h (t - i)) d_t, i.e. the expression above
+# plus the constant h * sum_t t d_t. The points (D[j], G[j]) arrive with
+# decreasing abscissa, so their lower convex hull is kept on a stack and each
+# minimisation becomes a binary search: O(n log n) overall.
+
+def wagner_whitin(nbPeriodes, demandes, couts, cfixes, cstock):
+    """
+    Solves the ULS instance exactly.
+    Returns the optimal cost and succ, where succ[i] = j means a setup in i covering
+    the demands of i..j-1 and succ[i] = None means no setup in i (zero demand).
+    """
+    n = nbPeriodes
+    D = [0] * (n + 1)
+    for t in range(n):
+        D[t + 1] = D[t] + demandes[t]
+
+    G = [0] * (n + 1)
+    succ = [None] * (n + 1)
+
+    # lower hull of the points (D[j], G[j]), abscissa decreasing along the list
+    hull_x = [D[n]]
+    hull_y = [0]
+    hull_j = [n]
+
+    for i in range(n - 1, -1, -1):
+        if demandes[i] == 0:
+            # nothing to produce for i: it can be its own regeneration point
+            best_val, best_j = G[i + 1], None
+        else:
+            best_val, best_j = None, None
+
+        p = couts[i] - cstock * i
+        # y + p * x is unimodal along the hull: find the first k where it stops decreasing
+        lo, hi = 0, len(hull_x) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if hull_y[mid + 1] + p * hull_x[mid + 1] >= hull_y[mid] + p * hull_x[mid]:
+                hi = mid
+            else:
+                lo = mid + 1
+        val = cfixes[i] - p * D[i] + hull_y[lo] + p * hull_x[lo]
+        if best_val is None or val < best_val:
+            best_val, best_j = val, hull_j[lo]
+
+        G[i] = best_val
+        succ[i] = best_j
+
+        # push (D[i], G[i]) on the left end of the hull
+        x_new, y_new = D[i], G[i]
+        if x_new == hull_x[-1]:
+            if y_new >= hull_y[-1]:
+                continue
+            hull_x.pop(); hull_y.pop(); hull_j.pop()
+        while len(hull_x) >= 2:
+            x_a, y_a = hull_x[-2], hull_y[-2]
+            x_b, y_b = hull_x[-1], hull_y[-1]
+            if (y_b - y_new) * (x_a - x_b) >= (y_a - y_b) * (x_b - x_new):
+                hull_x.pop(); hull_y.pop(); hull_j.pop()
+            else:
+                break
+        hull_x.append(x_new)
+        hull_y.append(y_new)
+        hull_j.append(i)
+
+    constant = cstock * sum(t * demandes[t] for t in range(n))
+    return G[0] + constant, succ
+
+
+def plan_from_successors(nbPeriodes, demandes, succ):
+    """Rebuilds the setup, production and stock vectors from the successor list."""
+    y_values = [0] * nbPeriodes
+    x_values = [0] * nbPeriodes
+    s_values = [0] * nbPeriodes
+
+    i = 0
+    while i < nbPeriodes:
+        j = succ[i]
+        if j is None:
+            i += 1
+            continue
+        y_values[i] = 1
+        x_values[i] = sum(demandes[i:j])
+        i = j
+
+    stock = 0
+    for t in range(nbPeriodes):
+        stock += x_values[t] - demandes[t]
+        s_values[t] = stock
+
+    return y_values, x_values, s_values
+
+
+# ======= BATCH OF DEMAND SCENARIOS =======
+# Forward recursion F[j] = min_{i < j} F[i] + f_i [D_j > D_i] + (c_i - h i)(D_j - D_i) + h (W_j - W_i),
+# with W[k] = sum_{t < k} t d_t, run on all the scenarios at once: the loop is over the
+# periods only, each step scores every (scenario, lot start) pair in one array
+# operation. O(S n^2) work, exact in integer arithmetic for integer data.
+
+def wagner_whitin_batch(demandes, couts, cfixes, cstock):
+    """
+    Solves S instances sharing couts, cfixes and cstock; demandes is an (S, n) array.
+    Returns the optimal costs (S,) and the setups (S, n) booleans of an optimal plan
+    (production in a setup period covers the demands up to the next setup).
+    """
+    d = np.atleast_2d(np.asarray(demandes))
+    dtype = np.result_type(d, np.asarray(couts), np.asarray(cfixes), cstock)
+    d = d.astype(dtype)
+    S, n = d.shape
+    t = np.arange(n)
+    zero = np.zeros((S, 1), dtype=dtype)
+    D = np.concatenate([zero, np.cumsum(d, axis=1)], axis=1)
+    W = np.concatenate([zero, np.cumsum(t * d, axis=1)], axis=1)
+    p = np.asarray(couts, dtype=dtype) - cstock * t
+    f = np.asarray(cfixes, dtype=dtype)
+
+    F = np.zeros((S, n + 1), dtype=dtype)
+    H = np.zeros((S, n), dtype=dtype)     # H[:, i] = F_i - p_i D_i - h W_i
+    pred = np.zeros((S, n + 1), dtype=np.int64)
+    for j in range(1, n + 1):
+        i = j - 1
+        H[:, i] = F[:, i] - p[i] * D[:, i] - cstock * W[:, i]
+        D_j = D[:, j, None]
+        value = H[:, :j] + p[:j] * D_j + f[:j] * (D_j > D[:, :j])
+        best = np.argmin(value, axis=1)
+        pred[:, j] = best
+        F[:, j] = value[np.arange(S), best] + cstock * W[:, j]
+
+    # backtrack all the scenarios together, from period n to 0
+    rows = np.arange(S)
+    setups = np.zeros((S, n), dtype=bool)
+    j = np.full(S, n)
+    while True:
+        active = j > 0
+        if not active.any():
+            break
+        r = rows[active]
+        i = pred[r, j[active]]
+        setups[r, i] = D[r, j[active]] > D[r, i]
+        j[active] = i
+
+    return F[:, n], setups